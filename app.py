@@ -20,9 +20,15 @@ st.set_page_config(
 )
 
 # 컴포넌트 import
+# 차트 모듈(pandas, plotly)은 3단계에서 처음 필요할 때 import (시작 시간 단축)
 from components.stock_selector import render_simple_stock_selector
 from utils.json_client import InvestSmartJSONClient
-from components.chart import render_stock_chart
+from components.chart_settings import INDICATOR_GROUPS, DEFAULT_CHART_PERIOD, build_chart_settings
+from components.chart_prefetch import load_chart_module, prefetch_symbol_charts
+from utils.perf import rerun_summary
+
+# 스크리너 화면 (단계 번호 대신 사용)
+SCREENER_STEP = "screener"
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -111,6 +117,8 @@ def main():
         render_step2_indicator_selection()
     elif st.session_state.step == 3:
         render_step3_chart_display()
+    elif st.session_state.step == SCREENER_STEP:
+        render_screener_page()
 
 
 def render_step1_symbol_selection():
@@ -118,13 +126,22 @@ def render_step1_symbol_selection():
     st.title("📈 InvestSmart - 종목 분석")
     st.markdown("### 1단계: 궁금한 종목(혹은 지수)는?")
     
+    # 전체 종목의 최신 시그널을 한 번에 보는 스크리너
+    if st.button("🔎 오늘의 시그널 스크리너"):
+        st.session_state.step = SCREENER_STEP
+        st.rerun()
+    
     # 종목 선택
-    symbol = render_simple_stock_selector()
+    only_available = st.checkbox("데이터가 있는 종목만 보기", value=False)
+    symbol = render_simple_stock_selector(only_available)
     
     if symbol:
         st.session_state.selected_symbol = symbol
         st.success(f"✅ 선택된 종목: **{symbol}**")
         
+        # 2단계를 보는 동안 세 지표 그룹 차트를 백그라운드에서 미리 생성
+        prefetch_symbol_charts(symbol, DEFAULT_CHART_PERIOD)
+        
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
             if st.button("다음 단계", type="primary", use_container_width=True):
@@ -144,28 +161,9 @@ def render_step2_indicator_selection():
     
     st.info(f"선택된 종목: **{st.session_state.selected_symbol}**")
     
-    # 지표 그룹 선택
-    indicator_groups = {
-        "단기": {
-            "description": "단기 트레이딩용 지표",
-            "signals": ["short_signal_v2", "macd_signal"],
-            "color": "#00FFFF"
-        },
-        "중기": {
-            "description": "중기 투자용 지표", 
-            "signals": ["short_signal_v1", "momentum_color_signal"],
-            "color": "#32CD32"
-        },
-        "장기": {
-            "description": "장기 투자용 지표",
-            "signals": ["long_signal", "combined_signal_v1"],
-            "color": "#4169E1"
-        }
-    }
-    
     # 지표 그룹 선택 버튼들
     cols = st.columns(3)
-    for i, (group_name, group_info) in enumerate(indicator_groups.items()):
+    for i, (group_name, group_info) in enumerate(INDICATOR_GROUPS.items()):
         with cols[i]:
             st.markdown(f"### {group_name}")
             st.markdown(f"*{group_info['description']}*")
@@ -182,6 +180,26 @@ def render_step2_indicator_selection():
                 st.rerun()
 
 
+def render_screener_page():
+    """스크리너: 전체 종목의 최신 시그널 현황에서 종목을 골라 2단계로 이동"""
+    st.title("📈 InvestSmart - 시그널 스크리너")
+    st.markdown("### 최근 시그널이 나온 종목은?")
+    
+    if st.button("← 종목 선택으로"):
+        st.session_state.step = 1
+        st.rerun()
+    
+    # 표 표시(pandas)는 이 화면에서만 필요하므로 여기서 import
+    from components.screener import render_screener
+    
+    symbol = render_screener()
+    if symbol:
+        st.session_state.selected_symbol = symbol
+        st.session_state.step = 2
+        prefetch_symbol_charts(symbol, DEFAULT_CHART_PERIOD)
+        st.rerun()
+
+
 def render_step3_chart_display():
     """3단계: 차트만 표시"""
     # 이전 단계로 돌아가기 버튼만 표시
@@ -189,17 +207,16 @@ def render_step3_chart_display():
         st.session_state.step = 2
         st.rerun()
     
+    # 차트 스택은 이 화면에서만 사용하므로 여기서 import (미리 만들기 작업 스레드와 같은 잠금 사용)
+    render_stock_chart = load_chart_module().render_stock_chart
+    
     # 차트 표시 설정
-    settings = {
-        'selected_signals': st.session_state.selected_signals,
-        'show_buy_signals': True,
-        'show_sell_signals': True,
-        'show_trendlines': True,
-        'selected_indicators': []
-    }
+    settings = build_chart_settings(st.session_state.selected_signals)
     
     # 차트 렌더링 (3년 기본 기간) - 차트만 표시
-    render_stock_chart(st.session_state.selected_symbol, "3y", settings)
+    render_stock_chart(st.session_state.selected_symbol, DEFAULT_CHART_PERIOD, settings)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # INVESTSMART_PERF=1이면 실행마다 구간별 소요 시간 요약을 로그로 남김
+    with rerun_summary(step=st.session_state.get('step'), symbol=st.session_state.get('selected_symbol')):
+        main()
\ No newline at end of file
@@ -2,10 +2,12 @@
 Streamlit Chart Component - 원본 코드와 동일한 차트 구조
 """
 import streamlit as st
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import pandas as pd
-from typing import Dict, List, Any, Optional
+import numpy as np
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 import sys
 import os
@@ -15,21 +17,102 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from utils.json_client import InvestSmartJSONClient
+from utils.json_client import InvestSmartJSONClient, register_reload_listener
+from utils.signal_markers import compute_signal_markers, week_ids
+from utils.lru_cache import BoundedLRUCache
+from utils.signals_cache import get_cached_signals_view
+from utils.perf import PERF_ENABLED, span, timed
+from components.chart_settings import chart_settings_key, DEFAULT_RENDER_MODE, DEFAULT_MAX_BARS, DEFAULT_COMPACT_PAYLOAD
+from utils.ohlc_downsample import FREQUENCY_LABELS, bucket_ids, choose_frequency, downsample_ohlc
+from components.prebuilt_charts import load_prebuilt_figure
+from components.chart_prefetch import wait_for_prefetch
+from utils.symbol_catalog import load_symbol_catalog
 
 logger = logging.getLogger(__name__)
 
+# 압축 시 가격에 남길 유효 숫자 수 (예: 3218.42, 89.7312, 1.08345)
+PRICE_SIGNIFICANT_DIGITS = 6
+
+# 압축 가격 배열 자료형 - Plotly 6부터는 NumPy 배열을 base64 바이너리로 보내므로 float32가 절반 크기이지만,
+# 5.x는 숫자 목록(JSON)으로 보내 float32 값이 긴 소수(예: 89.731201171875)로 바뀌므로 반올림한 float64 유지
+_COMPACT_PRICE_DTYPE = np.float32 if int(plotly.__version__.split('.')[0]) >= 6 else np.float64
+
+# 완성된 차트 figure 캐시 (프로세스 전역, 오래 안 쓴 차트부터 제거)
+FIGURE_CACHE_SIZE = 32
+_figure_cache = BoundedLRUCache(max_items=FIGURE_CACHE_SIZE)
+
 
-@st.cache_data(ttl=300)  # 5분간 캐시
 def get_cached_signals_data(symbol: str, period: str):
-    """캐시된 신호 데이터 조회"""
-    json_client = InvestSmartJSONClient()
-    return json_client.get_signals_data(symbol, period)
+    """캐시된 신호 데이터 조회 (세션 간 공유, 데이터 버전별 캐시, 읽기 전용 배열 뷰)"""
+    return get_cached_signals_view(symbol, period)
+
+
+def _on_data_reload(old_store, new_store):
+    """데이터 교체 시 이전 버전에 의존하는 캐시만 비우기"""
+    _figure_cache.discard(lambda key: key[-1] == old_store.version)
+
+
+register_reload_listener(_on_data_reload)
+
 
 
+def _figure_cache_key(
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]],
+    data_version: str
+) -> tuple:
+    """figure 캐시 키 - 차트 모양에 영향을 주는 값만 포함"""
+    return (symbol, period, chart_settings_key(settings), data_version)
 
-def _get_dynamic_annotations(fcv_has_green: bool, fcv_has_red: bool) -> list:
-    """FCV 배경 색칠에 따른 동적 설명 생성"""
+
+def _lookup_figure(
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]],
+    data_version: str
+) -> Optional[go.Figure]:
+    """figure 캐시, 없으면 미리 만들어 둔 차트 파일에서 figure 조회 (없으면 None)"""
+    cache_key = _figure_cache_key(symbol, period, settings, data_version)
+    fig = _figure_cache.get(cache_key)
+    if fig is None:
+        # 데이터 갱신 시 미리 만들어 둔 차트 파일이 있으면 그대로 사용
+        fig = load_prebuilt_figure(symbol, period, settings, data_version)
+        if fig is not None:
+            _figure_cache.put(cache_key, fig)
+    return fig
+
+
+def prefetch_figure(
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]]
+) -> bool:
+    """
+    차트 figure를 미리 만들어 figure 캐시에 넣기 (Streamlit 호출 없음, 백그라운드 스레드용)
+    
+    Returns:
+        figure 준비 여부 (데이터가 없는 종목이면 False)
+    """
+    with span("chart.prefetch", symbol=symbol) as info:
+        data_version = InvestSmartJSONClient().data_version
+        info['cached'] = _lookup_figure(symbol, period, settings, data_version) is not None
+        if info['cached']:
+            return True
+        
+        signals_data = get_cached_signals_data(symbol, period)
+        if signals_data.get('error') or len(signals_data.get('dates', ())) == 0:
+            return False
+        
+        fig = _build_candlestick_figure(signals_data, settings)
+        if fig is None:
+            return False
+        _figure_cache.put(_figure_cache_key(symbol, period, settings, signals_data['data_version']), fig)
+        return True
+
+
+def _get_dynamic_annotations(fcv_has_green: bool, fcv_has_red: bool, frequency: Optional[str] = None) -> list:
+    """FCV 배경 색칠에 따른 동적 설명 생성 (봉을 묶었으면 봉 단위도 표시)"""
     annotations = [
         dict(
             x=0.98,
@@ -78,9 +161,101 @@ def _get_dynamic_annotations(fcv_has_green: bool, fcv_has_red: bool) -> list:
             )
         )
     
+    if frequency:
+        annotations.append(
+            dict(
+                x=0.02,
+                y=0.98,
+                xref='paper',
+                yref='paper',
+                text=f"{FREQUENCY_LABELS[frequency]} 표시",
+                showarrow=False,
+                font=dict(size=10, color='grey'),
+                bgcolor='rgba(255,255,255,0.8)'
+            )
+        )
+    
     return annotations
 
 
+def _mask_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """불리언 배열에서 True가 연속되는 구간의 (시작, 끝) 인덱스 (끝은 포함하지 않음)"""
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(padded))
+    return edges[0::2], edges[1::2]
+
+
+def _price_decimals(prices: np.ndarray) -> int:
+    """종목 가격대에 맞는 소수점 자릿수 (유효 숫자 PRICE_SIGNIFICANT_DIGITS개 기준, 0~6자리)"""
+    finite = np.abs(prices[np.isfinite(prices)])
+    if len(finite) == 0 or finite.max() == 0:
+        return 2
+    integer_digits = int(np.floor(np.log10(finite.max()))) + 1
+    return int(np.clip(PRICE_SIGNIFICANT_DIGITS - integer_digits, 0, 6))
+
+
+def _compact_prices(values, decimals: int) -> np.ndarray:
+    """
+    가격을 decimals 자리로 반올림해 전송용 배열로 변환
+    
+    자료형은 _COMPACT_PRICE_DTYPE - 설치된 Plotly가 6 이상이면 float32 (base64 바이너리 배열로 전송),
+    5.x면 반올림한 float64 (JSON 숫자 목록으로 전송되므로 float32로 바꾸면 긴 소수가 됨)입니다.
+    """
+    return np.round(np.asarray(values, dtype=np.float64), decimals).astype(_COMPACT_PRICE_DTYPE, copy=False)
+
+
+def _first_per_bar(indices: np.ndarray, values: np.ndarray, buckets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """묶은 봉 하나에 마커가 여러 개면 첫 번째만 남기기 (indices는 오름차순)"""
+    if len(indices) == 0:
+        return indices, values
+    bucket = buckets[indices]
+    keep = np.empty(len(indices), dtype=bool)
+    keep[0] = True
+    keep[1:] = bucket[1:] != bucket[:-1]
+    return indices[keep], values[keep]
+
+
+def _build_fcv_shapes(dates, fcv_values) -> Tuple[List[dict], bool, bool]:
+    """
+    FCV 배경 사각형 생성 - 연속된 초록/빨강 구간을 하나의 사각형으로 병합
+    
+    i번째 날과 i+1번째 날 사이 구간은 두 날 중 하나라도 FCV >= 0.5이면 초록,
+    그렇지 않고 하나라도 FCV <= -0.5이면 빨강으로 칠합니다.
+    
+    Returns:
+        (shape 목록, 초록 구간 존재 여부, 빨강 구간 존재 여부)
+    """
+    fcv = np.asarray(fcv_values, dtype=np.float64)
+    n = min(len(fcv), len(dates))
+    fcv = fcv[:n]
+    
+    fcv_has_green = bool(np.any(fcv >= 0.5))
+    fcv_has_red = bool(np.any(fcv <= -0.5))
+    if n < 2:
+        return [], fcv_has_green, fcv_has_red
+    
+    high = fcv >= 0.5
+    low = fcv <= -0.5
+    green = high[:-1] | high[1:]
+    red = ~green & (low[:-1] | low[1:])
+    
+    shapes = []
+    for mask, fillcolor in ((green, "rgba(0, 255, 0, 0.2)"), (red, "rgba(255, 0, 0, 0.2)")):
+        starts, ends = _mask_runs(mask)
+        for start, end in zip(starts, ends):
+            shapes.append(dict(
+                type="rect",
+                x0=dates[start], x1=dates[end],
+                y0=0, y1=1,
+                yref="paper",
+                fillcolor=fillcolor,
+                line=dict(width=0),
+                layer="below"
+            ))
+    return shapes, fcv_has_green, fcv_has_red
+
+
+@timed("chart.render_stock_chart")
 def render_stock_chart(
     symbol: str, 
     period: str = "1y",
@@ -88,403 +263,326 @@ def render_stock_chart(
 ):
     """
     주식 차트 렌더링 - 캐시된 데이터 사용으로 최적화
+    
+    같은 (종목, 기간, 시그널 설정, 데이터 버전)의 차트는 figure 캐시에서 바로 표시하고,
+    없으면 미리 만들어 둔 차트 파일(prebuilt_charts), 진행 중인 백그라운드 미리 만들기(chart_prefetch)
+    순서로 확인한 뒤, 그래도 없으면 새로 생성합니다.
     """
     try:
+        # 이미 만들어진 차트가 있으면 데이터 조회/차트 생성 생략
+        data_version = InvestSmartJSONClient().data_version
+        cache_key = _figure_cache_key(symbol, period, settings, data_version)
+        fig = _lookup_figure(symbol, period, settings, data_version)
+        if fig is None:
+            # 종목 선택 후 백그라운드에서 만들고 있는 차트가 있으면 완성을 기다려 사용
+            wait_for_prefetch(symbol, period, settings)
+            fig = _figure_cache.get(cache_key)
+        if fig is not None:
+            _show_figure(fig, symbol, 'cache')
+            return
+        
         # 캐시된 데이터 로딩 (JSON 파일에서 직접 읽기)
         with st.spinner(f"{symbol} 데이터를 불러오는 중... 📊 참고용 정보: 제공되는 시그널과 지표는 투자 교육 목적이며, 투자 권유가 아닙니다."):
             # 신호 데이터 조회 (JSON에서 직접 읽기)
             signals_data = get_cached_signals_data(symbol, period)
             
             # 데이터가 없는 경우 체크
-            if signals_data.get('error') or not signals_data.get('dates'):
+            if signals_data.get('error') or len(signals_data.get('dates', ())) == 0:
                 st.warning(f"⚠️ {symbol} 종목은 아직 지원하지 않는 종목입니다.")
-                st.info("현재 지원하는 종목: 코스피, 나스닥, TLT, USD/KRW 환율")
+                catalog = load_symbol_catalog()
+                supported = ", ".join(catalog.display_name(name) for name in catalog.available_symbols)
+                st.info(f"현재 지원하는 종목: {supported}")
                 return
         
         # 차트 생성 (시그널 체크박스 변경 시에는 데이터 재다운로드 없이 차트만 재생성)
-        _create_candlestick_chart(
+        fig = _create_candlestick_chart(
             signals_data, 
             settings
         )
+        if fig is not None:
+            _figure_cache.put(cache_key, fig)
         
     except Exception as e:
         logger.error(f"차트 렌더링 실패: {symbol}, {e}")
         st.error(f"차트를 불러올 수 없습니다: {e}")
 
 
+def _show_figure(fig: go.Figure, symbol: Optional[str], source: str) -> None:
+    """figure를 화면에 표시 (측정 중이면 직렬화 크기도 기록)"""
+    with span("chart.plotly_chart", symbol=symbol, source=source) as info:
+        if PERF_ENABLED:
+            info['payload_bytes'] = len(pio.to_json(fig, validate=False))
+        st.plotly_chart(fig, use_container_width=True)
+
+
 def _create_candlestick_chart(
     signals_data: Dict[str, Any],
     settings: Optional[Dict[str, Any]]
-):
-    """캔들스틱 차트 생성 - 인덱스 오류 방지 및 전체화면 최적화"""
+) -> Optional[go.Figure]:
+    """캔들스틱 차트 생성 및 표시 - 생성된 figure 반환 (실패 시 None)"""
     try:
-        # 데이터 추출
-        dates = pd.to_datetime(signals_data["dates"])
-        open_prices = signals_data["data"]["open"]
-        high_prices = signals_data["data"]["high"]
-        low_prices = signals_data["data"]["low"]
-        close_prices = signals_data["data"]["close"]
-        volume = signals_data["data"]["volume"]
-        
-        # 데이터 길이 검증 및 정렬 (인덱스 오류 방지)
-        min_length = min(len(dates), len(open_prices), len(high_prices), len(low_prices), len(close_prices))
-        if min_length == 0:
+        with span("chart.build", symbol=signals_data.get('symbol')) as info:
+            fig = _build_candlestick_figure(signals_data, settings)
+            info['traces'] = len(fig.data) if fig is not None else 0
+        if fig is None:
             st.error("데이터가 없습니다.")
-            return
-            
-        # 모든 데이터를 동일한 길이로 맞춤
-        dates = dates[:min_length]
-        open_prices = open_prices[:min_length]
-        high_prices = high_prices[:min_length]
-        low_prices = low_prices[:min_length]
-        close_prices = close_prices[:min_length]
+            return None
         
-        # 단일 차트 생성 (FCV 서브차트 제거)
-        fig = go.Figure()
+        # 차트 표시
+        _show_figure(fig, signals_data.get('symbol'), 'built')
+        return fig
         
-        # FCV 배경 표시 (0.5 이상, -0.5 이하 구간)
-        if signals_data.get("indicators") and 'Final_Composite_Value' in signals_data["indicators"]:
-            fcv_values = signals_data["indicators"]['Final_Composite_Value']
-            
-            # FCV 값에 따른 배경 색상 설정
-            for i in range(min_length - 1):
-                if i < len(fcv_values) - 1:
-                    current_fcv = fcv_values[i]
-                    next_fcv = fcv_values[i + 1]
-                    
-                    # 0.5 이상 구간 (초록 배경)
-                    if current_fcv >= 0.5 or next_fcv >= 0.5:
-                        fig.add_shape(
-                            type="rect",
-                            x0=dates[i], x1=dates[i + 1],
-                            y0=min(low_prices), y1=max(high_prices),
-                            fillcolor="rgba(0, 255, 0, 0.1)",
-                            line=dict(width=0),
-                            layer="below"
-                        )
-                    
-                    # -0.5 이하 구간 (빨강 배경)
-                    elif current_fcv <= -0.5 or next_fcv <= -0.5:
-                        fig.add_shape(
-                            type="rect",
-                            x0=dates[i], x1=dates[i + 1],
-                            y0=min(low_prices), y1=max(high_prices),
-                            fillcolor="rgba(255, 0, 0, 0.1)",
-                            line=dict(width=0),
-                            layer="below"
-                        )
+    except Exception as e:
+        logger.error(f"캔들스틱 차트 생성 실패: {e}")
+        st.error(f"차트 생성 중 오류가 발생했습니다: {e}")
+        return None
+
+
+def _build_candlestick_figure(
+    signals_data: Dict[str, Any],
+    settings: Optional[Dict[str, Any]]
+) -> Optional[go.Figure]:
+    """캔들스틱 차트 figure 생성 - 인덱스 오류 방지 및 전체화면 최적화 (Streamlit 호출 없음)"""
+    # 데이터 추출 (데이터 계층에서 받은 datetime64[D] 배열을 그대로 사용, 없으면 한 번에 변환)
+    dates = signals_data.get("date_values")
+    if dates is None:
+        dates = np.asarray(signals_data["dates"], dtype='datetime64[D]')
+    weeks = signals_data.get("week_ids")
+    if weeks is None:
+        weeks = week_ids(dates)
+    open_prices = signals_data["data"]["open"]
+    high_prices = signals_data["data"]["high"]
+    low_prices = signals_data["data"]["low"]
+    close_prices = signals_data["data"]["close"]
+    
+    # 데이터 길이 검증 및 정렬 (인덱스 오류 방지)
+    min_length = min(len(dates), len(open_prices), len(high_prices), len(low_prices), len(close_prices))
+    if min_length == 0:
+        return None
         
-        # 캔들스틱 차트 (메인 차트)
-        fig.add_trace(
-            go.Candlestick(
-                x=dates,
-                open=open_prices,
-                high=high_prices,
-                low=low_prices,
-                close=close_prices,
-                name="주가",
-                increasing_line_color='red',
-                decreasing_line_color='blue'
-            )
+    # 모든 데이터를 동일한 길이로 맞춤
+    dates = dates[:min_length]
+    weeks = weeks[:min_length]
+    open_prices = open_prices[:min_length]
+    high_prices = high_prices[:min_length]
+    low_prices = low_prices[:min_length]
+    close_prices = close_prices[:min_length]
+    
+    # 렌더링 방식 - 봉 수가 예산을 넘으면 주봉/월봉으로 묶고 마커는 WebGL로 표시
+    render_mode = (settings or {}).get('render_mode', DEFAULT_RENDER_MODE)
+    max_bars = int((settings or {}).get('max_bars', DEFAULT_MAX_BARS))
+    frequency = None if render_mode == 'standard' else choose_frequency(dates, weeks, max_bars)
+    scatter_trace = go.Scattergl if render_mode == 'webgl' or frequency else go.Scatter
+    
+    # 마커 위치/저가는 일봉 기준, 봉을 묶었으면 해당 봉의 날짜/저가 사용
+    bar_dates = marker_dates = dates
+    bar_open, bar_high, bar_low, bar_close = open_prices, high_prices, low_prices, close_prices
+    marker_low = low_prices
+    if frequency:
+        buckets = bucket_ids(dates, weeks, frequency)
+        bars = downsample_ohlc(dates, open_prices, high_prices, low_prices, close_prices, buckets)
+        bar_dates, bar_open, bar_high, bar_low, bar_close = (
+            bars['dates'], bars['open'], bars['high'], bars['low'], bars['close']
         )
-        
-        # 추세선 추가 (JSON 데이터에서 읽어오기)
-        if signals_data.get("trendlines"):
-            trendlines = signals_data["trendlines"]
-            for trendline in trendlines:
-                points = trendline.get("points", [])
-                if len(points) >= 2:
-                    trendline_dates = [pd.to_datetime(p["date"]) for p in points]
-                    trendline_prices = [p["price"] for p in points]
-                    
-                    fig.add_trace(
-                        go.Scatter(
-                            x=trendline_dates,
-                            y=trendline_prices,
-                            name=trendline["name"],
-                            line=dict(
-                                color=trendline["color"],
-                                width=2,
-                                dash="dash"
-                            ),
-                            mode="lines"
-                        )
+        marker_dates = bar_dates[bars['bar_index']]
+        marker_low = bar_low[bars['bar_index']]
+    
+    # 데이터 압축 - 날짜는 짧은 문자열, 가격은 종목 가격대에 맞게 반올림한 배열 (_compact_prices)
+    compact = bool((settings or {}).get('compact_payload', DEFAULT_COMPACT_PAYLOAD))
+    if compact:
+        decimals = _price_decimals(np.asarray(bar_close, dtype=np.float64))
+        bar_open, bar_high, bar_low, bar_close = (
+            _compact_prices(values, decimals) for values in (bar_open, bar_high, bar_low, bar_close)
+        )
+        if frequency:
+            marker_dates = np.datetime_as_string(marker_dates)
+            bar_dates = np.datetime_as_string(bar_dates)
+        else:
+            bar_dates = marker_dates = np.datetime_as_string(dates)
+    
+    # 단일 차트 생성 (FCV 서브차트 제거)
+    fig = go.Figure()
+    
+    # FCV 배경 표시 (0.5 이상: 초록, -0.5 이하: 빨강) - 연속 구간마다 사각형 하나
+    fcv_has_green = False
+    fcv_has_red = False
+    if signals_data.get("indicators") and 'Final_Composite_Value' in signals_data["indicators"]:
+        fcv_values = signals_data["indicators"]['Final_Composite_Value']
+        fcv_dates = np.datetime_as_string(dates) if compact else dates
+        fcv_shapes, fcv_has_green, fcv_has_red = _build_fcv_shapes(fcv_dates, fcv_values[:min_length])
+        fig.update_layout(shapes=fcv_shapes)
+    
+    # 캔들스틱 차트 (메인 차트)
+    fig.add_trace(
+        go.Candlestick(
+            x=bar_dates,
+            open=bar_open,
+            high=bar_high,
+            low=bar_low,
+            close=bar_close,
+            name="주가",
+            increasing_line_color='red',
+            decreasing_line_color='blue'
+        )
+    )
+    
+    # 추세선 추가 (JSON 데이터에서 읽어오기)
+    if signals_data.get("trendlines"):
+        trendlines = signals_data["trendlines"]
+        for trendline in trendlines:
+            points = trendline.get("points", [])
+            if len(points) >= 2:
+                trendline_dates = np.array([p["date"][:10] for p in points], dtype='datetime64[D]')
+                trendline_prices = [p["price"] for p in points]
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=trendline_dates,
+                        y=trendline_prices,
+                        name=trendline["name"],
+                        line=dict(
+                            color=trendline["color"],
+                            width=2,
+                            dash="dash"
+                        ),
+                        mode="lines"
                     )
+                )
+    
+    # 시그널 표시 (원본 코드와 정확히 동일 + 색깔 구분)
+    if settings and settings.get('selected_signals') and signals_data.get("signals"):
+        signals = signals_data["signals"]
+        show_buy_signals = settings.get('show_buy_signals', True)
         
-        # 시그널 표시 (원본 코드와 정확히 동일 + 색깔 구분)
-        if settings and settings.get('selected_signals') and signals_data.get("signals"):
-            signals = signals_data["signals"]
-            show_buy_signals = settings.get('show_buy_signals', True)
-            show_sell_signals = settings.get('show_sell_signals', True)
-            
-            # 시그널별 색깔 및 스타일 정의 (매수 신호: 가로 삼각형, 반전 신호: 세로 삼각형)
-            signal_styles = {
-                'short_signal_v2': {
-                    'buy': {'color': '#00FFFF', 'size': 8, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'circle'},
-                    'sell': {'color': '#FF4444', 'size': 12, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-left'}
-                },
-                'macd_signal': {
-                    'buy': {'color': '#FFD700', 'size': 16, 'opacity': 0.85, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-up'},
-                    'sell': {'color': '#FF6666', 'size': 16, 'opacity': 0.85, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-down'}
-                },
-                'short_signal_v1': {
-                    'buy': {'color': '#32CD32', 'size': 9, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'circle'},
-                    'sell': {'color': '#FF7777', 'size': 13, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-left'}
-                },
-                'momentum_color_signal': {
-                    'buy': {'color': '#FF69B4', 'size': 17, 'opacity': 0.85, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-up'},
-                    'sell': {'color': '#FF8888', 'size': 17, 'opacity': 0.85, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-down'}
-                },
-                'long_signal': {
-                    'buy': {'color': '#4169E1', 'size': 10, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'circle'},
-                    'sell': {'color': '#FF9999', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-left'}
-                },
-                'combined_signal_v1': {
-                    'buy': {'color': '#FF8C00', 'size': 15, 'opacity': 0.85, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-up'},
-                    'sell': {'color': '#FFAAAA', 'size': 15, 'opacity': 0.85, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-down'}
-                }
+        # 시그널별 색깔 및 스타일 정의 (매수 신호: 가로 삼각형, 반전 신호: 세로 삼각형)
+        signal_styles = {
+            'short_signal_v2': {
+                'buy': {'color': '#00FFFF', 'size': 8, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'circle'},
+                'sell': {'color': '#FF4444', 'size': 12, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-left'}
+            },
+            'macd_signal': {
+                'buy': {'color': '#FFD700', 'size': 16, 'opacity': 0.85, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-up'},
+                'sell': {'color': '#FF6666', 'size': 16, 'opacity': 0.85, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-down'}
+            },
+            'short_signal_v1': {
+                'buy': {'color': '#32CD32', 'size': 9, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'circle'},
+                'sell': {'color': '#FF7777', 'size': 13, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-left'}
+            },
+            'momentum_color_signal': {
+                'buy': {'color': '#FF69B4', 'size': 17, 'opacity': 0.85, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-up'},
+                'sell': {'color': '#FF8888', 'size': 17, 'opacity': 0.85, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-down'}
+            },
+            'long_signal': {
+                'buy': {'color': '#4169E1', 'size': 10, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'circle'},
+                'sell': {'color': '#FF9999', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-left'}
+            },
+            'combined_signal_v1': {
+                'buy': {'color': '#FF8C00', 'size': 15, 'opacity': 0.85, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-up'},
+                'sell': {'color': '#FFAAAA', 'size': 15, 'opacity': 0.85, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-down'}
             }
-            
-            for signal_name in settings['selected_signals']:
-                if signal_name in signals:
-                    signal_values = signals[signal_name]
-                    signal_style = signal_styles.get(signal_name, {'buy': {'color': '#00FF00', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-up'}, 'sell': {'color': '#FF0000', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-down'}})
+        }
+        
+        for signal_name in settings['selected_signals']:
+            if signal_name in signals:
+                signal_style = signal_styles.get(signal_name, {'buy': {'color': '#00FF00', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-up'}, 'sell': {'color': '#FF0000', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-down'}})
+                
+                # 매수 신호 표시 (마커 엔진에서 위치 계산) - FCV 제외
+                if show_buy_signals and signal_name != 'fcv_signal':
+                    markers = compute_signal_markers(
+                        signal_name, signals, marker_low, min_length, weeks, signals_data.get('signal_events')
+                    )
+                    buy_idx, buy_y = markers['buy_idx'], markers['buy_y']
+                    buy_text_idx, buy_text_y = markers['buy_text_idx'], markers['buy_text_y']
+                    if frequency:
+                        buy_idx, buy_y = _first_per_bar(buy_idx, buy_y, buckets)
+                        buy_text_idx, buy_text_y = _first_per_bar(buy_text_idx, buy_text_y, buckets)
                     
-                    # 매수 신호 표시 (인덱스 오류 방지) - FCV 제외
-                    if show_buy_signals and signal_name != 'fcv_signal':
-                        buy_signals = []
-                        
-                        # 주봉 기준 신호는 해당 주의 첫 번째 신호만 표시
-                        if signal_name in ['momentum_color_signal']:
-                            # 주별로 그룹화하여 각 주의 첫 번째 신호만 표시
-                            weekly_signals = {}
-                            for i, signal in enumerate(signal_values):
-                                if i < min_length and signal == 1:  # 인덱스 범위 체크
-                                    # 해당 날짜의 주 시작일(월요일) 계산
-                                    week_start = dates[i] - pd.Timedelta(days=dates[i].weekday())
-                                    week_key = week_start.strftime('%Y-%W')
-                                    
-                                    # 해당 주에 아직 신호가 없으면 추가
-                                    if week_key not in weekly_signals:
-                                        weekly_signals[week_key] = (dates[i], low_prices[i] * 0.99)
-                            
-                            # 각 주의 첫 번째 신호만 추가
-                            buy_signals = list(weekly_signals.values())
-                        else:
-                            # 일반 신호는 모든 날짜에 표시
-                            for i, signal in enumerate(signal_values):
-                                if i < min_length and signal == 1:  # 인덱스 범위 체크
-                                    buy_signals.append((dates[i], low_prices[i] * 0.97))
-                        
-                        # 반전 시그널에 대한 BUY! 텍스트 표시
-                        reversal_signals = ['macd_signal', 'momentum_color_signal', 'combined_signal_v1']
-                        if signal_name in reversal_signals:
-                            # 해당 그룹의 매수 시그널 찾기
-                            group_buy_signals = []
-                            if signal_name == 'macd_signal':
-                                group_buy_signals = ['short_signal_v2']  # 단기 그룹
-                            elif signal_name == 'momentum_color_signal':
-                                group_buy_signals = ['short_signal_v1']  # 중기 그룹
-                            elif signal_name == 'combined_signal_v1':
-                                group_buy_signals = ['long_signal']  # 장기 그룹
-                            
-                            buy_text_signals = []
-                            if signal_name == 'momentum_color_signal':
-                                # 중기 추세전환은 주별로 첫 번째 BUY!만 표시
-                                weekly_buy_texts = {}
-                                for i, signal in enumerate(signal_values):
-                                    if i < min_length and signal == 1:  # 반전 시그널이 있는 경우
-                                        # 최근 50개 데이터에서 해당 그룹의 매수 시그널 확인 (중기)
-                                        start_idx = max(0, i - 50)
-                                        
-                                        # 해당 그룹의 매수 시그널이 있는지 확인
-                                        has_buy_signal = False
-                                        for group_signal in group_buy_signals:
-                                            if group_signal in signals:
-                                                group_values = signals[group_signal]
-                                                if len(group_values) > i:
-                                                    recent_group_signals = group_values[start_idx:i]
-                                                    if 1 in recent_group_signals:
-                                                        has_buy_signal = True
-                                                        break
-                                        
-                                        # 매수 시그널이 있었으면 해당 주의 첫 번째 BUY!만 추가
-                                        if has_buy_signal:
-                                            week_start = dates[i] - pd.Timedelta(days=dates[i].weekday())
-                                            week_key = week_start.strftime('%Y-%W')
-                                            if week_key not in weekly_buy_texts:
-                                                weekly_buy_texts[week_key] = (dates[i], low_prices[i] * 0.95)  # 위치 올림
-                                
-                                buy_text_signals = list(weekly_buy_texts.values())
-                            else:
-                                # 단기/장기는 모든 BUY! 표시
-                                for i, signal in enumerate(signal_values):
-                                    if i < min_length and signal == 1:  # 반전 시그널이 있는 경우
-                                        # 최근 20개 데이터에서 해당 그룹의 매수 시그널 확인
-                                        start_idx = max(0, i - 20)
-                                        
-                                        # 해당 그룹의 매수 시그널이 있는지 확인
-                                        has_buy_signal = False
-                                        for group_signal in group_buy_signals:
-                                            if group_signal in signals:
-                                                group_values = signals[group_signal]
-                                                if len(group_values) > i:
-                                                    recent_group_signals = group_values[start_idx:i]
-                                                    if 1 in recent_group_signals:
-                                                        has_buy_signal = True
-                                                        break
-                                        
-                                        # 매수 시그널이 있었으면 BUY! 텍스트 추가
-                                        if has_buy_signal:
-                                            buy_text_signals.append((dates[i], low_prices[i] * 0.95))  # 위치 올림
-                            
-                            # BUY! 텍스트 표시
-                            if buy_text_signals:
-                                text_dates, text_prices = zip(*buy_text_signals)
-                                fig.add_trace(
-                                    go.Scatter(
-                                        x=text_dates,
-                                        y=text_prices,
-                                        mode='text',
-                                        text=['BUY!!'] * len(text_dates),
-                                        textposition='middle center',
-                                        textfont=dict(
-                                            color='red',
-                                            size=14,
-                                            family='Arial Black'
-                                        ),
-                                        name=f'{signal_style["buy"]["label"]} BUY!!',
-                                        showlegend=False
-                                    )
-                                )
-                        
-                        if buy_signals:
-                            buy_dates, buy_prices = zip(*buy_signals)
-                            
-                            # 매수 신호 표시 (가로 삼각형)
-                            fig.add_trace(
-                                go.Scatter(
-                                    x=buy_dates,
-                                    y=buy_prices,
-                                    mode='markers',
-                                    marker=dict(
-                                        symbol=signal_style['buy']['symbol'],
-                                        size=signal_style['buy']['size'],
-                                        color=signal_style['buy']['color'],
-                                        opacity=signal_style['buy']['opacity'],
-                                        line=dict(width=signal_style['buy']['line_width'], color='darkgreen')
-                                    ),
-                                    name=f'{signal_style["buy"]["label"]} BUY'
-                                )
+                    # 반전 시그널에 대한 BUY! 텍스트 표시 (최근 같은 그룹 매수 시그널이 있었던 경우)
+                    if len(buy_text_idx):
+                        text_dates = marker_dates[buy_text_idx]
+                        if compact:
+                            buy_text_y = _compact_prices(buy_text_y, decimals)
+                        fig.add_trace(
+                            scatter_trace(
+                                x=text_dates,
+                                y=buy_text_y,
+                                mode='text',
+                                text=['BUY!!'] * len(text_dates),
+                                textposition='middle center',
+                                textfont=dict(
+                                    color='red',
+                                    size=14,
+                                    family='Arial Black'
+                                ),
+                                name=f'{signal_style["buy"]["label"]} BUY!!',
+                                showlegend=False
                             )
-                            
-                            # low point 텍스트는 제거 (우측 상단에 설명으로 대체)
-                    
-                    
-                    # 매도 신호 표시 (인덱스 오류 방지) - 일시적으로 비활성화
-                    # if show_sell_signals:
-                    #     sell_signals = []
-                    #     for i, signal in enumerate(signal_values):
-                    #         if i < min_length and signal == -1:  # 인덱스 범위 체크
-                    #             sell_signals.append((dates[i], high_prices[i] * 1.02))
-                    #     
-                    #     if sell_signals:
-                    #         sell_dates, sell_prices = zip(*sell_signals)
-                    #         fig.add_trace(
-                    #             go.Scatter(
-                    #                 x=sell_dates,
-                    #                 y=sell_prices,
-                    #                 mode='markers',
-                    #                 marker=dict(
-                    #                     symbol=signal_style['sell']['symbol'],
-                    #                     size=signal_style['sell']['size'],
-                    #                     color=signal_style['sell']['color'],
-                    #                     opacity=signal_style['sell']['opacity'],
-                    #                     line=dict(width=signal_style['sell']['line_width'], color='darkred')
-                    #                 ),
-                    #                 name=f'{signal_style["sell"]["label"]} SELL'
-                    #             )
-                    #         )
-        
-        
-        # FCV 배경 색칠 (단기중기장기 무관하게 배경에 색칠)
-        fcv_has_green = False
-        fcv_has_red = False
-        
-        if signals_data.get("indicators") and "Final_Composite_Value" in signals_data["indicators"]:
-            fcv_values = signals_data["indicators"]["Final_Composite_Value"]
-            if len(fcv_values) > 0:
-                # FCV >= 0.5: 녹색 배경, FCV <= -0.5: 빨간색 배경
-                for i in range(min(len(fcv_values), min_length)):
-                    fcv_val = fcv_values[i]
-                    if fcv_val >= 0.5:
-                        fcv_has_green = True
-                        # 녹색 배경
-                        fig.add_shape(
-                            type="rect",
-                            x0=dates[i], x1=dates[i+1] if i+1 < len(dates) else dates[i],
-                            y0=0, y1=1,
-                            yref="paper",
-                            fillcolor="rgba(0, 255, 0, 0.1)",
-                            line=dict(width=0)
                         )
-                    elif fcv_val <= -0.5:
-                        fcv_has_red = True
-                        # 빨간색 배경
-                        fig.add_shape(
-                            type="rect",
-                            x0=dates[i], x1=dates[i+1] if i+1 < len(dates) else dates[i],
-                            y0=0, y1=1,
-                            yref="paper",
-                            fillcolor="rgba(255, 0, 0, 0.1)",
-                            line=dict(width=0)
+                    
+                    if len(buy_idx):
+                        if compact:
+                            buy_y = _compact_prices(buy_y, decimals)
+                        
+                        # 매수 신호 표시 (가로 삼각형)
+                        fig.add_trace(
+                            scatter_trace(
+                                x=marker_dates[buy_idx],
+                                y=buy_y,
+                                mode='markers',
+                                marker=dict(
+                                    symbol=signal_style['buy']['symbol'],
+                                    size=signal_style['buy']['size'],
+                                    color=signal_style['buy']['color'],
+                                    opacity=signal_style['buy']['opacity'],
+                                    line=dict(width=signal_style['buy']['line_width'], color='darkgreen')
+                                ),
+                                name=f'{signal_style["buy"]["label"]} BUY'
+                            )
                         )
-        
-        # 차트 레이아웃 설정 (전체화면 최적화 + 인터랙티브 제한)
-        fig.update_layout(
-            title="",  # 제목 제거
-            xaxis_rangeslider_visible=False,
-            height=500,  # 전체화면에 맞는 높이 (FCV 서브차트 제거로 더 크게)
-            showlegend=False,  # 범례 제거로 공간 확보
-            template="plotly_white",
-            margin=dict(l=2, r=2, t=15, b=2),  # 여백 극소화
-            font=dict(size=9),  # 폰트 크기 더 축소
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            # 인터랙티브 기능 제한
-            dragmode=False,  # 드래그 비활성화
-            hovermode=False,  # 호버 툴팁 완전 비활성화
-            # 우측 상단에 시그널 설명 추가 (동적)
-            annotations=_get_dynamic_annotations(fcv_has_green, fcv_has_red),
-            # 줌/팬 비활성화
-            xaxis=dict(
-                fixedrange=True,  # X축 고정
-                showspikes=False,  # 스파이크 제거
-                spikemode='across',
-                spikecolor='grey',
-                spikesnap='cursor',
-                spikethickness=1
-            ),
-            yaxis=dict(
-                fixedrange=True,  # Y축 고정
-                showspikes=False,  # 스파이크 제거
-                spikemode='across',
-                spikecolor='grey',
-                spikesnap='cursor',
-                spikethickness=1
-            )
-        )
-        
-        # Y축 설정 (제목 제거로 공간 확보 + 인터랙티브 제한)
-        fig.update_yaxes(
-            title_text="", 
-            fixedrange=True,  # 주가 축 고정
-            showspikes=False
+                        
+                        # low point 텍스트는 제거 (우측 상단에 설명으로 대체)
+    
+    
+    # 차트 레이아웃 설정 (전체화면 최적화 + 인터랙티브 제한)
+    fig.update_layout(
+        title="",  # 제목 제거
+        xaxis_rangeslider_visible=False,
+        height=500,  # 전체화면에 맞는 높이 (FCV 서브차트 제거로 더 크게)
+        showlegend=False,  # 범례 제거로 공간 확보
+        template="plotly_white",
+        margin=dict(l=2, r=2, t=15, b=2),  # 여백 극소화
+        font=dict(size=9),  # 폰트 크기 더 축소
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        # 인터랙티브 기능 제한
+        dragmode=False,  # 드래그 비활성화
+        hovermode=False,  # 호버 툴팁 완전 비활성화
+        # 우측 상단에 시그널 설명 추가 (동적)
+        annotations=_get_dynamic_annotations(fcv_has_green, fcv_has_red, frequency),
+        # 줌/팬 비활성화
+        xaxis=dict(
+            fixedrange=True,  # X축 고정
+            showspikes=False,  # 스파이크 제거
+            spikemode='across',
+            spikecolor='grey',
+            spikesnap='cursor',
+            spikethickness=1
+        ),
+        yaxis=dict(
+            fixedrange=True,  # Y축 고정
+            showspikes=False,  # 스파이크 제거
+            spikemode='across',
+            spikecolor='grey',
+            spikesnap='cursor',
+            spikethickness=1
         )
-        
-        # 차트 표시
-        st.plotly_chart(fig, use_container_width=True)
-        
-    except Exception as e:
-        logger.error(f"캔들스틱 차트 생성 실패: {e}")
-        st.error(f"차트 생성 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+    )
+    
+    # Y축 설정 (제목 제거로 공간 확보 + 인터랙티브 제한)
+    fig.update_yaxes(
+        title_text="", 
+        fixedrange=True,  # 주가 축 고정
+        showspikes=False
+    )
+    
+    return fig
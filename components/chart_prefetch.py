@@ -0,0 +1,118 @@
+"""
+Chart Prefetch - 종목을 고르는 즉시 세 지표 그룹의 차트를 백그라운드에서 미리 만드는 모듈
+
+1단계에서 종목이 정해지면 스레드 풀이 종목 데이터를 조회하고 지표 그룹별 figure를 만들어
+figure 캐시에 넣어 두므로, 2단계에서 그룹을 고르면 3단계는 캐시에서 바로 표시됩니다.
+3단계가 아직 진행 중인 미리 만들기와 겹치면 새로 만들지 않고 그 결과를 기다립니다.
+
+차트 모듈(plotly)은 작업 스레드가 처음 작업을 실행할 때 import하므로 1단계 화면(스크립트 스레드)은 차트 스택을 로드하지 않습니다.
+차트 모듈 import는 작업 스레드와 3단계 화면 모두 load_chart_module()로만 하며, 잠금 하나로 묶여 있어
+두 스레드가 동시에 import하지 않습니다 (동시에 import하면 덜 초기화된 모듈이 보일 수 있음).
+INVESTSMART_PREFETCH=0이면 동작하지 않습니다.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from typing import Any, Dict, Optional
+
+from components.chart_settings import DEFAULT_CHART_PERIOD, INDICATOR_GROUPS, build_chart_settings, chart_settings_key
+from utils.json_client import register_reload_listener
+
+logger = logging.getLogger(__name__)
+
+# 미리 만들기 사용 여부
+PREFETCH_ENABLED = os.environ.get("INVESTSMART_PREFETCH", "1") not in ("", "0", "false", "False")
+
+# 작업 스레드 수 (세션 전체가 공유)
+PREFETCH_WORKERS = int(os.environ.get("INVESTSMART_PREFETCH_WORKERS", "2"))
+
+# 3단계에서 진행 중인 미리 만들기를 기다리는 최대 시간 (초, 넘으면 직접 생성)
+PREFETCH_WAIT_SECONDS = 10.0
+
+# 완료된 작업 기록을 정리하는 기준 개수
+_PENDING_LIMIT = 64
+
+_lock = threading.Lock()
+_import_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Dict[tuple, Future] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """공유 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="chart-prefetch")
+    return _executor
+
+
+def _prefetch_key(symbol: str, period: str, settings: Optional[Dict[str, Any]]) -> tuple:
+    """작업 키 - figure 캐시 키에서 데이터 버전을 뺀 값"""
+    return (symbol, period, chart_settings_key(settings))
+
+
+def load_chart_module():
+    """
+    차트 모듈(components.chart) 가져오기
+    
+    처음 한 번만 import 시간이 걸리며, 작업 스레드와 스크립트 스레드가 같은 잠금 아래에서 import하므로
+    차트 스택을 쓰는 곳은 모두 이 함수로 가져와야 합니다.
+    """
+    with _import_lock:
+        import components.chart as chart
+    return chart
+
+
+def _run_prefetch(symbol: str, period: str, settings: Dict[str, Any]) -> bool:
+    """작업 스레드에서 figure 하나를 만들어 캐시에 넣기 (첫 작업이 차트 모듈을 import)"""
+    try:
+        return load_chart_module().prefetch_figure(symbol, period, settings)
+    except Exception as e:
+        logger.error(f"차트 미리 만들기 실패: {symbol}, {e}")
+        return False
+
+
+def prefetch_symbol_charts(symbol: str, period: str = DEFAULT_CHART_PERIOD) -> None:
+    """
+    종목의 세 지표 그룹 차트를 백그라운드에서 미리 생성 (바로 반환)
+
+    같은 작업이 진행 중이거나 끝났으면 다시 넣지 않으므로 매 실행(rerun)마다 호출해도 됩니다.
+    """
+    if not PREFETCH_ENABLED or not symbol:
+        return
+
+    with _lock:
+        if len(_pending) > _PENDING_LIMIT:
+            for key in [key for key, future in _pending.items() if future.done()]:
+                del _pending[key]
+
+        executor = _get_executor()
+        for group_info in INDICATOR_GROUPS.values():
+            settings = build_chart_settings(group_info['signals'])
+            key = _prefetch_key(symbol, period, settings)
+            if key in _pending:
+                continue
+            _pending[key] = executor.submit(_run_prefetch, symbol, period, settings)
+
+
+def wait_for_prefetch(symbol: str, period: str, settings: Optional[Dict[str, Any]]) -> None:
+    """해당 차트의 미리 만들기가 진행 중이면 끝날 때까지 대기 (없으면 바로 반환)"""
+    with _lock:
+        future = _pending.get(_prefetch_key(symbol, period, settings))
+    if future is None or future.done():
+        return
+    try:
+        future.result(timeout=PREFETCH_WAIT_SECONDS)
+    except TimeoutError:
+        logger.warning(f"차트 미리 만들기 대기 시간 초과: {symbol}")
+
+
+def _on_data_reload(old_store, new_store):
+    """데이터 교체 시 완료된 작업 기록 삭제 (새 버전 차트를 다시 미리 만들 수 있도록)"""
+    with _lock:
+        for key in [key for key, future in _pending.items() if future.done()]:
+            del _pending[key]
+
+
+register_reload_listener(_on_data_reload)
@@ -0,0 +1,70 @@
+"""
+Chart Settings - 지표 그룹과 차트 표시 설정
+"""
+import os
+from typing import Dict, Any, List, Optional
+
+
+# 지표 그룹 (2단계 화면에서 선택)
+INDICATOR_GROUPS = {
+    "단기": {
+        "description": "단기 트레이딩용 지표",
+        "signals": ["short_signal_v2", "macd_signal"],
+        "color": "#00FFFF"
+    },
+    "중기": {
+        "description": "중기 투자용 지표", 
+        "signals": ["short_signal_v1", "momentum_color_signal"],
+        "color": "#32CD32"
+    },
+    "장기": {
+        "description": "장기 투자용 지표",
+        "signals": ["long_signal", "combined_signal_v1"],
+        "color": "#4169E1"
+    }
+}
+
+# 3단계 차트 기본 조회 기간
+DEFAULT_CHART_PERIOD = "3y"
+
+# 차트 렌더링 방식
+# - auto: 봉 수가 예산 이하면 일봉 그대로, 넘으면 주봉/월봉으로 묶고 마커는 WebGL(Scattergl)로 표시
+# - webgl: 항상 WebGL 마커 사용 (봉 예산 초과 시 묶음도 적용)
+# - standard: 묶지 않고 일봉 전체를 SVG로 표시
+CHART_RENDER_MODES = ('auto', 'webgl', 'standard')
+DEFAULT_RENDER_MODE = os.environ.get("INVESTSMART_CHART_RENDER_MODE", "auto")
+
+# 한 차트에 표시할 최대 봉 수 (모바일 브라우저 부담 제한)
+DEFAULT_MAX_BARS = int(os.environ.get("INVESTSMART_CHART_MAX_BARS", "800"))
+
+# 차트 데이터 압축 (가격 반올림 + Plotly 6 이상은 float32 바이너리 배열, 날짜는 'YYYY-MM-DD' 문자열)
+DEFAULT_COMPACT_PAYLOAD = os.environ.get("INVESTSMART_CHART_COMPACT", "1") != "0"
+
+
+def build_chart_settings(selected_signals: List[str]) -> Dict[str, Any]:
+    """3단계 차트 표시 설정 생성"""
+    return {
+        'selected_signals': list(selected_signals),
+        'show_buy_signals': True,
+        'show_sell_signals': True,
+        'show_trendlines': True,
+        'selected_indicators': [],
+        'render_mode': DEFAULT_RENDER_MODE,
+        'max_bars': DEFAULT_MAX_BARS,
+        'compact_payload': DEFAULT_COMPACT_PAYLOAD
+    }
+
+
+def chart_settings_key(settings: Optional[Dict[str, Any]]) -> tuple:
+    """차트 모양에 영향을 주는 설정 값만 모은 키"""
+    settings = settings or {}
+    return (
+        tuple(settings.get('selected_signals') or ()),
+        bool(settings.get('show_buy_signals', True)),
+        bool(settings.get('show_sell_signals', True)),
+        bool(settings.get('show_trendlines', False)),
+        tuple(settings.get('selected_indicators') or ()),
+        settings.get('render_mode', DEFAULT_RENDER_MODE),
+        int(settings.get('max_bars', DEFAULT_MAX_BARS)),
+        bool(settings.get('compact_payload', DEFAULT_COMPACT_PAYLOAD)),
+    )
@@ -0,0 +1,169 @@
+"""
+Prebuilt Charts - 데이터 갱신 시 모든 차트를 미리 만들어 두는 빌드 단계와 로더
+
+signals_data.json이 바뀌면 (종목, 지표 그룹, 기간) 조합마다 Plotly figure JSON을 생성하고,
+render_stock_chart는 데이터 버전이 일치할 때 해당 파일을 읽어 바로 표시합니다.
+
+사용법:
+    python -m components.prebuilt_charts [--json signals_data.json] [--output prebuilt_charts] [--force]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+import plotly.io as pio
+
+from components.chart_settings import INDICATOR_GROUPS, build_chart_settings, chart_settings_key
+
+logger = logging.getLogger(__name__)
+
+# 미리 만든 차트 디렉토리 (환경 변수로 변경 가능)
+PREBUILT_DIR = os.environ.get("INVESTSMART_PREBUILT_DIR", "prebuilt_charts")
+
+# 미리 만들 조회 기간
+PREBUILT_PERIODS = ("1m", "6m", "1y", "3y", "max")
+
+MANIFEST_NAME = "manifest.json"
+
+_manifest_lock = threading.Lock()
+_manifest_cache: Dict[str, Tuple[Optional[float], Optional[Dict[str, Any]]]] = {}
+
+
+def _artifact_name(symbol: str, period: str, settings: Optional[Dict[str, Any]]) -> str:
+    """차트 파일 이름 (종목, 기간, 설정의 해시)"""
+    key = repr((symbol, period, chart_settings_key(settings)))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + ".json"
+
+
+def _read_manifest(prebuilt_dir: str) -> Optional[Dict[str, Any]]:
+    """매니페스트 조회 (파일 수정 시각이 같으면 이전에 읽은 내용 재사용)"""
+    path = os.path.join(prebuilt_dir, MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+
+    with _manifest_lock:
+        cached = _manifest_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            logger.error(f"차트 매니페스트 로드 실패: {e}")
+            manifest = None
+        _manifest_cache[path] = (mtime, manifest)
+        return manifest
+
+
+def load_prebuilt_figure(
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]],
+    data_version: str,
+    prebuilt_dir: Optional[str] = None
+):
+    """
+    미리 만든 차트 figure 로드
+
+    Returns:
+        Plotly figure (파일이 없거나 데이터 버전이 다르면 None)
+    """
+    prebuilt_dir = prebuilt_dir or PREBUILT_DIR
+    manifest = _read_manifest(prebuilt_dir)
+    if not manifest or manifest.get('data_version') != data_version:
+        return None
+
+    name = _artifact_name(symbol, period, settings)
+    if name not in manifest.get('charts', {}):
+        return None
+
+    try:
+        with open(os.path.join(prebuilt_dir, manifest['directory'], name), 'r', encoding='utf-8') as f:
+            return pio.from_json(f.read(), skip_invalid=True)
+    except Exception as e:
+        logger.error(f"미리 만든 차트 로드 실패: {symbol}, {e}")
+        return None
+
+
+def build_prebuilt_charts(
+    json_file_path: str = "signals_data.json",
+    prebuilt_dir: Optional[str] = None,
+    force: bool = False
+) -> int:
+    """
+    모든 (종목, 지표 그룹, 기간) 차트를 JSON으로 저장
+
+    데이터 버전이 같은 차트가 이미 있으면 건너뜁니다 (force=True면 다시 생성).
+    차트 파일을 버전별 디렉토리에 모두 쓴 뒤 매니페스트를 교체하므로,
+    서비스 중인 프로세스는 항상 완성된 차트 묶음만 읽습니다.
+
+    Returns:
+        생성한 차트 수
+    """
+    from components.chart import _build_candlestick_figure
+    from utils.json_client import InvestSmartJSONClient
+
+    prebuilt_dir = prebuilt_dir or PREBUILT_DIR
+    client = InvestSmartJSONClient(json_file_path)
+    data_version = client.data_version
+
+    manifest = _read_manifest(prebuilt_dir)
+    if not force and manifest and manifest.get('data_version') == data_version:
+        logger.info(f"차트가 이미 최신입니다: {prebuilt_dir} (데이터 버전 {data_version})")
+        return 0
+
+    directory = f"v_{data_version}"
+    output_dir = os.path.join(prebuilt_dir, directory)
+    os.makedirs(output_dir, exist_ok=True)
+
+    charts = {}
+    for symbol in client.get_available_symbols():
+        for period in PREBUILT_PERIODS:
+            signals_data = client.get_signals_data(symbol, period)
+            if signals_data.get('error') or not signals_data.get('dates'):
+                continue
+            for group_name, group_info in INDICATOR_GROUPS.items():
+                settings = build_chart_settings(group_info['signals'])
+                fig = _build_candlestick_figure(signals_data, settings)
+                if fig is None:
+                    continue
+                name = _artifact_name(symbol, period, settings)
+                with open(os.path.join(output_dir, name), 'w', encoding='utf-8') as f:
+                    f.write(fig.to_json())
+                charts[name] = {'symbol': symbol, 'group': group_name, 'period': period}
+
+    manifest_path = os.path.join(prebuilt_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'data_version': data_version, 'directory': directory, 'charts': charts}, f, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+    # 이전 버전 차트 정리
+    for entry in os.listdir(prebuilt_dir):
+        if entry.startswith("v_") and entry != directory:
+            shutil.rmtree(os.path.join(prebuilt_dir, entry), ignore_errors=True)
+
+    logger.info(f"차트 {len(charts)}개 생성 완료: {output_dir}")
+    return len(charts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모든 종목/지표 그룹/기간 차트를 미리 생성")
+    parser.add_argument('--json', default="signals_data.json", help="신호 데이터 JSON 파일")
+    parser.add_argument('--output', default=None, help=f"출력 디렉토리 (기본: {PREBUILT_DIR})")
+    parser.add_argument('--force', action='store_true', help="데이터 버전이 같아도 다시 생성")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    build_prebuilt_charts(args.json, args.output, args.force)
+
+
+if __name__ == "__main__":
+    main()
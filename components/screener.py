@@ -0,0 +1,120 @@
+"""
+Screener Component - 전체 종목의 최신 시그널 현황
+"""
+import streamlit as st
+from typing import Dict, Any, List, Optional
+import sys
+import os
+
+# 현재 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from components.chart_settings import INDICATOR_GROUPS
+from utils.screener import FCV_REGIMES, SCREENER_MAX_BARS, load_screener_table
+from utils.signal_markers import REVERSAL_SIGNALS
+from utils.symbol_catalog import load_symbol_catalog
+
+
+def _signal_label(group_name: str, signal_name: str) -> str:
+    """표 열 이름 (예: 단기 매수, 단기 반전)"""
+    return f"{group_name} {'반전' if signal_name in REVERSAL_SIGNALS else '매수'}"
+
+
+def _format_signal(state: Dict[str, Any]) -> str:
+    """신호 칸 표시 (예: 오늘, 3봉 전 · BUY!!)"""
+    if state['bars_since'] is None:
+        return "-"
+    text = "오늘" if state['bars_since'] == 0 else f"{state['bars_since']}봉 전"
+    if state['confirmed']:
+        text += " · BUY!!"
+    return f"{text} ({state['last_date']})"
+
+
+def _display_rows(rows: List[Dict[str, Any]], group_names: List[str], catalog) -> List[Dict[str, Any]]:
+    """화면 표시용 행"""
+    display_rows = []
+    for row in rows:
+        display_row = {
+            '종목': catalog.display_name(row['symbol']),
+            '기준일': row['date'],
+            '종가': row['close'],
+            '등락률(%)': round(row['change_pct'], 2) if row['change_pct'] is not None else None,
+            'FCV': round(row['fcv'], 2),
+            '국면': row['regime'],
+        }
+        for group_name in group_names:
+            for signal_name in INDICATOR_GROUPS[group_name]['signals']:
+                display_row[_signal_label(group_name, signal_name)] = _format_signal(row['signals'][signal_name])
+        display_rows.append(display_row)
+    return display_rows
+
+
+def render_screener() -> Optional[str]:
+    """
+    시그널 스크리너 렌더링
+
+    데이터 버전당 한 번 계산된 최신 상태 표만 읽으므로 종목 수와 관계없이 바로 표시됩니다.
+
+    Returns:
+        차트를 볼 종목 심볼 (차트 보기를 누른 경우) 또는 None
+    """
+    try:
+        table = load_screener_table()
+        catalog = load_symbol_catalog()
+
+        if not len(table):
+            st.error("스크리너 데이터를 불러올 수 없습니다.")
+            return None
+
+        # 조건 선택
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            group_names = st.multiselect(
+                "지표 그룹",
+                list(INDICATOR_GROUPS),
+                default=list(INDICATOR_GROUPS),
+                key="screener_groups"
+            )
+        with col2:
+            within_bars = st.number_input(
+                "최근 몇 봉 안의 신호 (1 = 마지막 봉)",
+                min_value=1,
+                max_value=SCREENER_MAX_BARS,
+                value=1,
+                key="screener_within_bars"
+            )
+        with col3:
+            regimes = st.multiselect(
+                "FCV 국면",
+                list(FCV_REGIMES),
+                default=list(FCV_REGIMES),
+                key="screener_regimes"
+            )
+        confirmed_only = st.checkbox("반전 신호는 BUY!!로 확인된 것만 보기", value=False, key="screener_confirmed")
+
+        signal_names = [name for group_name in group_names for name in INDICATOR_GROUPS[group_name]['signals']]
+        rows = table.filter(signal_names, int(within_bars), regimes, confirmed_only)
+
+        st.caption(f"전체 {len(table)}개 종목 중 {len(rows)}개 · 데이터 버전 {table.data_version}")
+        if not rows:
+            st.info("조건에 맞는 종목이 없습니다.")
+            return None
+
+        st.dataframe(_display_rows(rows, group_names, catalog), hide_index=True, use_container_width=True)
+
+        # 선택한 종목의 차트로 이동
+        symbol = st.selectbox(
+            "차트로 볼 종목",
+            [row['symbol'] for row in rows],
+            format_func=catalog.display_name,
+            key="screener_symbol"
+        )
+        if st.button("차트 보기", type="primary"):
+            return symbol
+        return None
+
+    except Exception as e:
+        st.error(f"스크리너 표시 중 오류가 발생했습니다: {e}")
+        return None
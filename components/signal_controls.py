@@ -51,10 +51,12 @@ def render_signal_controls(symbol: str) -> Optional[Dict[str, Any]]:
                 "momentum_color_signal"
             ]
             
+            signal_names = [signal["name"] for signal in signals_list]
+            
             selected_signals = st.multiselect(
                 "시그널 선택",
-                [signal["name"] for signal in signals_list],
-                default=core_signals,
+                signal_names,
+                default=[name for name in core_signals if name in signal_names],
                 key=f"signals_{symbol}"
             )
             settings["signals"] = selected_signals
@@ -0,0 +1,50 @@
+"""
+차트 전송량 벤치마크 - 압축 전(float64 숫자 목록, 전체 타임스탬프) vs 압축 후(반올림 가격 - Plotly 6 이상은 float32 바이너리 배열, 짧은 날짜)
+
+st.plotly_chart와 같은 방식(plotly.io.to_json)으로 직렬화한 크기와 gzip 크기를 차트별로 비교합니다.
+
+사용법:
+    python scripts/benchmark_chart_payload.py [기간 ...]
+"""
+import gzip
+import os
+import sys
+
+import plotly.io as pio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.chart import _build_candlestick_figure
+from components.chart_settings import INDICATOR_GROUPS, build_chart_settings
+from utils.json_client import InvestSmartJSONClient
+
+
+def payload_size(signals_data, settings):
+    """(JSON bytes, gzip bytes)"""
+    payload = pio.to_json(_build_candlestick_figure(signals_data, settings), validate=False).encode('utf-8')
+    return len(payload), len(gzip.compress(payload))
+
+
+def main():
+    periods = sys.argv[1:] or ["1y", "3y", "max"]
+    client = InvestSmartJSONClient()
+
+    print(f"{'종목':<10} {'기간':<4} {'그룹':<4} {'압축 전':>10} {'압축 후':>10} {'gzip 전':>9} {'gzip 후':>9}")
+    totals = [0, 0, 0, 0]
+    for symbol in client.get_available_symbols():
+        for period in periods:
+            signals_data = client.get_signals_data(symbol, period)
+            for group_name, group_info in INDICATOR_GROUPS.items():
+                settings = build_chart_settings(group_info['signals'])
+                before = payload_size(signals_data, {**settings, 'compact_payload': False})
+                after = payload_size(signals_data, {**settings, 'compact_payload': True})
+                sizes = (before[0], after[0], before[1], after[1])
+                totals = [total + size for total, size in zip(totals, sizes)]
+                print(f"{symbol:<10} {period:<4} {group_name:<4} {sizes[0]:>10,} {sizes[1]:>10,} {sizes[2]:>9,} {sizes[3]:>9,}")
+
+    print(f"\n합계: {totals[0]:,} -> {totals[1]:,} bytes ({totals[1] / totals[0]:.0%}), "
+          f"gzip {totals[2]:,} -> {totals[3]:,} bytes ({totals[3] / totals[2]:.0%})")
+
+
+if __name__ == "__main__":
+    main()
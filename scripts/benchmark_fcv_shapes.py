@@ -0,0 +1,82 @@
+"""
+FCV 배경 색칠 벤치마크 - 하루 단위 사각형(기존) vs 연속 구간 병합(현재)
+
+사용법:
+    python scripts/benchmark_fcv_shapes.py [기간]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.chart import _build_fcv_shapes
+from utils.json_client import InvestSmartJSONClient
+
+
+def build_legacy(dates, low_prices, high_prices, fcv_values):
+    """기존 방식: 날짜마다 add_shape를 두 번의 루프에서 호출"""
+    fig = go.Figure()
+    min_length = len(dates)
+    for i in range(min_length - 1):
+        if i < len(fcv_values) - 1:
+            current_fcv = fcv_values[i]
+            next_fcv = fcv_values[i + 1]
+            if current_fcv >= 0.5 or next_fcv >= 0.5:
+                fig.add_shape(type="rect", x0=dates[i], x1=dates[i + 1],
+                              y0=min(low_prices), y1=max(high_prices),
+                              fillcolor="rgba(0, 255, 0, 0.1)", line=dict(width=0), layer="below")
+            elif current_fcv <= -0.5 or next_fcv <= -0.5:
+                fig.add_shape(type="rect", x0=dates[i], x1=dates[i + 1],
+                              y0=min(low_prices), y1=max(high_prices),
+                              fillcolor="rgba(255, 0, 0, 0.1)", line=dict(width=0), layer="below")
+    for i in range(min(len(fcv_values), min_length)):
+        fcv_val = fcv_values[i]
+        if fcv_val >= 0.5:
+            fig.add_shape(type="rect", x0=dates[i], x1=dates[i + 1] if i + 1 < len(dates) else dates[i],
+                          y0=0, y1=1, yref="paper", fillcolor="rgba(0, 255, 0, 0.1)", line=dict(width=0))
+        elif fcv_val <= -0.5:
+            fig.add_shape(type="rect", x0=dates[i], x1=dates[i + 1] if i + 1 < len(dates) else dates[i],
+                          y0=0, y1=1, yref="paper", fillcolor="rgba(255, 0, 0, 0.1)", line=dict(width=0))
+    return fig
+
+
+def build_merged(dates, fcv_values):
+    """현재 방식: 연속 구간 병합 후 update_layout 한 번"""
+    fig = go.Figure()
+    shapes, _, _ = _build_fcv_shapes(dates, fcv_values)
+    fig.update_layout(shapes=shapes)
+    return fig
+
+
+def timed(build):
+    start = time.perf_counter()
+    fig = build()
+    elapsed = time.perf_counter() - start
+    return fig, elapsed
+
+
+def main():
+    period = sys.argv[1] if len(sys.argv) > 1 else "max"
+    client = InvestSmartJSONClient()
+    
+    print(f"{'종목':<10} {'방식':<6} {'shape 수':>9} {'JSON bytes':>12} {'생성 ms':>9}")
+    for symbol in client.get_available_symbols():
+        data = client.get_signals_data(symbol, period)
+        dates = pd.to_datetime(data["dates"])
+        fcv_values = data["indicators"]["Final_Composite_Value"]
+        
+        for label, build in (
+            ("기존", lambda: build_legacy(dates, data["data"]["low"], data["data"]["high"], fcv_values)),
+            ("병합", lambda: build_merged(dates, fcv_values)),
+        ):
+            fig, elapsed = timed(build)
+            size = len(fig.to_json())
+            print(f"{symbol:<10} {label:<6} {len(fig.layout.shapes):>9,} {size:>12,} {elapsed * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
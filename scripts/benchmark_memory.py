@@ -0,0 +1,68 @@
+"""
+메모리 사용량 비교 - 기존 dict 리스트 구조 vs 종목별 열 단위(NumPy) 구조,
+그리고 json.load 전체 로드 vs 스트리밍 로드의 최대 메모리
+
+사용법:
+    python scripts/benchmark_memory.py [signals_data.json]
+"""
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_client import _build_blocks, _stream_json_blocks
+
+
+def measure(build):
+    """객체 생성 후 남아 있는 메모리(bytes) 측정"""
+    result, current, _peak = measure_peak(build)
+    return result, current
+
+
+def measure_peak(build):
+    """객체 생성 후 남아 있는 메모리와 생성 중 최대 메모리(bytes) 측정"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def load_all(json_file_path):
+    """기존 방식: json.load로 전체 리스트를 만든 뒤 변환"""
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        return _build_blocks(json.load(f))
+
+
+def main():
+    json_file_path = sys.argv[1] if len(sys.argv) > 1 else "signals_data.json"
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        raw = f.read()
+    
+    records, dict_bytes = measure(lambda: json.loads(raw))
+    blocks, columnar_bytes = measure(lambda: _build_blocks(records))
+    rows = len(records)
+    
+    print(f"레코드 수: {rows:,}")
+    print(f"dict 리스트: {dict_bytes:>12,} bytes ({dict_bytes / rows:,.1f} bytes/행)")
+    print(f"열 단위    : {columnar_bytes:>12,} bytes ({columnar_bytes / rows:,.1f} bytes/행)")
+    print(f"감소율     : {dict_bytes / max(columnar_bytes, 1):,.1f}x")
+    
+    assert sum(len(block) for block in blocks.values()) == rows
+    assert columnar_bytes < dict_bytes, "열 단위 구조가 dict 리스트보다 커서는 안 됩니다"
+    
+    del records, blocks, raw
+    _, _, full_peak = measure_peak(lambda: load_all(json_file_path))
+    _, _, stream_peak = measure_peak(lambda: _stream_json_blocks(json_file_path))
+    
+    print(f"로드 중 최대 메모리 (json.load): {full_peak:>12,} bytes")
+    print(f"로드 중 최대 메모리 (스트리밍) : {stream_peak:>12,} bytes")
+
+
+if __name__ == "__main__":
+    main()
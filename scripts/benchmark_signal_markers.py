@@ -0,0 +1,106 @@
+"""
+시그널 마커 계산 벤치마크 - 기존 Python 루프 vs NumPy 마커 엔진 (일별 배열) vs 희소 이벤트 인덱스
+
+이벤트 열은 데이터 계층이 블록마다 미리 만든 신호 이벤트(SymbolBlock.events)를 사용한 시간입니다.
+
+사용법:
+    python scripts/benchmark_signal_markers.py [기간] [반복 횟수]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_client import InvestSmartJSONClient, SIGNAL_FIELDS
+from utils.signal_markers import REVERSAL_SIGNALS, WEEKLY_SIGNALS, compute_signal_markers, week_ids
+
+
+def legacy_markers(signal_name, signals, dates, low_prices, min_length):
+    """기존 차트 코드의 루프 (매수 마커 + BUY!! 위치)"""
+    signal_values = signals[signal_name]
+    buy_signals = []
+    if signal_name in WEEKLY_SIGNALS:
+        weekly_signals = {}
+        for i, signal in enumerate(signal_values):
+            if i < min_length and signal == 1:
+                week_start = dates[i] - pd.Timedelta(days=dates[i].weekday())
+                week_key = week_start.strftime('%Y-%W')
+                if week_key not in weekly_signals:
+                    weekly_signals[week_key] = (i, low_prices[i] * 0.99)
+        buy_signals = list(weekly_signals.values())
+    else:
+        for i, signal in enumerate(signal_values):
+            if i < min_length and signal == 1:
+                buy_signals.append((i, low_prices[i] * 0.97))
+    
+    buy_text_signals = []
+    if signal_name in REVERSAL_SIGNALS:
+        group_signal, lookback = REVERSAL_SIGNALS[signal_name]
+        weekly_buy_texts = {}
+        for i, signal in enumerate(signal_values):
+            if i < min_length and signal == 1:
+                start_idx = max(0, i - lookback)
+                group_values = signals.get(group_signal, [])
+                if len(group_values) > i and 1 in group_values[start_idx:i]:
+                    if signal_name in WEEKLY_SIGNALS:
+                        week_start = dates[i] - pd.Timedelta(days=dates[i].weekday())
+                        week_key = week_start.strftime('%Y-%W')
+                        if week_key not in weekly_buy_texts:
+                            weekly_buy_texts[week_key] = (i, low_prices[i] * 0.95)
+                    else:
+                        buy_text_signals.append((i, low_prices[i] * 0.95))
+        if signal_name in WEEKLY_SIGNALS:
+            buy_text_signals = list(weekly_buy_texts.values())
+    return buy_signals, buy_text_signals
+
+
+def engine_markers(signal_name, signals, weeks, low_prices, min_length, events=None):
+    """마커 엔진 (열 단위 배열 입력, events가 있으면 희소 이벤트 사용)"""
+    return compute_signal_markers(signal_name, signals, low_prices, min_length, weeks, events)
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    period = sys.argv[1] if len(sys.argv) > 1 else "max"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    client = InvestSmartJSONClient()
+    
+    print(f"{'종목':<10} {'시그널':<22} {'루프 ms':>9} {'엔진 ms':>9} {'이벤트 ms':>10} {'배속':>7}")
+    for symbol in client.get_available_symbols():
+        data = client.get_signals_data(symbol, period)
+        dates = pd.to_datetime(data["dates"])
+        low_prices = data["data"]["low"]
+        signals = data["signals"]
+        min_length = len(dates)
+        
+        # 엔진은 데이터 계층의 열 단위 배열을 그대로 사용 (주 번호는 차트당 한 번 계산)
+        block = client.get_columnar_data(symbol, period)
+        weeks = week_ids(block.dates)
+        
+        for signal_name in SIGNAL_FIELDS:
+            legacy_args = (signal_name, signals, dates, low_prices, min_length)
+            engine_args = (signal_name, block.columns, weeks, block.columns['low'], min_length)
+            (legacy_buy, legacy_text), legacy_time = timed(lambda: legacy_markers(*legacy_args), repeat)
+            markers, engine_time = timed(lambda: engine_markers(*engine_args), repeat)
+            event_markers, event_time = timed(lambda: engine_markers(*engine_args, block.events), repeat)
+            
+            # 세 방식의 결과가 같은지 확인
+            for result in (markers, event_markers):
+                assert [i for i, _ in legacy_buy] == result['buy_idx'].tolist(), (symbol, signal_name)
+                assert [i for i, _ in legacy_text] == result['buy_text_idx'].tolist(), (symbol, signal_name)
+            
+            print(f"{symbol:<10} {signal_name:<22} {legacy_time * 1000:>9.3f} {engine_time * 1000:>9.3f} "
+                  f"{event_time * 1000:>10.3f} {legacy_time / max(event_time, 1e-9):>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
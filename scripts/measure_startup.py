@@ -0,0 +1,142 @@
+"""
+시작 시간 측정 - python -X importtime으로 app.py import 시간을 모듈별로 집계
+
+1~2단계 화면에서 쓰지 않는 모듈(차트 스택, pandas)이 시작 시 import되면 실패(종료 코드 1)로 보고하므로
+배포 전 점검이나 CI에서 시작 시간 회귀를 잡는 데 사용합니다.
+import만으로는 화면 코드가 실행되지 않으므로, 1단계 화면을 AppTest로 두 번(첫 실행 + rerun) 실행해
+스크립트 스레드가 그 모듈을 import하는지도 확인합니다 (미리 만들기 작업 스레드의 import는 제외).
+
+사용법:
+    python scripts/measure_startup.py [--module app] [--runs 3] [--top 15] [--budget-ms 2000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시 import되면 안 되는 모듈 (3단계에서 지연 import)
+DEFAULT_FORBIDDEN = ("components.chart", "components.prebuilt_charts", "pandas")
+
+# 직접 관리하는 모듈 접두사
+FIRST_PARTY = ("app", "components", "utils")
+
+# 1단계 화면 실행 점검 - 새 인터프리터에서 실행 (인자: 금지 모듈 쉼표 구분, 출력: 스크립트 스레드가 import한 금지 모듈)
+_STEP1_CHECK = """
+import sys, threading
+from streamlit.testing.v1 import AppTest
+
+forbidden = set(sys.argv[1].split(','))
+loaded = set()
+
+def hook(event, args):
+    if event == 'import' and args[0] in forbidden and not threading.current_thread().name.startswith('chart-prefetch'):
+        loaded.add(args[0])
+
+sys.addaudithook(hook)
+at = AppTest.from_file('app.py', default_timeout=60)
+at.session_state['disclaimer_agreed'] = True
+at.run()
+at.run()
+if at.exception:
+    raise SystemExit(f'1단계 화면 실행 실패: {at.exception}')
+print(','.join(sorted(loaded)))
+"""
+
+
+def measure_once(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    새 인터프리터에서 module을 import하고 모듈별 (자체 시간, 누적 시간) 수집 (마이크로초)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(module: str, runs: int) -> Dict[str, Tuple[int, int]]:
+    """여러 번 측정해 모듈별 최솟값 사용 (디스크 캐시 등 잡음 제거)"""
+    best: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        for name, (self_us, cumulative_us) in measure_once(module).items():
+            if name in best:
+                self_us = min(self_us, best[name][0])
+                cumulative_us = min(cumulative_us, best[name][1])
+            best[name] = (self_us, cumulative_us)
+    return best
+
+
+def check_step1_rerun(forbidden: Tuple[str, ...]) -> List[str]:
+    """1단계 화면을 실행(첫 실행 + rerun)했을 때 스크립트 스레드가 import한 금지 모듈"""
+    result = subprocess.run(
+        [sys.executable, "-c", _STEP1_CHECK, ",".join(forbidden)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"1단계 화면 실행 실패:\n{result.stderr[-2000:]}")
+    output = result.stdout.strip().splitlines()
+    return [name for name in (output[-1] if output else "").split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 시작 시 모듈별 import 시간 측정")
+    parser.add_argument('--module', default="app", help="측정할 모듈 (기본: app)")
+    parser.add_argument('--runs', type=int, default=3, help="측정 횟수 (모듈별 최솟값 사용)")
+    parser.add_argument('--top', type=int, default=15, help="출력할 모듈 수")
+    parser.add_argument('--budget-ms', type=float, default=None, help="전체 import 시간 상한 (넘으면 실패)")
+    parser.add_argument('--forbid', default=",".join(DEFAULT_FORBIDDEN), help="시작 시 import되면 안 되는 모듈 (쉼표 구분)")
+    parser.add_argument('--skip-step1', action='store_true', help="1단계 화면 실행 점검 생략 (--module app일 때만 실행)")
+    args = parser.parse_args()
+
+    timings = measure(args.module, args.runs)
+    total_ms = timings[args.module][1] / 1000
+
+    print(f"{args.module} import 시간: {total_ms:.0f}ms ({args.runs}회 중 최소)")
+
+    print(f"\n누적 시간 상위 {args.top}개 모듈 (직접 관리하는 모듈)")
+    first_party = [(name, t) for name, t in timings.items() if name.split(".")[0] in FIRST_PARTY]
+    for name, (_, cumulative_us) in sorted(first_party, key=lambda item: -item[1][1])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+    print(f"\n자체 시간 상위 {args.top}개 모듈 (전체)")
+    for name, (self_us, _) in sorted(timings.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    forbid = tuple(name for name in args.forbid.split(",") if name)
+    forbidden = [name for name in forbid if name in timings]
+    if forbidden:
+        print(f"\n실패: 시작 시 import되면 안 되는 모듈이 로드됨: {', '.join(forbidden)}")
+        failed = True
+    if args.module == "app" and not args.skip_step1 and forbid:
+        step1_loaded = check_step1_rerun(forbid)
+        if step1_loaded:
+            print(f"\n실패: 1단계 화면 실행 중 스크립트 스레드가 로드함: {', '.join(step1_loaded)}")
+            failed = True
+        else:
+            print("\n1단계 화면 실행(첫 실행 + rerun): 금지 모듈 로드 없음")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\n실패: import 시간 {total_ms:.0f}ms가 상한 {args.budget_ms:.0f}ms를 넘음")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+로컬 신호 서비스 - utils/api_client.py 확인용으로 signals_data.json을 HTTP로 제공하는 서버
+
+keep-alive(HTTP/1.1), ETag/If-None-Match(304), 일괄 조회를 지원합니다.
+ETag는 데이터 버전과 요청 경로로 만들어지므로 데이터가 바뀌면 달라집니다.
+
+사용법:
+    python scripts/mock_signals_server.py [--port 8000] [--json signals_data.json]
+    INVESTSMART_API_URL=http://localhost:8000 python -c "from utils.api_client import get_api_client; print(get_api_client().get_available_symbols())"
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_client import InvestSmartJSONClient, SIGNAL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 시그널 설명 (지표 목록 응답용)
+SIGNAL_DESCRIPTIONS = {
+    'short_signal_v1': "중기 매수 신호",
+    'short_signal_v2': "단기 매수 신호",
+    'long_signal': "장기 매수 신호",
+    'combined_signal_v1': "장기 반전 신호",
+    'macd_signal': "단기 반전 신호 (MACD)",
+    'momentum_color_signal': "중기 반전 신호 (주봉 모멘텀)",
+}
+
+
+class SignalsRequestHandler(BaseHTTPRequestHandler):
+    """신호 서비스 요청 처리"""
+
+    protocol_version = "HTTP/1.1"
+    client: InvestSmartJSONClient = None
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _send_json(self, payload, etag=None, status=200):
+        """JSON 응답 (ETag가 요청의 If-None-Match와 같으면 304)"""
+        if etag is not None and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _etag(self, *parts) -> str:
+        """데이터 버전 + 요청 내용 기반 ETag"""
+        key = repr((self.client.data_version,) + parts).encode('utf-8')
+        return '"' + hashlib.sha1(key).hexdigest()[:20] + '"'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        if url.path == "/api/v1/symbols":
+            self._send_json({'symbols': self.client.get_available_symbols()}, self._etag(url.path))
+        elif url.path == "/api/v1/indicators":
+            self._send_json({
+                'signals': [{'name': name, 'description': SIGNAL_DESCRIPTIONS.get(name, name)} for name in SIGNAL_FIELDS],
+                'indicators': [{'name': 'Final_Composite_Value', 'description': "종합 지표 (FCV)"}],
+            }, self._etag(url.path))
+        elif url.path.startswith("/api/v1/signals/"):
+            symbol = unquote(url.path[len("/api/v1/signals/"):])
+            period = params.get('period', '1y')
+            data = self.client.get_signals_data(symbol, period)
+            status = 404 if data.get('error') else 200
+            self._send_json(data, None if status == 404 else self._etag(symbol, period), status)
+        else:
+            self._send_json({'error': 'not found'}, status=404)
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/api/v1/signals/batch":
+            self._send_json({'error': 'not found'}, status=404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        period = request.get('period', '1y')
+        results = {}
+        for symbol in request.get('symbols', []):
+            data = self.client.get_signals_data(symbol, period)
+            results[symbol] = {'etag': self._etag(symbol, period), 'data': data}
+        self._send_json({'results': results})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="signals_data.json을 제공하는 로컬 신호 서비스")
+    parser.add_argument('--port', type=int, default=8000, help="포트 (기본: 8000)")
+    parser.add_argument('--json', default="signals_data.json", help="신호 데이터 JSON 파일")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    SignalsRequestHandler.client = InvestSmartJSONClient(args.json)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), SignalsRequestHandler)
+    logger.info(f"신호 서비스 시작: http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+API 클라이언트
+백엔드 신호 서비스(HTTP)에서 데이터를 조회하는 클라이언트
+
+- 연결 재사용: 프로세스 전역 requests.Session (keep-alive 연결 풀)
+- 요청 합치기: 같은 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 사용
+- 재검증: 응답 ETag를 저장했다가 If-None-Match로 보내 304면 로컬 캐시 사용
+- 일괄 조회: 여러 종목을 요청 한 번으로 조회 (POST /api/v1/signals/batch)
+
+API:
+    GET  /api/v1/symbols                      -> {"symbols": [...]}
+    GET  /api/v1/indicators                   -> {"signals": [{"name", "description"}], "indicators": [...]}
+    GET  /api/v1/signals/<symbol>?period=1y   -> get_signals_data와 같은 구조
+    POST /api/v1/signals/batch                -> {"results": {symbol: {"etag", "data"}}}
+         본문: {"symbols": [...], "period": "1y"}
+
+로컬에서는 scripts/mock_signals_server.py로 signals_data.json을 제공하는 서버를 띄워 확인할 수 있습니다.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.lru_cache import BoundedLRUCache
+
+logger = logging.getLogger(__name__)
+
+# 백엔드 주소
+API_BASE_URL = os.environ.get("INVESTSMART_API_URL", "http://localhost:8000")
+
+# 이 시간(초) 안에 받은 응답은 재검증 없이 바로 사용
+API_MAX_AGE = float(os.environ.get("INVESTSMART_API_MAX_AGE", "5"))
+
+# 요청 제한 시간 (연결, 읽기)
+API_TIMEOUT = (3.05, 15)
+
+# 연결 풀 크기 (동시 세션 수에 맞춤)
+API_POOL_SIZE = 16
+
+# 로컬 응답 캐시 항목 수
+API_CACHE_SIZE = 256
+
+
+class _CachedResponse:
+    """로컬 캐시 항목 (ETag, 응답 본문, 받은 시각)"""
+
+    __slots__ = ('etag', 'data', 'fetched_at')
+
+    def __init__(self, etag: Optional[str], data: Any):
+        self.etag = etag
+        self.data = data
+        self.fetched_at = time.monotonic()
+
+
+class InvestSmartAPIClient:
+    """InvestSmart 백엔드 API 클라이언트 (스레드 안전, 프로세스당 하나를 공유)"""
+
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        max_age: float = API_MAX_AGE,
+        pool_size: int = API_POOL_SIZE
+    ):
+        """
+        Args:
+            base_url: 백엔드 주소
+            max_age: 재검증 없이 캐시를 사용할 시간 (초)
+            pool_size: keep-alive 연결 풀 크기
+        """
+        self.base_url = base_url.rstrip('/')
+        self.max_age = max_age
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=frozenset({'GET', 'HEAD'}))
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({'Accept': 'application/json', 'Accept-Encoding': 'gzip'})
+
+        self._cache = BoundedLRUCache(max_items=API_CACHE_SIZE)
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _fresh(self, key: Hashable) -> Tuple[Optional[_CachedResponse], bool]:
+        """(캐시 항목, 재검증 없이 사용 가능 여부)"""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None, False
+        return cached, time.monotonic() - cached.fetched_at < self.max_age
+
+    def _coalesced(self, key: Hashable, fetch) -> Any:
+        """같은 key의 요청이 진행 중이면 그 결과를 기다리고, 아니면 직접 fetch 실행"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET 요청 (로컬 캐시 + ETag 재검증 + 요청 합치기)
+
+        Raises:
+            requests.RequestException: 네트워크 오류 또는 오류 응답
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        cached, fresh = self._fresh(key)
+        if fresh:
+            return cached.data
+
+        def fetch():
+            headers = {'If-None-Match': cached.etag} if cached is not None and cached.etag else {}
+            response = self.session.get(self.base_url + path, params=params, headers=headers, timeout=API_TIMEOUT)
+            if response.status_code == 304:
+                if cached is not None:
+                    self._cache.put(key, _CachedResponse(cached.etag, cached.data))
+                    return cached.data
+                # 로컬 캐시 없이 받은 304는 본문이 없으므로 ETag 없이 다시 요청
+                logger.warning(f"캐시 없이 304 응답을 받아 다시 요청합니다: {path}")
+                response = self.session.get(
+                    self.base_url + path, params=params, headers={'Cache-Control': 'no-cache'}, timeout=API_TIMEOUT
+                )
+                if response.status_code == 304:
+                    raise requests.HTTPError(f"304 응답에 본문이 없습니다: {path}", response=response)
+            response.raise_for_status()
+            data = response.json()
+            self._cache.put(key, _CachedResponse(response.headers.get('ETag'), data))
+            return data
+
+        return self._coalesced(key, fetch)
+
+    def get_available_symbols(self) -> List[str]:
+        """사용 가능한 종목 목록 조회"""
+        try:
+            return self._get_json("/api/v1/symbols").get('symbols', [])
+        except Exception as e:
+            logger.error(f"종목 목록 조회 실패: {e}")
+            return []
+
+    def get_available_indicators(self) -> Dict[str, Any]:
+        """사용 가능한 시그널/지표 목록 조회"""
+        try:
+            return self._get_json("/api/v1/indicators")
+        except Exception as e:
+            logger.error(f"지표 목록 조회 실패: {e}")
+            return {}
+
+    def get_signals_data(self, symbol: str, period: str = "1y") -> Dict[str, Any]:
+        """특정 종목의 신호 데이터 조회 (InvestSmartJSONClient.get_signals_data와 같은 구조)"""
+        try:
+            return self._get_json(f"/api/v1/signals/{quote(symbol, safe='')}", {'period': period})
+        except Exception as e:
+            logger.error(f"신호 데이터 조회 실패: {symbol}, {e}")
+            return {
+                'symbol': symbol,
+                'dates': [],
+                'signals': {},
+                'indicators': {},
+                'error': f'데이터 조회 실패: {e}'
+            }
+
+    def get_signals_batch(self, symbols: List[str], period: str = "1y") -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목의 신호 데이터를 한 번에 조회
+
+        로컬 캐시에서 바로 쓸 수 있는 종목은 제외하고 나머지만 한 요청으로 보냅니다.
+        응답은 종목별 조회와 같은 캐시 키로 저장되어 이후 get_signals_data에서도 재사용됩니다.
+
+        Returns:
+            종목 -> 신호 데이터 (조회 실패한 종목은 오류 사전)
+        """
+        results = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            cached, fresh = self._fresh(self._signals_key(symbol, period))
+            if fresh:
+                results[symbol] = cached.data
+            else:
+                missing.append(symbol)
+
+        if missing:
+            key = ("/api/v1/signals/batch", period, tuple(missing))
+            try:
+                fetched = self._coalesced(key, lambda: self._fetch_batch(missing, period))
+            except Exception as e:
+                logger.error(f"신호 데이터 일괄 조회 실패: {missing}, {e}")
+                fetched = {}
+            for symbol in missing:
+                results[symbol] = fetched.get(symbol) or {
+                    'symbol': symbol,
+                    'dates': [],
+                    'signals': {},
+                    'indicators': {},
+                    'error': '데이터를 찾을 수 없습니다'
+                }
+        return results
+
+    @staticmethod
+    def _signals_key(symbol: str, period: str) -> Hashable:
+        """종목별 조회와 같은 캐시 키"""
+        return (f"/api/v1/signals/{quote(symbol, safe='')}", (('period', period),))
+
+    def _fetch_batch(self, symbols: List[str], period: str) -> Dict[str, Dict[str, Any]]:
+        """일괄 조회 요청 후 종목별로 캐시에 저장"""
+        response = self.session.post(
+            self.base_url + "/api/v1/signals/batch",
+            json={'symbols': symbols, 'period': period},
+            timeout=API_TIMEOUT
+        )
+        response.raise_for_status()
+
+        fetched = {}
+        for symbol, entry in response.json().get('results', {}).items():
+            fetched[symbol] = entry.get('data')
+            if fetched[symbol] is not None and not fetched[symbol].get('error'):
+                self._cache.put(self._signals_key(symbol, period), _CachedResponse(entry.get('etag'), fetched[symbol]))
+        return fetched
+
+    def cache_stats(self) -> Dict[str, int]:
+        """로컬 응답 캐시 통계"""
+        return self._cache.stats()
+
+
+_client_lock = threading.Lock()
+_api_client: Optional[InvestSmartAPIClient] = None
+
+
+def get_api_client() -> InvestSmartAPIClient:
+    """프로세스 전역 API 클라이언트 (연결 풀과 로컬 캐시를 모든 세션이 공유)"""
+    global _api_client
+    if _api_client is None:
+        with _client_lock:
+            if _api_client is None:
+                _api_client = InvestSmartAPIClient()
+    return _api_client
@@ -0,0 +1,195 @@
+"""
+바이너리 신호 데이터 포맷
+signals_data.json을 종목별 열 단위 배열로 변환해 저장하고, 메모리 맵으로 즉시 여는 모듈
+
+파일 구조:
+    MAGIC (8 bytes) | 헤더 길이 (uint64, little endian) | 헤더 (UTF-8 JSON) | 64바이트 정렬된 배열들
+
+헤더에는 원본 JSON의 크기/수정 시각/SHA-1이 기록되어 있어 원본이 바뀌면 오래된 파일로 판단합니다.
+
+사용법:
+    python -m utils.binary_store [signals_data.json] [-o signals_data.bin]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ISSIGBIN"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+
+def default_binary_path(json_file_path: str) -> str:
+    """JSON 경로에 대응하는 바이너리 파일 경로"""
+    return os.path.splitext(json_file_path)[0] + ".bin"
+
+
+def file_sha1(path: str) -> str:
+    """파일 내용의 SHA-1 해시"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _align(offset: int) -> int:
+    """정렬 경계로 올림"""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_binary_store(blocks: Dict[str, Any], binary_file_path: str, source: Optional[Dict[str, Any]] = None) -> int:
+    """
+    종목별 블록을 바이너리 파일로 저장
+
+    Args:
+        blocks: 종목 -> SymbolBlock
+        binary_file_path: 저장할 파일 경로
+        source: 원본 JSON 식별 정보 (크기, 수정 시각, 해시)
+
+    Returns:
+        저장된 파일 크기 (bytes)
+    """
+    arrays = []
+    symbols = []
+    offset = 0
+    for symbol, block in blocks.items():
+        columns = {}
+        for name, values in [('dates', block.dates), *block.columns.items()]:
+            values = np.ascontiguousarray(values)
+            columns[name] = {'dtype': values.dtype.str, 'offset': offset}
+            arrays.append((offset, values))
+            offset = _align(offset + values.nbytes)
+        symbols.append({
+            'symbol': symbol,
+            'rows': len(block),
+            'last_updated': block.last_updated,
+            'columns': columns,
+        })
+
+    header = json.dumps({
+        'format_version': FORMAT_VERSION,
+        'source': source,
+        'symbols': symbols,
+    }, ensure_ascii=False).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    # 다른 프로세스가 읽는 중인 파일을 덮어쓰지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = binary_file_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for array_offset, values in arrays:
+            f.seek(data_start + array_offset)
+            f.write(values.tobytes())
+        size = data_start + offset
+        f.truncate(size)
+    os.replace(tmp_path, binary_file_path)
+    return size
+
+
+def read_binary_header(binary_file_path: str) -> Dict[str, Any]:
+    """바이너리 파일 헤더만 읽기"""
+    with open(binary_file_path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"신호 바이너리 파일이 아닙니다: {binary_file_path}")
+        (header_length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    if header.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 바이너리 포맷 버전: {header.get('format_version')}")
+    header['data_start'] = _align(len(MAGIC) + 8 + header_length)
+    return header
+
+
+def is_binary_fresh(header: Dict[str, Any], json_file_path: str) -> bool:
+    """
+    바이너리 파일이 원본 JSON과 일치하는지 확인
+
+    크기/수정 시각이 같으면 바로 통과하고, 수정 시각만 다르면(예: git checkout)
+    내용 해시로 다시 확인합니다. 원본 JSON이 없으면 바이너리를 그대로 사용합니다.
+    """
+    if not os.path.exists(json_file_path):
+        return True
+
+    source = header.get('source') or {}
+    stat = os.stat(json_file_path)
+    if stat.st_size != source.get('size'):
+        return False
+    if stat.st_mtime_ns == source.get('mtime_ns'):
+        return True
+    return file_sha1(json_file_path) == source.get('sha1')
+
+
+def load_binary_blocks(
+    binary_file_path: str,
+    header: Optional[Dict[str, Any]] = None,
+    use_mmap: bool = True
+) -> Dict[str, Any]:
+    """
+    바이너리 파일을 메모리 맵으로 열어 종목별 블록 생성
+
+    배열은 복사 없이 메모리 맵의 뷰로 만들어지므로, 여러 워커 프로세스가
+    OS 페이지 캐시를 공유합니다. use_mmap=False면 파일 전체를 한 번 읽어
+    읽기 전용 버퍼의 뷰로 만듭니다 (블록을 버리면 메모리도 바로 반환됨).
+    """
+    from utils.json_client import SymbolBlock
+
+    if header is None:
+        header = read_binary_header(binary_file_path)
+
+    if use_mmap:
+        buffer = np.memmap(binary_file_path, dtype=np.uint8, mode='r')
+    else:
+        with open(binary_file_path, 'rb') as f:
+            buffer = np.frombuffer(f.read(), dtype=np.uint8)
+    data_start = header['data_start']
+
+    blocks = {}
+    for entry in header['symbols']:
+        rows = entry['rows']
+        columns = {}
+        for name, spec in entry['columns'].items():
+            dtype = np.dtype(spec['dtype'])
+            start = data_start + spec['offset']
+            columns[name] = buffer[start:start + rows * dtype.itemsize].view(dtype)
+        dates = columns.pop('dates')
+        blocks[entry['symbol']] = SymbolBlock(entry['symbol'], dates, columns, entry.get('last_updated'))
+    return blocks
+
+
+def convert_json_to_binary(json_file_path: str, binary_file_path: Optional[str] = None) -> str:
+    """JSON 신호 데이터를 바이너리 포맷으로 변환"""
+    from utils.json_client import _read_json_blocks
+
+    binary_file_path = binary_file_path or default_binary_path(json_file_path)
+    # 크기/수정 시각은 읽기 전에 기록하고 해시는 파싱한 바이트에서 계산
+    # (읽는 중 파일이 교체되면 수정 시각이 달라져 해시 비교에서 오래된 것으로 판정됨)
+    stat = os.stat(json_file_path)
+    blocks, digest = _read_json_blocks(json_file_path)
+    source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest}
+    size = write_binary_store(blocks, binary_file_path, source)
+    logger.info(f"바이너리 변환 완료: {binary_file_path} ({len(blocks)}개 종목, {size:,} bytes)")
+    return binary_file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="signals_data.json을 메모리 맵용 바이너리 포맷으로 변환")
+    parser.add_argument('json_file', nargs='?', default="signals_data.json", help="원본 JSON 파일")
+    parser.add_argument('-o', '--output', default=None, help="출력 바이너리 파일 (기본: JSON과 같은 이름의 .bin)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    convert_json_to_binary(args.json_file, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,38 +2,809 @@
 JSON 데이터 클라이언트
 JSON 파일에서 직접 데이터를 읽어오는 간단한 클라이언트
 """
+import codecs
+import hashlib
 import json
+import numpy as np
 import streamlit as st
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable, Iterator, Mapping
 import logging
 import os
+import threading
+from array import array
+import time
+from datetime import date
+from types import MappingProxyType
+
+from utils.perf import timed
+from utils.signal_markers import SignalEvents, build_signal_events, week_ids
 
 logger = logging.getLogger(__name__)
 
+# 주가 데이터 필드
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# 신호 데이터 필드
+SIGNAL_FIELDS = (
+    'short_signal_v1',
+    'short_signal_v2',
+    'long_signal',
+    'combined_signal_v1',
+    'macd_signal',
+    'momentum_color_signal',
+)
+
+# 열 단위 저장 시 필드별 자료형
+COLUMN_DTYPES = {
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.int64,
+    **{name: np.int8 for name in SIGNAL_FIELDS},
+    'fcv': np.float64,
+}
+
+# 저장소 방식 - json: JSON 파싱, binary: 최신 .bin이 있으면 메모리 맵, shards: 종목별 지연 로드,
+# sqlite: SQLite 파일에서 조회 기간만 범위 검색
+STORE_BACKENDS = ('json', 'binary', 'shards', 'sqlite')
+
+# 데이터 파일 변경 확인 주기 (초)
+RELOAD_CHECK_INTERVAL = float(os.environ.get("INVESTSMART_RELOAD_INTERVAL", "5"))
+
+# 데이터 버전 문자열 길이 (원본 JSON SHA-1 앞부분)
+DATA_VERSION_LENGTH = 12
+
+# 데이터가 없을 때 돌려주는 빈 날짜 배열
+_EMPTY_DATES = np.empty(0, dtype='datetime64[D]')
+_EMPTY_DATES.flags.writeable = False
+
+# 조회 기간 -> 마지막 거래일 기준 개월 수 ("max"는 전체 기간)
+PERIOD_MONTHS = {
+    '1m': 1,
+    '3m': 3,
+    '6m': 6,
+    '1y': 12,
+    '2y': 24,
+    '3y': 36,
+    '5y': 60,
+    '10y': 120,
+}
+
+
+class SymbolBlock:
+    """
+    종목 하나의 열 단위(columnar) 데이터
+    
+    필드마다 연속된 NumPy 배열 하나를 가지며 (가격: float64, 거래량: int64,
+    신호: int8, 날짜: datetime64[D]), 모든 배열은 읽기 전용입니다.
+    주 번호(weeks, 월요일 시작 주)는 블록을 만들 때 한 번 계산해 차트가 날짜를 다시 해석하지 않도록 합니다.
+    신호별 희소 이벤트(events)는 처음 필요할 때 한 번 만들고, 기간 구간은 이벤트를 이진 탐색으로 잘라 씁니다.
+    """
+    
+    __slots__ = ('symbol', 'dates', 'weeks', 'columns', 'last_updated', '_events')
+    
+    def __init__(
+        self,
+        symbol: str,
+        dates: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        last_updated: Optional[str],
+        weeks: Optional[np.ndarray] = None,
+        events: Optional[Dict[str, SignalEvents]] = None
+    ):
+        self.symbol = symbol
+        self.dates = _readonly(dates)
+        self.weeks = _readonly(week_ids(dates).astype(np.int32) if weeks is None else weeks)
+        self.columns = {name: _readonly(values) for name, values in columns.items()}
+        self.last_updated = last_updated
+        self._events = events
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def slice(self, start: int, stop: int) -> "SymbolBlock":
+        """행 구간 [start, stop)의 뷰 (배열 복사 없음)"""
+        if start == 0 and stop >= len(self):
+            return self
+        return SymbolBlock(
+            self.symbol,
+            self.dates[start:stop],
+            {name: values[start:stop] for name, values in self.columns.items()},
+            self.last_updated,
+            self.weeks[start:stop],
+            {name: events.slice(start, stop) for name, events in self.events.items()}
+        )
+    
+    @property
+    def events(self) -> Dict[str, SignalEvents]:
+        """신호 이름 -> 희소 이벤트 (처음 조회 시 한 번 계산, 동시에 계산돼도 결과는 같음)"""
+        if self._events is None:
+            self._events = build_signal_events({name: self.columns[name] for name in SIGNAL_FIELDS if name in self.columns})
+        return self._events
+    
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 전체 바이트 수"""
+        total = self.dates.nbytes + self.weeks.nbytes + sum(values.nbytes for values in self.columns.values())
+        if self._events is not None:
+            total += sum(events.index.nbytes + events.direction.nbytes for events in self._events.values())
+        return total
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    """배열을 읽기 전용으로 표시"""
+    values.flags.writeable = False
+    return values
+
+
+# array.array 타입 코드 (COLUMN_DTYPES와 같은 크기)
+_ARRAY_TYPECODES = {np.float64: 'd', np.int64: 'q', np.int8: 'b'}
+
+# 정수 열의 허용 범위 (array.array는 자료형과 범위를 엄격히 검사하므로 넣기 전에 확인)
+_INT_LIMITS = {
+    name: (int(np.iinfo(dtype).min), int(np.iinfo(dtype).max))
+    for name, dtype in COLUMN_DTYPES.items() if np.dtype(dtype).kind == 'i'
+}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _column_value(name: str, value: Any) -> Optional[Any]:
+    """값을 열 자료형으로 변환 (null은 0, 변환할 수 없거나 범위를 넘으면 None)"""
+    if value is None:
+        return 0
+    try:
+        if name in _INT_LIMITS:
+            value = int(value)
+            low, high = _INT_LIMITS[name]
+            return value if low <= value <= high else None
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _parse_record(item: Any) -> Tuple[int, List[Any], List[str]]:
+    """
+    레코드 하나를 (1970-01-01 기준 일수, COLUMN_DTYPES 순서의 값, 0으로 채운 필드)로 변환
+    
+    숫자가 아니거나 정수 열에 NaN/범위 밖 값이 있으면 그 필드만 0으로 채웁니다.
+    
+    Raises:
+        ValueError: 종목이나 날짜가 없거나 잘못된 레코드 (건너뛸 레코드)
+    """
+    if not isinstance(item, dict) or not item.get('symbol') or not isinstance(item['symbol'], str):
+        raise ValueError("종목(symbol)이 없는 레코드")
+    try:
+        day = date.fromisoformat(str(item['date'])[:10]).toordinal() - _EPOCH_ORDINAL
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"날짜가 없거나 잘못된 레코드: {item.get('symbol')} {item.get('date')!r}") from e
+    
+    values = []
+    invalid = []
+    for name in COLUMN_DTYPES:
+        value = _column_value(name, item.get(name))
+        if value is None:
+            invalid.append(name)
+            value = 0
+        values.append(value)
+    return day, values, invalid
+
+
+class _ColumnBuffers:
+    """한 종목의 레코드를 필드별 array.array에 차례로 쌓는 버퍼"""
+    
+    __slots__ = ('symbol', 'days', 'columns', 'last_updated')
+    
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.days = array('q')
+        self.columns = {name: array(_ARRAY_TYPECODES[dtype]) for name, dtype in COLUMN_DTYPES.items()}
+        self.last_updated = None
+    
+    def append(self, day: int, values: List[Any], last_updated: Optional[str]) -> None:
+        """검증된 레코드 하나 추가 (_parse_record 결과)"""
+        self.days.append(day)
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+        if last_updated is not None:
+            self.last_updated = last_updated
+    
+    def to_block(self) -> SymbolBlock:
+        """NumPy 블록으로 변환 (날짜 오름차순 보장, 버퍼 여유 공간 없이 복사)"""
+        dates = np.frombuffer(self.days, dtype=np.int64).astype('datetime64[D]')
+        columns = {
+            name: np.frombuffer(values, dtype=COLUMN_DTYPES[name]).copy() if len(values) else np.empty(0, COLUMN_DTYPES[name])
+            for name, values in self.columns.items()
+        }
+        
+        # 기간 조회(이진 탐색)를 위해 날짜 오름차순 보장
+        if len(dates) > 1 and np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            dates = dates[order]
+            columns = {name: values[order] for name, values in columns.items()}
+        
+        return SymbolBlock(self.symbol, dates, columns, self.last_updated)
+
+
+def _build_blocks(records: Iterable[Dict]) -> Dict[str, SymbolBlock]:
+    """
+    레코드를 차례로 읽어 종목별 열 단위 블록으로 변환 (파일 내 첫 등장 순서 유지)
+    
+    잘못된 레코드 하나 때문에 전체 로드가 실패하지 않도록, 종목/날짜가 잘못된 레코드는 건너뛰고
+    잘못된 필드 값은 0으로 채운 뒤 건수만 로그로 남깁니다.
+    """
+    buffers: Dict[str, _ColumnBuffers] = {}
+    skipped = 0
+    filled = 0
+    first_error = None
+    for item in records:
+        try:
+            day, values, invalid = _parse_record(item)
+        except ValueError as e:
+            skipped += 1
+            first_error = first_error or str(e)
+            continue
+        if invalid:
+            filled += 1
+            first_error = first_error or f"{item['symbol']} {item.get('date')}: {', '.join(invalid)} 값을 0으로 채움"
+        
+        symbol = item['symbol']
+        buffer = buffers.get(symbol)
+        if buffer is None:
+            buffer = buffers[symbol] = _ColumnBuffers(symbol)
+        buffer.append(day, values, item.get('last_updated'))
+    
+    if skipped or filled:
+        logger.warning(f"잘못된 레코드: {skipped}건 건너뜀, {filled}건 일부 값을 0으로 채움 (예: {first_error})")
+    return {symbol: buffer.to_block() for symbol, buffer in buffers.items()}
+
+
+def _iter_json_array(f, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    최상위 JSON 배열의 원소를 하나씩 파싱 (파일 전체를 객체로 만들지 않음)
+    
+    chunk_size 단위로 읽으면서 JSONDecoder.raw_decode로 원소를 하나씩 꺼냅니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    started = False
+    
+    while True:
+        # 공백과 구분자 건너뛰기
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError("JSON 배열이 닫히지 않았습니다")
+            buffer = f.read(chunk_size)
+            pos = 0
+            eof = not buffer
+            continue
+        
+        if not started:
+            if buffer[pos] != '[':
+                raise ValueError("최상위 JSON 배열이 아닙니다")
+            started = True
+            pos += 1
+            continue
+        
+        if buffer[pos] == ']':
+            return
+        
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            complete = end < len(buffer) or eof
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        
+        if not complete:
+            # 원소가 청크 경계에 걸쳐 있으면 다음 청크를 이어 붙여 다시 시도
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        
+        yield item
+        pos = end
+
+
+class _HashingReader:
+    """읽은 바이트의 SHA-1을 함께 계산하면서 UTF-8 텍스트로 돌려주는 파일 래퍼"""
+    
+    def __init__(self, f):
+        self._f = f
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._digest = hashlib.sha1()
+    
+    def read(self, size: int = -1) -> str:
+        while True:
+            chunk = self._f.read(size)
+            self._digest.update(chunk)
+            text = self._decoder.decode(chunk, final=not chunk)
+            if text or not chunk:
+                return text
+    
+    def hexdigest(self) -> str:
+        """파일 끝까지 마저 읽은 뒤의 전체 해시 (파싱이 배열 끝에서 멈춰도 나머지 바이트 포함)"""
+        for chunk in iter(lambda: self._f.read(1 << 20), b''):
+            self._digest.update(chunk)
+        return self._digest.hexdigest()
+
+
+def _read_json_blocks(json_file_path: str) -> Tuple[Dict[str, SymbolBlock], Optional[str]]:
+    """
+    JSON 파일을 레코드 단위로 스트리밍하며 종목별 블록 생성
+    
+    해시는 파싱한 바이트에서 함께 계산하므로, 읽는 도중 파일이 교체되어도 데이터와 버전이 어긋나지 않습니다.
+    
+    Returns:
+        (종목 -> 블록, 파일 내용의 SHA-1 - 파일을 열 수 없으면 None)
+    """
+    try:
+        with open(json_file_path, 'rb') as f:
+            reader = _HashingReader(f)
+            try:
+                blocks = _build_blocks(_iter_json_array(reader))
+            except Exception as e:
+                logger.error(f"JSON 파일 로드 실패: {e}")
+                blocks = {}
+            return blocks, reader.hexdigest()
+    except OSError as e:
+        logger.error(f"JSON 파일 로드 실패: {e}")
+        return {}, None
+
+
+def _stream_json_blocks(json_file_path: str) -> Dict[str, SymbolBlock]:
+    """JSON 파일을 레코드 단위로 스트리밍하며 종목별 블록 생성"""
+    return _read_json_blocks(json_file_path)[0]
+
+
+def _months_before(day: date, months: int) -> date:
+    """같은 일자 기준 n개월 전 날짜 (말일은 해당 월 말일로 보정)"""
+    month_index = day.year * 12 + day.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    next_month = date(year + (month == 12), month % 12 + 1, 1)
+    last_day = (next_month - date(year, month, 1)).days
+    return date(year, month, min(day.day, last_day))
+
+
+def resolve_date_range(
+    dates: np.ndarray,
+    period: Optional[str] = "max",
+    start_date: Optional[Any] = None,
+    end_date: Optional[Any] = None
+) -> Tuple[int, int]:
+    """
+    정렬된 날짜 배열에서 조회 구간의 행 범위 계산 (이진 탐색, O(log n))
+    
+    Args:
+        dates: 오름차순 datetime64[D] 배열
+        period: "1m", "6m", "1y", "3y", "max" 등 (마지막 거래일 기준)
+        start_date: 시작일 (포함, 지정 시 period 대신 사용)
+        end_date: 종료일 (포함, 지정 시 period 대신 사용)
+    
+    Returns:
+        (시작 행, 끝 행) - 끝 행은 포함하지 않음
+    """
+    if len(dates) == 0:
+        return 0, 0
+    
+    if start_date is None and end_date is None:
+        if not period or period == 'max':
+            return 0, len(dates)
+        if period not in PERIOD_MONTHS:
+            raise ValueError(f"지원하지 않는 조회 기간입니다: {period}")
+        last_day = dates[-1].astype(date)
+        start_date = _months_before(last_day, PERIOD_MONTHS[period])
+    
+    start = 0
+    stop = len(dates)
+    if start_date is not None:
+        start = int(np.searchsorted(dates, np.datetime64(start_date, 'D'), side='left'))
+    if end_date is not None:
+        stop = int(np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right'))
+    return start, max(start, stop)
+
+
+class SignalStore:
+    """
+    프로세스 전역에서 공유되는 읽기 전용 신호 데이터
+    
+    (파일 경로, 수정 시각) 단위로 한 번만 로드되며, 모든 세션과 컴포넌트가
+    같은 인스턴스를 참조합니다. 데이터는 종목별 열 단위 블록으로 보관합니다.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        signature: Tuple[Optional[float], ...],
+        blocks: Dict[str, SymbolBlock],
+        source_path: Optional[str] = None,
+        base_version: str = 'unknown',
+        log_offset: int = 0,
+        backend: str = 'json'
+    ):
+        self.path = path
+        self.signature = signature
+        self.source_path = source_path or path
+        
+        # 저장소 방식 ('json' 또는 'binary') - 같은 데이터 버전을 공유하는 다른 방식의 캐시와 구분
+        self.backend = backend
+        
+        # 업데이트 로그(NDJSON)에서 반영한 위치
+        self.log_offset = log_offset
+        
+        # 데이터 버전 (기본 스냅샷 내용 해시 + 로그 반영 위치) - 캐시 키로 사용
+        self.base_version = base_version
+        self.version = f"{base_version}-{log_offset}" if log_offset else base_version
+        
+        # 종목 -> 열 단위 블록 인덱스
+        self.blocks = blocks
+        
+        # 미리 계산된 메타데이터
+        self.symbols: Tuple[str, ...] = tuple(sorted(blocks))
+        self.total_records = sum(len(block) for block in blocks.values())
+        self.last_updated = max((block.last_updated or '' for block in blocks.values()), default=None)
+    
+    def get_block(self, symbol: str) -> Optional[SymbolBlock]:
+        """특정 종목의 열 단위 블록 조회"""
+        return self.blocks.get(symbol)
+    
+    def describe_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 요약 (행 수, 기간, 갱신 시각) - 데이터가 없으면 None"""
+        block = self.blocks.get(symbol)
+        if block is None or len(block) == 0:
+            return None
+        return {
+            'rows': len(block),
+            'start': str(block.dates[0]),
+            'end': str(block.dates[-1]),
+            'last_updated': block.last_updated,
+        }
+    
+    def with_log_records(self, records: List[Dict], log_offset: int) -> "SignalStore":
+        """업데이트 로그 레코드를 반영한 새 저장소 (변경 없는 종목 블록은 공유)"""
+        blocks = _merge_records(self.blocks, records)
+        return SignalStore(self.path, self.signature, blocks, self.source_path, self.base_version, log_offset, self.backend)
+    
+    @property
+    def nbytes(self) -> int:
+        """전체 블록이 차지하는 바이트 수"""
+        return sum(block.nbytes for block in self.blocks.values())
+
+
+class _StoreSlot:
+    """경로별 현재 저장소와 다시 로드 상태"""
+    
+    def __init__(self):
+        self.store: Optional[SignalStore] = None
+        self.checked_at = 0.0
+        self.load_lock = threading.Lock()
+
+
+_slots_lock = threading.Lock()
+_store_slots: Dict[Tuple[str, str], _StoreSlot] = {}
+_reload_listeners: List[Callable[[SignalStore, SignalStore], None]] = []
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """파일 수정 시각 조회 (파일이 없으면 None)"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _get_signature(path: str, backend: str) -> Tuple[Optional[float], ...]:
+    """저장소 원본 파일들의 수정 시각 묶음"""
+    if backend == 'shards':
+        from utils.shard_store import default_shard_dir, manifest_path
+        return (_get_mtime(manifest_path(default_shard_dir(path))),)
+    if backend == 'sqlite':
+        from utils.sqlite_store import default_sqlite_path
+        # WAL 모드에서는 커밋이 -wal 파일에 먼저 기록되므로 함께 확인
+        db_path = default_sqlite_path(path)
+        return (_get_mtime(db_path), _get_mtime(db_path + "-wal"))
+    if backend == 'binary':
+        from utils.binary_store import default_binary_path
+        return (_get_mtime(path), _get_mtime(default_binary_path(path)))
+    return (_get_mtime(path),)
+
+
+def _load_blocks(path: str, use_binary: bool) -> Tuple[Dict[str, SymbolBlock], str, str]:
+    """
+    종목별 블록 로드
+    
+    최신 바이너리 파일이 있으면 메모리 맵으로 열고, 없거나 오래된 경우 JSON을 파싱합니다.
+    
+    Returns:
+        (종목 -> 블록, 실제로 읽은 파일 경로, 데이터 버전)
+    """
+    from utils.binary_store import default_binary_path, is_binary_fresh, load_binary_blocks, read_binary_header
+    
+    if use_binary:
+        binary_path = default_binary_path(path)
+        if os.path.exists(binary_path):
+            try:
+                header = read_binary_header(binary_path)
+                if is_binary_fresh(header, path):
+                    version = (header.get('source') or {}).get('sha1') or 'unknown'
+                    return load_binary_blocks(binary_path, header), binary_path, version[:DATA_VERSION_LENGTH]
+                logger.warning(f"바이너리 파일이 원본 JSON보다 오래되어 JSON을 사용합니다: {binary_path}")
+            except Exception as e:
+                logger.error(f"바이너리 파일 로드 실패, JSON을 사용합니다: {e}")
+    
+    blocks, digest = _read_json_blocks(path)
+    return blocks, path, (digest or 'empty')[:DATA_VERSION_LENGTH]
+
+
+def register_reload_listener(callback: Callable[[SignalStore, SignalStore], None]) -> None:
+    """
+    데이터 교체 시 호출할 콜백 등록
+    
+    콜백은 (이전 저장소, 새 저장소)를 받으며, 이전 버전에 의존하는 캐시를 비우는 데 사용합니다.
+    """
+    _reload_listeners.append(callback)
+
+
+def _merge_block(base: SymbolBlock, extra: SymbolBlock) -> SymbolBlock:
+    """기존 블록 뒤에 새 행을 합침 (같은 날짜는 새 행이 우선)"""
+    dates = np.concatenate([base.dates, extra.dates])
+    columns = {name: np.concatenate([values, extra.columns[name]]) for name, values in base.columns.items()}
+    
+    # 일반적인 일일 추가(마지막 날짜 이후)는 정렬 없이 이어 붙이기만 함
+    if np.any(dates[1:] <= dates[:-1]):
+        order = np.argsort(dates, kind='stable')
+        dates = dates[order]
+        keep = np.ones(len(dates), dtype=bool)
+        keep[:-1] = dates[1:] != dates[:-1]
+        dates = dates[keep]
+        columns = {name: values[order][keep] for name, values in columns.items()}
+    
+    return SymbolBlock(base.symbol, dates, columns, extra.last_updated or base.last_updated)
+
+
+def _merge_records(blocks: Dict[str, SymbolBlock], records: List[Dict]) -> Dict[str, SymbolBlock]:
+    """새 레코드를 반영한 블록 사전 (변경되지 않은 종목의 블록은 그대로 공유)"""
+    delta = _build_blocks(records)
+    if not delta:
+        return blocks
+    
+    merged = dict(blocks)
+    for symbol, extra in delta.items():
+        base = blocks.get(symbol)
+        merged[symbol] = extra if base is None else _merge_block(base, extra)
+    return merged
+
+
+@timed("store.load")
+def _create_store(path: str, backend: str):
+    """파일에서 새 저장소 생성 (기본 스냅샷 + 업데이트 로그)"""
+    from utils.ndjson_log import default_log_path, read_log
+    
+    # 로드 도중 파일이 또 바뀌어도 다음 확인 때 감지되도록 시그니처를 먼저 기록
+    signature = _get_signature(path, backend)
+    records, log_offset = read_log(default_log_path(path))
+    
+    if backend == 'shards':
+        from utils.shard_store import LazyShardStore
+        return LazyShardStore(path, signature, records, log_offset)
+    if backend == 'sqlite':
+        from utils.sqlite_store import SQLiteSignalStore
+        return SQLiteSignalStore(path, signature, records, log_offset)
+    
+    blocks, source_path, version = _load_blocks(path, backend == 'binary')
+    blocks = _merge_records(blocks, records)
+    
+    store = SignalStore(path, signature, blocks, source_path, version, log_offset, backend)
+    logger.info(
+        f"신호 데이터 로드 완료: {source_path} (로그 {len(records)}건 반영, 총 {store.total_records}건, "
+        f"{store.nbytes:,} bytes, 버전 {store.version})"
+    )
+    return store
+
+
+@timed("store.tail")
+def _tail_store(store):
+    """업데이트 로그에 새로 추가된 줄만 읽어 반영한 새 저장소 (새 행 수에 비례하는 비용)"""
+    from utils.ndjson_log import default_log_path, read_log
+    
+    records, log_offset = read_log(default_log_path(store.path), store.log_offset)
+    if log_offset == store.log_offset:
+        return store
+    
+    logger.info(f"업데이트 로그 {len(records)}건 반영: {store.path}")
+    return store.with_log_records(records, log_offset)
+
+
+def _needs_reload(store, backend: str) -> Tuple[bool, bool]:
+    """(기본 스냅샷 변경 여부, 업데이트 로그 변경 여부)"""
+    from utils.ndjson_log import default_log_path, get_log_size
+    
+    base_changed = _get_signature(store.path, backend) != store.signature
+    log_changed = get_log_size(default_log_path(store.path)) != store.log_offset
+    return base_changed, log_changed
+
+
+def _reload_store(slot: _StoreSlot, path: str, backend: str) -> None:
+    """백그라운드에서 새 저장소를 로드한 뒤 교체 (slot.load_lock을 잡은 상태로 호출)"""
+    from utils.ndjson_log import default_log_path, get_log_size
+    
+    try:
+        old_store = slot.store
+        base_changed, _ = _needs_reload(old_store, backend)
+        
+        # 기본 스냅샷은 그대로이고 로그만 늘었으면 새 줄만 반영, 그 외에는 전체 로드
+        if not base_changed and get_log_size(default_log_path(path)) >= old_store.log_offset:
+            new_store = _tail_store(old_store)
+        else:
+            new_store = _create_store(path, backend)
+        
+        # 파일을 쓰는 도중 읽어서 비어 있으면 기존 데이터를 유지하고 다음 확인 때 다시 시도
+        if old_store is not None and old_store.total_records and not new_store.total_records:
+            logger.warning(f"새 신호 데이터가 비어 있어 기존 데이터를 유지합니다: {path}")
+            return
+        
+        slot.store = new_store
+        if old_store is not None and old_store.version != new_store.version:
+            logger.info(f"신호 데이터 교체: {old_store.version} -> {new_store.version}")
+            for callback in list(_reload_listeners):
+                try:
+                    callback(old_store, new_store)
+                except Exception as e:
+                    logger.error(f"데이터 교체 콜백 실패: {e}")
+    except Exception as e:
+        logger.error(f"신호 데이터 다시 로드 실패: {e}")
+    finally:
+        slot.load_lock.release()
+
+
+def get_shared_store(
+    json_file_path: str = "signals_data.json",
+    use_binary: bool = True,
+    backend: Optional[str] = None
+):
+    """
+    공유 신호 데이터 저장소 조회
+    
+    Args:
+        json_file_path: 신호 데이터 JSON 파일 경로
+        use_binary: backend를 지정하지 않았을 때 최신 .bin 파일 사용 여부
+        backend: 'json', 'binary', 'shards' (종목별 파일을 필요할 때만 로드),
+                 'sqlite' (SQLite 파일에서 조회 기간만 읽음)
+    
+    처음 한 번만 로드를 기다리고, 이후에는 RELOAD_CHECK_INTERVAL 초마다 파일 수정 시각과
+    업데이트 로그 크기를 확인합니다. 변경이 있으면 백그라운드 스레드 하나가 새 데이터를
+    로드(로그만 늘었으면 새 줄만 반영)해 통째로 교체하며, 그동안 다른 요청은 기존 저장소를
+    그대로 사용합니다 (동시 재파싱 없음).
+    """
+    path = os.path.abspath(json_file_path)
+    backend = backend or ('binary' if use_binary else 'json')
+    if backend not in STORE_BACKENDS:
+        raise ValueError(f"지원하지 않는 저장소 방식입니다: {backend}")
+    key = (path, backend)
+    
+    with _slots_lock:
+        slot = _store_slots.get(key)
+        if slot is None:
+            slot = _store_slots[key] = _StoreSlot()
+    
+    store = slot.store
+    if store is None:
+        # 최초 로드는 한 스레드만 수행하고 나머지는 완료를 기다림
+        with slot.load_lock:
+            if slot.store is None:
+                slot.store = _create_store(path, backend)
+                slot.checked_at = time.monotonic()
+            return slot.store
+    
+    now = time.monotonic()
+    if now - slot.checked_at < RELOAD_CHECK_INTERVAL:
+        return store
+    slot.checked_at = now
+    
+    if any(_needs_reload(store, backend)) and slot.load_lock.acquire(blocking=False):
+        threading.Thread(
+            target=_reload_store,
+            args=(slot, path, backend),
+            name="signals-reload",
+            daemon=True
+        ).start()
+    return store
+
+
+def _slice_block(
+    store: SignalStore,
+    symbol: str,
+    period: str,
+    start_date: Optional[Any],
+    end_date: Optional[Any]
+) -> Optional[SymbolBlock]:
+    """저장소에서 종목 블록의 조회 기간 구간 추출"""
+    # 조회 기간만 읽을 수 있는 저장소(sqlite)는 전체 블록을 만들지 않음
+    get_range = getattr(store, 'get_range', None)
+    if get_range is not None:
+        return get_range(symbol, period, start_date, end_date)
+    
+    block = store.get_block(symbol)
+    if block is None:
+        return None
+    start, stop = resolve_date_range(block.dates, period, start_date, end_date)
+    return block.slice(start, stop)
+
 
 class InvestSmartJSONClient:
     """InvestSmart JSON 데이터 클라이언트"""
     
-    def __init__(self, json_file_path: str = "signals_data.json"):
+    def __init__(
+        self,
+        json_file_path: str = "signals_data.json",
+        use_binary: bool = True,
+        backend: Optional[str] = None
+    ):
+        """
+        Args:
+            json_file_path: 신호 데이터 JSON 파일 경로
+            use_binary: 같은 이름의 최신 .bin 파일이 있으면 메모리 맵으로 사용
+            backend: 저장소 방식 직접 지정 ('json', 'binary', 'shards', 'sqlite')
+                     'shards'는 종목을 처음 조회할 때 로드하고 LRU로 메모리 사용량을 제한
+                     'sqlite'는 (종목, 날짜) 인덱스로 조회 기간의 행만 읽음
+                     (기본값: 환경 변수 INVESTSMART_STORE_BACKEND)
+        """
         self.json_file_path = json_file_path
-        self.data = self._load_json_data()
+        self.use_binary = use_binary
+        self.backend = backend or os.environ.get("INVESTSMART_STORE_BACKEND") or None
+        self._load_json_data()
     
-    def _load_json_data(self) -> List[Dict]:
-        """JSON 파일에서 데이터 로드"""
-        try:
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"JSON 파일 로드 실패: {e}")
-            return []
+    @timed("store.resolve")
+    def _load_json_data(self):
+        """공유 저장소에서 데이터 로드 (프로세스당 한 번만 파싱)"""
+        return get_shared_store(self.json_file_path, self.use_binary, self.backend)
+    
+    @property
+    def store(self):
+        """
+        현재 공유 저장소
+        
+        데이터 파일이 교체되면 새 저장소를 가리키므로, 한 요청 안에서는
+        한 번 받아 둔 저장소를 계속 사용해야 버전이 섞이지 않습니다.
+        """
+        return self._load_json_data()
     
-    def get_signals_data(self, symbol: str, period: str = "1y") -> Dict[str, Any]:
-        """특정 종목의 신호 데이터 조회"""
+    @timed("signals.get_signals_data")
+    def get_signals_data(
+        self,
+        symbol: str,
+        period: str = "1y",
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        특정 종목의 신호 데이터 조회
+        
+        결과는 리스트와 문자열만으로 이루어져 JSON 직렬화/피클이 가능합니다.
+        NumPy 배열(datetime64[D] 날짜, 주 번호, 신호 이벤트)이 필요하면 get_signals_view를 사용하세요.
+        
+        Args:
+            symbol: 종목 심볼
+            period: 조회 기간 ("1m", "6m", "1y", "3y", "max" 등, 마지막 거래일 기준)
+            start_date: 시작일 'YYYY-MM-DD' (지정 시 period 대신 사용)
+            end_date: 종료일 'YYYY-MM-DD' (지정 시 period 대신 사용)
+        """
         try:
-            # 특정 종목 데이터 필터링
-            symbol_data = [item for item in self.data if item.get('symbol') == symbol]
+            # 종목 인덱스로 해당 블록의 기간 구간만 조회
+            store = self.store
+            block = _slice_block(store, symbol, period, start_date, end_date)
             
-            if not symbol_data:
+            if block is None or len(block) == 0:
                 return {
                     'symbol': symbol,
                     'dates': [],
@@ -42,31 +813,14 @@ class InvestSmartJSONClient:
                     'error': '데이터를 찾을 수 없습니다'
                 }
             
-            # 데이터 구조화
-            dates = [item['date'] for item in symbol_data]
-            
-            # 주가 데이터
-            stock_data = {
-                'open': [item.get('open', 0) for item in symbol_data],
-                'high': [item.get('high', 0) for item in symbol_data],
-                'low': [item.get('low', 0) for item in symbol_data],
-                'close': [item.get('close', 0) for item in symbol_data],
-                'volume': [item.get('volume', 0) for item in symbol_data]
-            }
-            
-            # 신호 데이터
-            signals_data = {
-                'short_signal_v1': [item.get('short_signal_v1', 0) for item in symbol_data],
-                'short_signal_v2': [item.get('short_signal_v2', 0) for item in symbol_data],
-                'long_signal': [item.get('long_signal', 0) for item in symbol_data],
-                'combined_signal_v1': [item.get('combined_signal_v1', 0) for item in symbol_data],
-                'macd_signal': [item.get('macd_signal', 0) for item in symbol_data],
-                'momentum_color_signal': [item.get('momentum_color_signal', 0) for item in symbol_data],
-            }
+            # 데이터 구조화 (열 단위 배열을 그대로 리스트로 변환)
+            dates = np.datetime_as_string(block.dates).tolist()
+            stock_data = {field: block.columns[field].tolist() for field in PRICE_FIELDS}
+            signals_data = {name: block.columns[name].tolist() for name in SIGNAL_FIELDS}
             
             # 지표 데이터
             indicators_data = {
-                'Final_Composite_Value': [item.get('fcv', 0) for item in symbol_data]
+                'Final_Composite_Value': block.columns['fcv'].tolist()
             }
             
             return {
@@ -76,7 +830,8 @@ class InvestSmartJSONClient:
                 'signals': signals_data,
                 'indicators': indicators_data,
                 'trendlines': [],  # 추세선 데이터 (나중에 추가 예정)
-                'last_updated': symbol_data[-1].get('last_updated', dates[-1]) if symbol_data else None
+                'last_updated': block.last_updated or dates[-1],
+                'data_version': store.version
             }
             
         except Exception as e:
@@ -89,29 +844,89 @@ class InvestSmartJSONClient:
                 'error': f'데이터 조회 실패: {e}'
             }
     
-    def get_available_symbols(self) -> List[str]:
-        """사용 가능한 종목 목록 조회"""
+    @timed("signals.get_signals_view")
+    def get_signals_view(
+        self,
+        symbol: str,
+        period: str = "1y",
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None
+    ) -> Mapping[str, Any]:
+        """
+        get_signals_data와 같은 구조이지만 리스트 변환 없이 읽기 전용 NumPy 뷰로 조회
+        
+        'dates'도 datetime64[D] 배열이며, 결과 사전은 수정할 수 없습니다 (여러 세션이 공유).
+        """
         try:
-            symbols = list(set([item.get('symbol') for item in self.data if item.get('symbol')]))
-            return sorted(symbols)
+            store = self.store
+            block = _slice_block(store, symbol, period, start_date, end_date)
+            
+            if block is None or len(block) == 0:
+                return MappingProxyType({
+                    'symbol': symbol,
+                    'dates': block.dates if block is not None else _EMPTY_DATES,
+                    'signals': MappingProxyType({}),
+                    'indicators': MappingProxyType({}),
+                    'error': '데이터를 찾을 수 없습니다'
+                })
+            
+            return MappingProxyType({
+                'symbol': symbol,
+                'dates': block.dates,
+                'date_values': block.dates,
+                'week_ids': block.weeks,
+                'signal_events': MappingProxyType(block.events),
+                'data': MappingProxyType({field: block.columns[field] for field in PRICE_FIELDS}),
+                'signals': MappingProxyType({name: block.columns[name] for name in SIGNAL_FIELDS}),
+                'indicators': MappingProxyType({'Final_Composite_Value': block.columns['fcv']}),
+                'trendlines': (),
+                'last_updated': block.last_updated or str(block.dates[-1]),
+                'data_version': store.version
+            })
+            
         except Exception as e:
-            logger.error(f"종목 목록 조회 실패: {e}")
-            return []
+            logger.error(f"신호 데이터 조회 실패: {symbol}, {e}")
+            return MappingProxyType({
+                'symbol': symbol,
+                'dates': _EMPTY_DATES,
+                'signals': MappingProxyType({}),
+                'indicators': MappingProxyType({}),
+                'error': f'데이터 조회 실패: {e}'
+            })
+    
+    @property
+    def data_version(self) -> str:
+        """현재 데이터 버전 (데이터가 바뀌면 달라짐)"""
+        return self.store.version
+    
+    def get_columnar_data(
+        self,
+        symbol: str,
+        period: str = "max",
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None
+    ) -> Optional[SymbolBlock]:
+        """
+        특정 종목의 열 단위 데이터 조회
+        
+        Returns:
+            읽기 전용 NumPy 배열로 구성된 SymbolBlock (데이터가 없으면 None)
+        """
+        return _slice_block(self.store, symbol, period, start_date, end_date)
+    
+    def get_available_symbols(self) -> List[str]:
+        """사용 가능한 종목 목록 조회"""
+        return list(self.store.symbols)
     
     def get_data_info(self) -> Dict[str, Any]:
         """데이터 정보 조회"""
-        try:
-            if not self.data:
-                return {'total_records': 0, 'symbols': [], 'last_updated': None}
-            
-            symbols = list(set([item.get('symbol') for item in self.data if item.get('symbol')]))
-            last_updated = max([item.get('last_updated', '') for item in self.data])
-            
-            return {
-                'total_records': len(self.data),
-                'symbols': sorted(symbols),
-                'last_updated': last_updated
-            }
-        except Exception as e:
-            logger.error(f"데이터 정보 조회 실패: {e}")
-            return {'total_records': 0, 'symbols': [], 'last_updated': None}
\ No newline at end of file
+        store = self.store
+        if not store.total_records:
+            return {'total_records': 0, 'symbols': [], 'last_updated': None}
+        
+        return {
+            'total_records': store.total_records,
+            'symbols': list(store.symbols),
+            'last_updated': store.last_updated,
+            'data_version': store.version
+        }
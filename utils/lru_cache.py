@@ -0,0 +1,107 @@
+"""
+크기 제한 LRU 캐시
+항목 수 또는 바이트 크기 기준으로 오래된 항목을 내보내는 스레드 안전 캐시
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class BoundedLRUCache:
+    """
+    크기 제한이 있는 LRU 캐시 (프로세스 전역 공유용, 스레드 안전)
+
+    Args:
+        max_items: 최대 항목 수 (None이면 제한 없음)
+        max_bytes: 최대 총 크기 (None이면 제한 없음)
+        sizeof: 항목 크기(bytes) 계산 함수 (max_bytes 사용 시 필요)
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """항목 조회 (조회된 항목은 가장 최근으로 이동)"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """항목 조회 (순서와 적중/실패 통계를 바꾸지 않음)"""
+        with self._lock:
+            return self._items.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """항목 저장 후 제한을 넘으면 오래된 항목부터 제거"""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self.total_bytes -= self._sizes.pop(key)
+                del self._items[key]
+            self._items[key] = value
+            self._sizes[key] = size
+            self.total_bytes += size
+            self._evict()
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """키 조건에 맞는 항목 제거 (제거된 개수 반환)"""
+        with self._lock:
+            keys = [key for key in self._items if predicate(key)]
+            for key in keys:
+                self.total_bytes -= self._sizes.pop(key)
+                del self._items[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (항목 수, 크기, 적중/실패/제거 횟수)"""
+        with self._lock:
+            return {
+                'items': len(self._items),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def _evict(self) -> None:
+        """제한을 넘는 동안 가장 오래된 항목 제거 (가장 최근 항목 하나는 유지)"""
+        while len(self._items) > 1 and (
+            (self.max_items is not None and len(self._items) > self.max_items)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            key, _ = self._items.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(key)
+            self.evictions += 1
@@ -0,0 +1,181 @@
+"""
+NDJSON 추가 전용(append-only) 업데이트 로그
+일일 데이터는 기본 스냅샷(signals_data.json)을 다시 쓰지 않고 로그 끝에 레코드 한 줄씩 추가합니다.
+
+- 로드 시: 기본 스냅샷 + 로그를 병합 (같은 종목/날짜는 로그가 우선)
+- 서비스 중: 로그에 새로 추가된 줄만 읽어 메모리 저장소에 반영
+- 압축(compact): 병합 결과를 새 기본 스냅샷으로 저장하고 로그를 비움
+
+사용법:
+    python -m utils.ndjson_log append new_rows.json [--json signals_data.json]
+    python -m utils.ndjson_log compact [--json signals_data.json]
+"""
+import argparse
+import json
+import logging
+import os
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def default_log_path(json_file_path: str) -> str:
+    """기본 스냅샷에 대응하는 업데이트 로그 경로"""
+    return os.path.splitext(json_file_path)[0] + ".ndjson"
+
+
+def get_log_size(log_path: str) -> int:
+    """로그 파일 크기 (파일이 없으면 0)"""
+    try:
+        return os.stat(log_path).st_size
+    except OSError:
+        return 0
+
+
+def read_log(log_path: str, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    로그의 offset 이후 완성된 줄만 읽기
+
+    마지막 줄이 아직 쓰는 중이라 줄바꿈으로 끝나지 않았다면 다음에 다시 읽도록 남겨 둡니다.
+    레코드는 기본 스냅샷과 같은 규칙(_parse_record)으로 검사해, 종목/날짜가 잘못된 줄은 버리고
+    잘못된 필드 값은 0으로 채워지도록 로그에 남깁니다. 버린 줄도 읽은 것으로 보고 위치를 넘깁니다.
+
+    Returns:
+        (레코드 목록, 다음에 읽을 위치)
+    """
+    from utils.json_client import _parse_record
+
+    try:
+        with open(log_path, 'rb') as f:
+            f.seek(offset)
+            chunk = f.read()
+    except OSError:
+        return [], offset
+
+    end = chunk.rfind(b'\n') + 1
+    records = []
+    for line_no, line in enumerate(chunk[:end].splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            _, _, invalid = _parse_record(record)
+        except ValueError as e:
+            logger.error(f"업데이트 로그 줄 건너뜀 (offset {offset}, {line_no}번째 줄): {e}")
+            continue
+        if invalid:
+            logger.warning(f"업데이트 로그 값 오류 (offset {offset}, {line_no}번째 줄): {', '.join(invalid)} 값을 0으로 채움")
+        records.append(record)
+    return records, offset + end
+
+
+def append_records(records: Iterable[Dict[str, Any]], log_path: str) -> int:
+    """
+    레코드를 로그 끝에 추가 (새 레코드 수에 비례하는 비용)
+
+    모든 줄을 한 번에 써서, 읽는 쪽이 레코드 일부만 보는 일이 없도록 합니다.
+
+    Returns:
+        추가한 레코드 수
+    """
+    lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+    if lines:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write("".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+    return len(lines)
+
+
+def iter_block_records(blocks: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """종목별 블록을 원래 JSON 레코드 형태로 되돌리기"""
+    for symbol, block in blocks.items():
+        dates = np.datetime_as_string(block.dates).tolist()
+        columns = {name: values.tolist() for name, values in block.columns.items()}
+        for i, day in enumerate(dates):
+            record = {'symbol': symbol, 'date': day}
+            for name, values in columns.items():
+                record[name] = values[i]
+            record['last_updated'] = block.last_updated
+            yield record
+
+
+def compact(json_file_path: str = "signals_data.json") -> int:
+    """
+    기본 스냅샷과 로그를 병합해 새 스냅샷으로 저장하고 로그를 비움
+
+    바이너리 파일(.bin), 종목별 샤드, SQLite 파일이 있었다면 새 스냅샷 기준으로 다시 만듭니다.
+
+    Returns:
+        새 스냅샷의 레코드 수
+    """
+    from utils.binary_store import convert_json_to_binary, default_binary_path
+    from utils.json_client import _create_store
+    from utils.shard_store import build_shards, default_shard_dir
+    from utils.sqlite_store import build_sqlite, default_sqlite_path
+
+    log_path = default_log_path(json_file_path)
+    store = _create_store(os.path.abspath(json_file_path), 'binary')
+
+    tmp_path = json_file_path + ".tmp"
+    count = 0
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("[")
+        for record in iter_block_records(store.blocks):
+            f.write(",\n  " if count else "\n  ")
+            f.write(json.dumps(record, ensure_ascii=False))
+            count += 1
+        f.write("\n]")
+
+    # 로그를 읽은 위치 이후에 추가된 줄은 새 로그로 옮김
+    remaining = b''
+    if os.path.exists(log_path):
+        with open(log_path, 'rb') as f:
+            f.seek(store.log_offset)
+            remaining = f.read()
+
+    os.replace(tmp_path, json_file_path)
+    if os.path.exists(log_path):
+        tmp_log = log_path + ".tmp"
+        with open(tmp_log, 'wb') as f:
+            f.write(remaining)
+        os.replace(tmp_log, log_path)
+
+    if os.path.exists(default_binary_path(json_file_path)):
+        convert_json_to_binary(json_file_path)
+    if os.path.isdir(default_shard_dir(json_file_path)):
+        build_shards(json_file_path)
+    if os.path.exists(default_sqlite_path(json_file_path)):
+        build_sqlite(json_file_path)
+
+    logger.info(f"스냅샷 압축 완료: {json_file_path} ({count}건)")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신호 데이터 NDJSON 업데이트 로그 관리")
+    parser.add_argument('command', choices=['append', 'compact'], help="append: 레코드 추가, compact: 스냅샷으로 병합")
+    parser.add_argument('records_file', nargs='?', help="추가할 레코드 파일 (JSON 배열 또는 NDJSON)")
+    parser.add_argument('--json', default="signals_data.json", help="기본 스냅샷 JSON 파일")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'append':
+        if not args.records_file:
+            parser.error("append에는 레코드 파일이 필요합니다")
+        with open(args.records_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if text.lstrip().startswith('['):
+            records = json.loads(text)
+        else:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        count = append_records(records, default_log_path(args.json))
+        logger.info(f"업데이트 로그에 {count}건 추가: {default_log_path(args.json)}")
+    else:
+        compact(args.json)
+
+
+if __name__ == "__main__":
+    main()
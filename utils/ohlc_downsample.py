@@ -0,0 +1,76 @@
+"""
+OHLC 다운샘플링
+표시할 봉 수가 예산을 넘으면 일봉을 주봉/월봉으로 묶어 차트 데이터 크기를 제한 (NumPy 벡터 연산, Streamlit 의존성 없음)
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+# 봉 단위 -> 설명 (차트 주석용)
+FREQUENCY_LABELS = {
+    'W': '주봉',
+    'M': '월봉',
+}
+
+
+def bucket_ids(dates: np.ndarray, weeks: np.ndarray, frequency: str) -> np.ndarray:
+    """날짜별 묶음 번호 ('W': 월요일 시작 주, 'M': 달력 월)"""
+    if frequency == 'W':
+        return np.asarray(weeks)
+    if frequency == 'M':
+        return np.asarray(dates).astype('datetime64[M]').astype(np.int64)
+    raise ValueError(f"지원하지 않는 봉 단위입니다: {frequency}")
+
+
+def _count_buckets(buckets: np.ndarray) -> int:
+    """정렬된 묶음 번호의 고유 개수"""
+    if len(buckets) == 0:
+        return 0
+    return 1 + int(np.count_nonzero(buckets[1:] != buckets[:-1]))
+
+
+def choose_frequency(dates: np.ndarray, weeks: np.ndarray, max_bars: int) -> Optional[str]:
+    """
+    봉 수가 max_bars 이하가 되는 가장 촘촘한 봉 단위
+
+    Returns:
+        None (일봉 그대로), 'W' 또는 'M' (월봉도 예산을 넘으면 'M')
+    """
+    if len(dates) <= max_bars:
+        return None
+    if _count_buckets(bucket_ids(dates, weeks, 'W')) <= max_bars:
+        return 'W'
+    return 'M'
+
+
+def downsample_ohlc(
+    dates: np.ndarray,
+    open_prices,
+    high_prices,
+    low_prices,
+    close_prices,
+    buckets: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    같은 묶음 번호의 연속된 일봉을 봉 하나로 합침 (dates는 오름차순)
+
+    시가는 첫 날, 종가는 마지막 날, 고가/저가는 구간 최대/최소이며 봉 날짜는 구간 첫 거래일입니다.
+
+    Returns:
+        {'dates', 'open', 'high', 'low', 'close', 'bar_index'}
+        bar_index는 일봉 위치 -> 합쳐진 봉 위치 (시그널 마커를 봉에 맞추는 데 사용)
+    """
+    is_start = np.empty(len(buckets), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = buckets[1:] != buckets[:-1]
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], len(buckets)) - 1
+
+    return {
+        'dates': np.asarray(dates)[starts],
+        'open': np.asarray(open_prices, dtype=np.float64)[starts],
+        'high': np.maximum.reduceat(np.asarray(high_prices, dtype=np.float64), starts),
+        'low': np.minimum.reduceat(np.asarray(low_prices, dtype=np.float64), starts),
+        'close': np.asarray(close_prices, dtype=np.float64)[ends],
+        'bar_index': np.cumsum(is_start) - 1,
+    }
@@ -0,0 +1,143 @@
+"""
+성능 측정
+구간(span)별 소요 시간과 부가 정보(결과 크기 등)를 기록하고, Streamlit 실행(rerun)마다 한 줄 요약을 로그로 남기는 모듈
+
+환경 변수 INVESTSMART_PERF=1일 때만 동작하며, 꺼져 있으면 timed 데코레이터는 원래 함수를 그대로 돌려주고
+span은 아무것도 기록하지 않는 빈 컨텍스트를 돌려줍니다.
+
+사용 예:
+    with span("chart.build", symbol=symbol) as info:
+        fig = build()
+        info['traces'] = len(fig.data)
+
+로그 예 (logger utils.perf, INFO):
+    perf {"step": 3, "symbol": "TLT", "total_ms": 84.2, "spans": [{"name": "chart.build", "ms": 41.3, "symbol": "TLT", ...}]}
+"""
+import functools
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 측정 활성화 여부 (프로세스 시작 시 한 번 결정)
+PERF_ENABLED = os.environ.get("INVESTSMART_PERF", "0") not in ("", "0", "false", "False")
+
+# 현재 실행(rerun)에서 모은 구간 기록 (실행 밖이면 None - 구간마다 바로 로그)
+_current_spans: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("investsmart_perf_spans", default=None)
+
+
+class _NullSpan:
+    """측정이 꺼져 있을 때 사용하는 빈 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Dict[str, Any]:
+        return {}
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """시작/종료 시각과 부가 정보를 기록하는 구간"""
+
+    __slots__ = ('name', 'fields', 'start')
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name = name
+        self.fields = fields
+        self.start = 0.0
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.start = time.perf_counter()
+        return self.fields
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        if exc_type is not None:
+            self.fields['error'] = exc_type.__name__
+        record = {'name': self.name, 'ms': round(elapsed_ms, 2), **self.fields}
+
+        spans = _current_spans.get()
+        if spans is None:
+            logger.info("perf span " + json.dumps(record, ensure_ascii=False, default=str))
+        else:
+            spans.append(record)
+        return False
+
+
+def span(name: str, **fields: Any):
+    """
+    측정 구간 컨텍스트
+
+    with 블록 안에서 돌려받은 사전에 값을 넣으면 기록에 함께 남습니다.
+    측정이 꺼져 있으면 빈 사전만 돌려주므로, 크기 계산처럼 비싼 값은 PERF_ENABLED로 확인한 뒤 넣습니다.
+    """
+    if not PERF_ENABLED:
+        return _NULL_SPAN
+    return _Span(name, fields)
+
+
+def timed(name: str) -> Callable:
+    """함수 전체를 측정 구간으로 감싸는 데코레이터 (측정이 꺼져 있으면 원래 함수 그대로)"""
+    def decorator(func: Callable) -> Callable:
+        if not PERF_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _RerunSummary:
+    """한 번의 실행 동안 구간을 모았다가 끝날 때 요약 한 줄을 로그로 남김"""
+
+    __slots__ = ('fields', 'start', 'token')
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+        self.start = 0.0
+        self.token = None
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.start = time.perf_counter()
+        self.token = _current_spans.set([])
+        return self.fields
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # st.stop()/st.rerun()도 예외로 끝나므로 항상 요약을 남김
+        spans = _current_spans.get() or []
+        _current_spans.reset(self.token)
+        # 구간 이름별 합계 (같은 구간이 여러 번 호출된 경우 한눈에 보기 위함)
+        totals: Dict[str, Dict[str, float]] = {}
+        for record in spans:
+            total = totals.setdefault(record['name'], {'count': 0, 'ms': 0.0})
+            total['count'] += 1
+            total['ms'] = round(total['ms'] + record['ms'], 2)
+        summary = {
+            **self.fields,
+            'total_ms': round((time.perf_counter() - self.start) * 1000, 2),
+            'totals': totals,
+            'spans': spans,
+        }
+        if exc_type is not None:
+            summary['exit'] = exc_type.__name__
+        logger.info("perf " + json.dumps(summary, ensure_ascii=False, default=str))
+        return False
+
+
+def rerun_summary(**fields: Any):
+    """Streamlit 실행 한 번을 감싸는 요약 컨텍스트 (측정이 꺼져 있으면 빈 컨텍스트)"""
+    if not PERF_ENABLED:
+        return _NULL_SPAN
+    return _RerunSummary(fields)
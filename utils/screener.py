@@ -0,0 +1,198 @@
+"""
+시그널 스크리너
+전체 종목의 최신 상태(마지막 봉, 신호별 마지막 매수 신호, 현재 FCV 국면)를 데이터 버전당 한 번 계산하는 모듈
+
+표는 종목당 한 행이므로 "오늘 새 신호가 나온 종목" 같은 조회는 종목 수에 비례하는 한 번의 훑기로 끝나며,
+종목별 데이터 조회나 차트 생성이 필요 없습니다.
+표를 만들 때는 종목마다 최근 구간만 읽고 (sqlite는 범위 검색, shards는 LRU를 거치지 않는 메모리 맵),
+신호별 마지막 위치는 그 구간의 희소 이벤트(SymbolBlock.events)에서 바로 읽습니다.
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utils.signal_markers import REVERSAL_SIGNALS
+
+logger = logging.getLogger(__name__)
+
+# FCV 국면 기준 (차트 배경과 같은 기준: 0.5 이상 강세, -0.5 이하 약세)
+FCV_BULLISH_THRESHOLD = 0.5
+FCV_BEARISH_THRESHOLD = -0.5
+
+FCV_REGIMES = ('강세', '중립', '약세')
+
+# 스크리너가 보는 최근 봉 수 (이보다 오래된 신호는 표에 "-"로 표시)
+SCREENER_MAX_BARS = 250
+
+# 종목별로 읽는 최근 구간 (일) - SCREENER_MAX_BARS봉에 반전 신호 확인 구간을 더한 봉 수를
+# 주 5거래일 기준 달력 일수로 바꾸고 휴장일 여유를 둠
+SCREENER_WINDOW_DAYS = (SCREENER_MAX_BARS + max(lookback for _, lookback in REVERSAL_SIGNALS.values())) * 7 // 5 + 30
+
+
+def fcv_regime(fcv: float) -> str:
+    """FCV 값의 국면"""
+    if fcv >= FCV_BULLISH_THRESHOLD:
+        return '강세'
+    if fcv <= FCV_BEARISH_THRESHOLD:
+        return '약세'
+    return '중립'
+
+
+def _latest_signal(block, signal_name: str) -> Dict[str, Any]:
+    """
+    신호 하나의 마지막 매수 신호 (날짜, 마지막 봉 기준 몇 봉 전인지, 반전 신호면 확인 여부)
+
+    반전 신호는 차트의 "BUY!!"와 같이 직전 lookback 봉 안에 같은 그룹 매수 신호가 있었는지 확인합니다.
+    """
+    events = block.events.get(signal_name)
+    positions = events.positions() if events is not None else ()
+    if len(positions) == 0 or len(block) - 1 - int(positions[-1]) >= SCREENER_MAX_BARS:
+        return {'last_date': None, 'bars_since': None, 'confirmed': False}
+
+    last = int(positions[-1])
+    confirmed = False
+    if signal_name in REVERSAL_SIGNALS:
+        group_signal, lookback = REVERSAL_SIGNALS[signal_name]
+        group_events = block.events.get(group_signal)
+        if group_events is not None:
+            confirmed = bool(group_events.recent_mask(np.array([last]), lookback)[0])
+    return {
+        'last_date': str(block.dates[last]),
+        'bars_since': len(block) - 1 - last,
+        'confirmed': confirmed,
+    }
+
+
+def _latest_state(block, signal_names: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """종목 하나의 최신 상태 행 (데이터가 없으면 None)"""
+    if block is None or len(block) == 0:
+        return None
+
+    close = block.columns['close']
+    fcv = float(block.columns['fcv'][-1])
+    previous = float(close[-2]) if len(block) > 1 else None
+    return {
+        'symbol': block.symbol,
+        'date': str(block.dates[-1]),
+        'close': float(close[-1]),
+        'change_pct': (float(close[-1]) / previous - 1) * 100 if previous else None,
+        'fcv': fcv,
+        'regime': fcv_regime(fcv),
+        'signals': {name: _latest_signal(block, name) for name in signal_names},
+    }
+
+
+class ScreenerTable:
+    """데이터 버전 하나의 종목별 최신 상태 표 (읽기 전용, 여러 세션이 공유)"""
+
+    def __init__(self, rows: List[Dict[str, Any]], data_version: Optional[str]):
+        self.rows = tuple(rows)
+        self.data_version = data_version
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def filter(
+        self,
+        signal_names: Optional[Iterable[str]] = None,
+        within_bars: int = 1,
+        regimes: Optional[Iterable[str]] = None,
+        confirmed_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 행
+
+        Args:
+            signal_names: 확인할 신호 (None이면 모든 신호)
+            within_bars: 마지막 봉 포함 최근 몇 봉 안의 신호만 (1이면 마지막 봉에 나온 신호)
+            regimes: 남길 FCV 국면 (None이면 전체)
+            confirmed_only: 반전 신호는 같은 그룹 매수 신호로 확인된 것만
+
+        Returns:
+            행 목록 (가장 최근 신호가 있는 종목부터)
+        """
+        regimes = set(regimes) if regimes is not None else None
+        matches = []
+        for row in self.rows:
+            if regimes is not None and row['regime'] not in regimes:
+                continue
+            names = row['signals'] if signal_names is None else signal_names
+            fresh = [
+                row['signals'][name]['bars_since'] for name in names
+                if name in row['signals']
+                and row['signals'][name]['bars_since'] is not None
+                and row['signals'][name]['bars_since'] < within_bars
+                and (not confirmed_only or name not in REVERSAL_SIGNALS or row['signals'][name]['confirmed'])
+            ]
+            if fresh:
+                matches.append((min(fresh), row))
+        matches.sort(key=lambda match: (match[0], match[1]['symbol']))
+        return [row for _, row in matches]
+
+
+def _recent_block(store, symbol: str):
+    """
+    종목의 최근 SCREENER_WINDOW_DAYS일 구간
+
+    조회 기간만 읽을 수 있는 저장소(sqlite)는 범위 검색으로, 지연 로드 저장소(shards)는
+    LRU에 넣지 않는 peek_block으로 읽어 전체 기간 조회나 캐시 밀어내기가 생기지 않게 합니다.
+    """
+    from utils.json_client import resolve_date_range
+
+    summary = store.describe_symbol(symbol)
+    if summary is None:
+        return None
+    start_date = np.datetime64(summary['end'], 'D') - np.timedelta64(SCREENER_WINDOW_DAYS, 'D')
+
+    get_range = getattr(store, 'get_range', None)
+    if get_range is not None:
+        return get_range(symbol, 'max', start_date)
+
+    block = getattr(store, 'peek_block', store.get_block)(symbol)
+    if block is None:
+        return None
+    start, stop = resolve_date_range(block.dates, 'max', start_date)
+    return block.slice(start, stop)
+
+
+def build_screener_table(store) -> ScreenerTable:
+    """공유 저장소의 모든 종목에 대해 최신 상태 표 생성 (종목 수에 비례, 종목마다 최근 구간만 읽음)"""
+    from utils.json_client import SIGNAL_FIELDS
+
+    rows = []
+    for symbol in store.symbols:
+        try:
+            row = _latest_state(_recent_block(store, symbol), SIGNAL_FIELDS)
+        except Exception as e:
+            logger.error(f"스크리너 상태 계산 실패: {symbol}, {e}")
+            continue
+        if row is not None:
+            rows.append(row)
+    logger.info(f"스크리너 표 생성 완료: {len(rows)}개 종목, 버전 {store.version}")
+    return ScreenerTable(rows, store.version)
+
+
+_table_lock = threading.Lock()
+_table_cache: Dict[str, ScreenerTable] = {}
+
+
+def load_screener_table(json_file_path: str = "signals_data.json") -> ScreenerTable:
+    """현재 데이터 버전의 스크리너 표 조회 (데이터 버전당 한 번만 계산)"""
+    from utils.json_client import InvestSmartJSONClient
+
+    store = InvestSmartJSONClient(json_file_path).store
+    path = os.path.abspath(json_file_path)
+
+    table = _table_cache.get(path)
+    if table is not None and table.data_version == store.version:
+        return table
+
+    with _table_lock:
+        table = _table_cache.get(path)
+        if table is None or table.data_version != store.version:
+            table = build_screener_table(store)
+            _table_cache[path] = table
+        return table
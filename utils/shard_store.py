@@ -0,0 +1,325 @@
+"""
+종목별 샤드 저장소
+신호 데이터를 종목마다 별도 바이너리 파일로 나누어 저장하고, 종목을 처음 조회할 때만 로드하는 모듈
+
+디렉토리 구조:
+    signals_data_shards/
+        manifest.json           # 데이터 버전, 종목별 파일/행 수/기간
+        v_<데이터 버전>/
+            0000_KS11.bin       # binary_store 포맷 (종목 하나)
+            ...
+
+로드된 종목은 크기 제한 LRU에 보관되어, 종목 수가 늘어나도 프로세스 메모리는
+INVESTSMART_MAX_RESIDENT_BYTES 이하로 유지됩니다.
+
+사용법:
+    python -m utils.shard_store [signals_data.json] [-o signals_data_shards]
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.lru_cache import BoundedLRUCache
+
+logger = logging.getLogger(__name__)
+
+SHARD_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# 메모리에 올려 둘 종목 블록의 최대 총 크기 (bytes)
+MAX_RESIDENT_BYTES = int(os.environ.get("INVESTSMART_MAX_RESIDENT_BYTES", str(64 * 1024 * 1024)))
+
+
+def default_shard_dir(json_file_path: str) -> str:
+    """JSON 경로에 대응하는 샤드 디렉토리"""
+    return os.path.splitext(json_file_path)[0] + "_shards"
+
+
+def manifest_path(shard_dir: str) -> str:
+    """샤드 매니페스트 경로"""
+    return os.path.join(shard_dir, MANIFEST_NAME)
+
+
+def _shard_file_name(index: int, symbol: str) -> str:
+    """종목 샤드 파일 이름 (파일 이름에 쓸 수 없는 문자는 '_'로 치환)"""
+    return f"{index:04d}_{re.sub(r'[^0-9A-Za-z_-]', '_', symbol)}.bin"
+
+
+def read_manifest(shard_dir: str) -> Optional[Dict[str, Any]]:
+    """샤드 매니페스트 읽기 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(manifest_path(shard_dir), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"샤드 매니페스트 로드 실패: {e}")
+        return None
+
+    if manifest.get('format_version') != SHARD_FORMAT_VERSION:
+        logger.error(f"지원하지 않는 샤드 포맷 버전: {manifest.get('format_version')}")
+        return None
+    return manifest
+
+
+class LazyShardStore:
+    """
+    종목을 처음 조회할 때 샤드 파일에서 로드하는 공유 저장소
+
+    SignalStore와 같은 인터페이스(get_block, symbols, version 등)를 제공합니다.
+    메타데이터는 매니페스트만으로 계산하고, 종목 블록은 바이트 크기 기준 LRU에 보관합니다.
+    업데이트 로그(NDJSON) 레코드는 종목별 작은 블록으로 메모리에 두었다가 샤드를 로드할 때 합칩니다.
+    """
+
+    backend = 'shards'
+
+    def __init__(
+        self,
+        path: str,
+        signature: Tuple[Optional[float], ...],
+        records: Optional[List[Dict]] = None,
+        log_offset: int = 0,
+        shard_dir: Optional[str] = None,
+        max_resident_bytes: Optional[int] = None
+    ):
+        from utils.json_client import _build_blocks
+
+        self.path = path
+        self.signature = signature
+        self.shard_dir = shard_dir or default_shard_dir(path)
+        self.source_path = self.shard_dir
+
+        self._manifest = read_manifest(self.shard_dir) or {'symbols': {}}
+        if not self._manifest['symbols']:
+            logger.error(
+                f"샤드 매니페스트가 없거나 비어 있습니다: {self.shard_dir} "
+                f"(python -m utils.shard_store로 생성)"
+            )
+        self.base_version = self._manifest.get('data_version', 'empty')
+
+        # 종목 블록 LRU - 로그만 늘어난 새 저장소와 공유 (키: 종목, 해당 종목 로그 반영 위치)
+        self._resident = BoundedLRUCache(
+            max_bytes=max_resident_bytes if max_resident_bytes is not None else MAX_RESIDENT_BYTES,
+            sizeof=lambda block: block.nbytes
+        )
+        self._load_lock = threading.Lock()
+
+        # 업데이트 로그에서 읽은 종목별 추가 행
+        self._deltas = _build_blocks(records or [])
+        self._delta_offsets = {symbol: log_offset for symbol in self._deltas}
+        self.log_offset = log_offset
+        self._refresh_metadata()
+
+        logger.info(
+            f"샤드 매니페스트 로드 완료: {self.shard_dir} ({len(self.symbols)}개 종목, "
+            f"로그 {len(records or [])}건, 버전 {self.version})"
+        )
+
+    def _refresh_metadata(self) -> None:
+        """매니페스트와 로그 추가 행으로 메타데이터 계산 (샤드 파일은 읽지 않음)"""
+        entries = self._manifest['symbols']
+        self.version = f"{self.base_version}-{self.log_offset}" if self.log_offset else self.base_version
+        self.symbols: Tuple[str, ...] = tuple(sorted(set(entries) | set(self._deltas)))
+
+        total = sum(entry['rows'] for entry in entries.values())
+        total += sum(self._new_delta_rows(symbol) for symbol in self._deltas)
+        self.total_records = total
+
+        updated = [entry.get('last_updated') or '' for entry in entries.values()]
+        updated += [delta.last_updated or '' for delta in self._deltas.values()]
+        self.last_updated = max(updated, default=None)
+
+    def _new_delta_rows(self, symbol: str) -> int:
+        """로그 행 중 기본 데이터의 마지막 날짜 이후 행 수 (기존 날짜 수정은 행 수 변화 없음)"""
+        delta = self._deltas.get(symbol)
+        if delta is None:
+            return 0
+        end = self._manifest['symbols'].get(symbol, {}).get('end')
+        if end is None:
+            return len(delta)
+        return int(np.count_nonzero(delta.dates > np.datetime64(end, 'D')))
+
+    def describe_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 요약 (행 수, 기간, 갱신 시각) - 샤드를 읽지 않고 매니페스트로 계산"""
+        entry = self._manifest['symbols'].get(symbol)
+        delta = self._deltas.get(symbol)
+        if delta is not None and len(delta):
+            delta_start, delta_end = str(delta.dates[0]), str(delta.dates[-1])
+            if entry is None or not entry['rows']:
+                return {'rows': len(delta), 'start': delta_start, 'end': delta_end, 'last_updated': delta.last_updated}
+            return {
+                'rows': entry['rows'] + self._new_delta_rows(symbol),
+                'start': min(entry['start'], delta_start),
+                'end': max(entry['end'], delta_end),
+                'last_updated': delta.last_updated or entry.get('last_updated'),
+            }
+        if entry is None or not entry['rows']:
+            return None
+        return {key: entry.get(key) for key in ('rows', 'start', 'end', 'last_updated')}
+
+    def _load_shard(self, symbol: str, entry: Dict[str, Any], use_mmap: bool = False):
+        """샤드 파일 하나를 메모리로 읽기 (use_mmap이면 메모리 맵으로 열기, 실패 시 None)"""
+        from utils.binary_store import load_binary_blocks
+
+        shard_path = os.path.join(self.shard_dir, self._manifest['directory'], entry['file'])
+        try:
+            return load_binary_blocks(shard_path, use_mmap=use_mmap).get(symbol)
+        except Exception as e:
+            logger.error(f"샤드 로드 실패: {symbol}, {e}")
+            return None
+
+    def get_block(self, symbol: str):
+        """특정 종목의 열 단위 블록 조회 (처음 조회 시 샤드 로드)"""
+        from utils.json_client import _merge_block
+
+        key = (symbol, self._delta_offsets.get(symbol, 0))
+        block = self._resident.get(key)
+        if block is not None:
+            return block
+
+        entry = self._manifest['symbols'].get(symbol)
+        delta = self._deltas.get(symbol)
+        if entry is None:
+            return delta
+
+        # 같은 종목을 여러 세션이 동시에 요청해도 한 번만 읽음
+        with self._load_lock:
+            if key in self._resident:
+                return self._resident.get(key)
+            block = self._load_shard(symbol, entry)
+            if block is None:
+                return delta
+            if delta is not None:
+                block = _merge_block(block, delta)
+            self._resident.put(key, block)
+            return block
+
+    def peek_block(self, symbol: str):
+        """
+        LRU에 넣지 않고 종목 블록 조회 (스크리너처럼 전체 종목을 한 번씩 훑을 때 사용)
+
+        이미 올라와 있으면 그 블록을 (LRU 순서는 그대로), 아니면 샤드를 메모리 맵으로 열어 돌려주므로
+        호출한 쪽이 읽는 구간의 페이지만 읽히고, 자주 보는 종목의 블록이 밀려나지 않습니다.
+        """
+        from utils.json_client import _merge_block
+
+        block = self._resident.peek((symbol, self._delta_offsets.get(symbol, 0)))
+        if block is not None:
+            return block
+
+        entry = self._manifest['symbols'].get(symbol)
+        delta = self._deltas.get(symbol)
+        if entry is None:
+            return delta
+        block = self._load_shard(symbol, entry, use_mmap=True)
+        if block is None:
+            return delta
+        return _merge_block(block, delta) if delta is not None else block
+
+    def with_log_records(self, records: List[Dict], log_offset: int) -> "LazyShardStore":
+        """업데이트 로그 레코드를 반영한 새 저장소 (매니페스트와 로드된 샤드는 공유)"""
+        from utils.json_client import _merge_records
+
+        store = copy.copy(self)
+        store._deltas = _merge_records(self._deltas, records)
+        changed = {record.get('symbol') for record in records if record.get('symbol')}
+        store._delta_offsets = {**self._delta_offsets, **{symbol: log_offset for symbol in changed}}
+        store.log_offset = log_offset
+        store._refresh_metadata()
+
+        # 로그가 반영되기 전 블록은 더 이상 조회되지 않으므로 바로 제거
+        self._resident.discard(lambda key: key[0] in changed)
+        return store
+
+    def resident_stats(self) -> Dict[str, int]:
+        """메모리에 올라온 종목 블록 통계 (항목 수, 크기, 적중/실패/제거 횟수)"""
+        return self._resident.stats()
+
+    @property
+    def nbytes(self) -> int:
+        """현재 메모리에 올라온 블록이 차지하는 바이트 수"""
+        return self._resident.total_bytes + sum(delta.nbytes for delta in self._deltas.values())
+
+
+def build_shards(json_file_path: str = "signals_data.json", shard_dir: Optional[str] = None) -> str:
+    """
+    JSON 신호 데이터를 종목별 샤드로 변환
+
+    샤드 파일을 버전별 디렉토리에 모두 쓴 뒤 매니페스트를 교체하므로, 서비스 중인
+    프로세스는 항상 완성된 샤드 묶음만 읽습니다. 아직 이전 매니페스트를 쓰는 프로세스를 위해
+    바로 이전 버전 디렉토리 하나는 남겨 둡니다.
+
+    Returns:
+        샤드 디렉토리 경로
+    """
+    from utils.binary_store import write_binary_store
+    from utils.json_client import DATA_VERSION_LENGTH, _read_json_blocks
+
+    shard_dir = shard_dir or default_shard_dir(json_file_path)
+    blocks, digest = _read_json_blocks(json_file_path)
+    if digest is None:
+        raise FileNotFoundError(json_file_path)
+    data_version = digest[:DATA_VERSION_LENGTH]
+
+    directory = f"v_{data_version}"
+    output_dir = os.path.join(shard_dir, directory)
+    os.makedirs(output_dir, exist_ok=True)
+
+    symbols = {}
+    total_bytes = 0
+    for index, symbol in enumerate(sorted(blocks)):
+        block = blocks[symbol]
+        file_name = _shard_file_name(index, symbol)
+        size = write_binary_store({symbol: block}, os.path.join(output_dir, file_name))
+        total_bytes += size
+        symbols[symbol] = {
+            'file': file_name,
+            'rows': len(block),
+            'start': str(block.dates[0]) if len(block) else None,
+            'end': str(block.dates[-1]) if len(block) else None,
+            'last_updated': block.last_updated,
+            'nbytes': block.nbytes,
+        }
+
+    previous = read_manifest(shard_dir)
+    path = manifest_path(shard_dir)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'format_version': SHARD_FORMAT_VERSION,
+            'data_version': data_version,
+            'directory': directory,
+            'symbols': symbols,
+        }, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    # 현재/직전 버전을 제외한 이전 샤드 정리
+    keep = {directory, (previous or {}).get('directory')}
+    for entry in os.listdir(shard_dir):
+        if entry.startswith("v_") and entry not in keep:
+            shutil.rmtree(os.path.join(shard_dir, entry), ignore_errors=True)
+
+    logger.info(f"샤드 변환 완료: {output_dir} ({len(symbols)}개 종목, {total_bytes:,} bytes)")
+    return shard_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="signals_data.json을 종목별 샤드로 변환")
+    parser.add_argument('json_file', nargs='?', default="signals_data.json", help="원본 JSON 파일")
+    parser.add_argument('-o', '--output', default=None, help="샤드 디렉토리 (기본: JSON 이름 + _shards)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    build_shards(args.json_file, args.output)
+
+
+if __name__ == "__main__":
+    main()
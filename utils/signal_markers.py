@@ -0,0 +1,183 @@
+"""
+시그널 마커 계산 엔진
+차트에 표시할 매수 마커와 "BUY!!" 반전 확인 위치를 NumPy로 계산 (Streamlit 의존성 없음)
+
+신호는 데이터 계층이 미리 만든 희소 이벤트(SignalEvents)를 사용하며, 없으면 일별 배열에서 만듭니다.
+"""
+from typing import Dict, Mapping, Sequence, Optional, Tuple
+
+import numpy as np
+
+# 주봉 기준 신호 - 해당 주의 첫 번째 신호만 표시
+WEEKLY_SIGNALS = frozenset({'momentum_color_signal'})
+
+# 반전 신호 -> (같은 그룹의 매수 신호, 확인할 과거 봉 수)
+REVERSAL_SIGNALS: Dict[str, Tuple[str, int]] = {
+    'macd_signal': ('short_signal_v2', 20),             # 단기 그룹
+    'momentum_color_signal': ('short_signal_v1', 50),   # 중기 그룹
+    'combined_signal_v1': ('long_signal', 20),          # 장기 그룹
+}
+
+# 마커 y 위치 (저가 대비 배율)
+BUY_MARKER_OFFSET = 0.97
+WEEKLY_BUY_MARKER_OFFSET = 0.99
+BUY_TEXT_OFFSET = 0.95
+
+
+def week_ids(dates) -> np.ndarray:
+    """
+    날짜별 주 번호 (월요일 시작 주, 1969-12-29 주 = 0 기준)
+
+    같은 월요일에 시작하는 날짜는 같은 번호를 가집니다.
+    """
+    days = np.asarray(dates).astype('datetime64[D]').astype(np.int64)
+    # 1970-01-01은 목요일이므로 3일을 더해 월요일 경계로 맞춤
+    return (days + 3) // 7
+
+
+class SignalEvents:
+    """
+    신호 하나의 희소 표현 - 신호가 발생한 봉 위치(오름차순)와 방향(1: 매수, -1: 매도)
+
+    대부분 0인 일별 신호 배열 대신 발생 위치만 가지므로, 마커 위치 추출, 과거 n봉 안의 신호 확인,
+    기간 자르기가 모두 몇 개 안 되는 이벤트에 대한 이진 탐색으로 끝납니다.
+    """
+
+    __slots__ = ('index', 'direction')
+
+    def __init__(self, index: np.ndarray, direction: np.ndarray):
+        # 여러 세션이 공유하므로 읽기 전용
+        index.flags.writeable = False
+        direction.flags.writeable = False
+        self.index = index
+        self.direction = direction
+
+    @classmethod
+    def from_values(cls, values: Sequence[int]) -> "SignalEvents":
+        """일별 신호 배열에서 생성 (0이 아닌 위치만 남김)"""
+        values = np.asarray(values)
+        index = np.flatnonzero(values)
+        return cls(index, values[index].astype(np.int8))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def slice(self, start: int, stop: int) -> "SignalEvents":
+        """행 구간 [start, stop)의 이벤트 (위치는 start 기준으로 다시 매김)"""
+        lo, hi = np.searchsorted(self.index, (start, stop))
+        return SignalEvents(self.index[lo:hi] - start, self.direction[lo:hi])
+
+    def positions(self, length: Optional[int] = None, direction: int = 1) -> np.ndarray:
+        """방향이 direction인 이벤트 위치 (length 이전까지만)"""
+        stop = len(self.index) if length is None else int(np.searchsorted(self.index, length))
+        index = self.index[:stop]
+        return index[self.direction[:stop] == direction]
+
+    def recent_mask(self, positions: np.ndarray, lookback: int, direction: int = 1) -> np.ndarray:
+        """
+        positions의 각 위치 i 직전 lookback개 봉 [i - lookback, i) 안에 direction 신호가 있었는지 여부
+
+        구간마다 이벤트 위치에서 이진 탐색 두 번이므로 O(len(positions) * log(이벤트 수))입니다.
+        """
+        events = self.positions(direction=direction)
+        positions = np.asarray(positions)
+        window_start = np.maximum(0, positions - lookback)
+        return np.searchsorted(events, positions) > np.searchsorted(events, window_start)
+
+
+def build_signal_events(signals: Mapping[str, Sequence[int]]) -> Dict[str, SignalEvents]:
+    """시그널 이름 -> SignalEvents"""
+    return {name: SignalEvents.from_values(values) for name, values in signals.items()}
+
+
+def first_per_week(indices: np.ndarray, weeks: np.ndarray) -> np.ndarray:
+    """각 주에서 첫 번째 위치만 남기기 (indices는 오름차순)"""
+    if len(indices) == 0:
+        return indices
+    bucket = weeks[indices]
+    keep = np.empty(len(indices), dtype=bool)
+    keep[0] = True
+    keep[1:] = bucket[1:] != bucket[:-1]
+    return indices[keep]
+
+
+def _events_for(
+    signal_name: str,
+    signals: Mapping[str, Sequence[int]],
+    events: Optional[Mapping[str, SignalEvents]]
+) -> SignalEvents:
+    """미리 계산된 이벤트가 있으면 사용하고, 없으면 일별 배열에서 생성"""
+    if events is not None and signal_name in events:
+        return events[signal_name]
+    return SignalEvents.from_values(signals[signal_name])
+
+
+def confirmed_reversal_indices(
+    signal_name: str,
+    signals: Mapping[str, Sequence[int]],
+    length: int,
+    weeks: Optional[np.ndarray] = None,
+    events: Optional[Mapping[str, SignalEvents]] = None
+) -> np.ndarray:
+    """
+    "BUY!!"을 표시할 반전 신호 위치
+
+    반전 신호가 발생했고, 직전 lookback 봉 안에 같은 그룹의 매수 신호가 있었던 위치입니다.
+    주봉 기준 신호는 해당 주의 첫 번째 위치만 남깁니다.
+    """
+    if signal_name not in REVERSAL_SIGNALS:
+        return np.empty(0, dtype=np.intp)
+
+    group_signal, lookback = REVERSAL_SIGNALS[signal_name]
+    if group_signal not in signals and (events is None or group_signal not in events):
+        return np.empty(0, dtype=np.intp)
+    indices = _events_for(signal_name, signals, events).positions(length)
+    if len(indices) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    indices = indices[_events_for(group_signal, signals, events).recent_mask(indices, lookback)]
+
+    if signal_name in WEEKLY_SIGNALS and weeks is not None:
+        indices = first_per_week(indices, weeks)
+    return indices
+
+
+def compute_signal_markers(
+    signal_name: str,
+    signals: Mapping[str, Sequence[int]],
+    low_prices: Sequence[float],
+    length: int,
+    weeks: Optional[np.ndarray] = None,
+    events: Optional[Mapping[str, SignalEvents]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    시그널 하나의 마커 위치와 y 값 계산
+
+    Args:
+        signal_name: 시그널 이름
+        signals: 시그널 이름 -> 값 배열 (1: 매수, -1: 매도, 0: 없음)
+        low_prices: 저가 배열
+        length: 차트에 표시되는 봉 수
+        weeks: week_ids() 결과 (주봉 기준 신호에 필요)
+        events: 시그널 이름 -> SignalEvents (데이터 계층에서 받은 값, 있으면 signals 대신 사용)
+
+    Returns:
+        {'buy_idx', 'buy_y', 'buy_text_idx', 'buy_text_y'} - 모두 NumPy 배열
+    """
+    low = np.asarray(low_prices[:length], dtype=np.float64)
+
+    buy_idx = _events_for(signal_name, signals, events).positions(length)
+    if signal_name in WEEKLY_SIGNALS and weeks is not None:
+        buy_idx = first_per_week(buy_idx, weeks)
+        buy_offset = WEEKLY_BUY_MARKER_OFFSET
+    else:
+        buy_offset = BUY_MARKER_OFFSET
+
+    buy_text_idx = confirmed_reversal_indices(signal_name, signals, length, weeks, events)
+
+    return {
+        'buy_idx': buy_idx,
+        'buy_y': low[buy_idx] * buy_offset,
+        'buy_text_idx': buy_text_idx,
+        'buy_text_y': low[buy_text_idx] * BUY_TEXT_OFFSET,
+    }
@@ -0,0 +1,97 @@
+"""
+신호 데이터 결과 캐시
+모든 세션이 공유하는 (종목, 기간) 조회 결과 캐시
+
+결과는 공유 저장소 배열의 읽기 전용 뷰이므로 적중 시 복사나 역직렬화가 없습니다.
+키에 데이터 버전이 들어가므로 데이터가 바뀌는 순간 새 결과를 만들고, 이전 버전 항목은 교체 콜백에서 바로 비웁니다.
+"""
+import os
+from typing import Any, Dict, Iterator, Mapping
+
+import numpy as np
+
+from utils.json_client import InvestSmartJSONClient, register_reload_listener
+from utils.lru_cache import BoundedLRUCache
+from utils.perf import span
+from utils.signal_markers import SignalEvents
+
+# 결과 캐시 최대 크기 (bytes, 결과가 참조하는 배열 크기 기준)
+RESULT_CACHE_BYTES = int(os.environ.get("INVESTSMART_RESULT_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+
+def _result_arrays(value: Any) -> Iterator[np.ndarray]:
+    """결과가 참조하는 모든 배열 (중첩 사전과 신호 이벤트의 위치/방향 배열 포함)"""
+    if isinstance(value, np.ndarray):
+        yield value
+    elif isinstance(value, SignalEvents):
+        yield value.index
+        yield value.direction
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _result_arrays(item)
+
+
+def _result_nbytes(result: Mapping[str, Any]) -> int:
+    """
+    결과가 참조하는 배열의 바이트 수
+    
+    같은 메모리 구간은 한 번만 셉니다 ('dates'와 'date_values'처럼 같은 배열을 두 키로 넣은 경우).
+    한 버퍼(예: 메모리 맵)를 나눠 쓰는 서로 다른 열은 시작 주소가 달라 각각 셉니다.
+    """
+    seen = set()
+    total = 0
+    for array in _result_arrays(result):
+        region = (array.__array_interface__['data'][0], array.nbytes)
+        if region not in seen:
+            seen.add(region)
+            total += array.nbytes
+    return total
+
+
+_result_cache = BoundedLRUCache(max_bytes=RESULT_CACHE_BYTES, sizeof=_result_nbytes)
+
+
+def get_cached_signals_view(
+    symbol: str,
+    period: str,
+    json_file_path: str = "signals_data.json"
+) -> Mapping[str, Any]:
+    """
+    (종목, 기간)의 신호 데이터를 공유 캐시에서 조회
+
+    Returns:
+        InvestSmartJSONClient.get_signals_view 결과 (읽기 전용, 수정 금지)
+    """
+    with span("signals.cache", symbol=symbol, period=period) as info:
+        client = InvestSmartJSONClient(json_file_path)
+        store = client.store
+        prefix = (store.path, store.backend, symbol, period)
+
+        result = _result_cache.get(prefix + (store.version,))
+        info['hit'] = result is not None
+        if result is None:
+            result = client.get_signals_view(symbol, period)
+            if not result.get('error'):
+                # 조회 도중 데이터가 교체됐을 수 있으므로 실제 결과의 버전으로 저장
+                _result_cache.put(prefix + (result['data_version'],), result)
+        info['rows'] = len(result.get('dates', ()))
+        return result
+
+
+def signals_cache_stats() -> Dict[str, int]:
+    """결과 캐시 통계 (항목 수, 크기, 적중/실패/제거 횟수)"""
+    return _result_cache.stats()
+
+
+def _on_data_reload(old_store, new_store):
+    """
+    데이터 교체 시 그 저장소(파일, 저장소 방식)의 이전 버전 결과만 제거 (새 버전 키로는 더 이상 조회되지 않음)
+
+    같은 파일을 다른 방식(json/binary 등)으로 여는 저장소는 데이터 버전이 같을 수 있으므로 버전만으로 지우지 않습니다.
+    """
+    _result_cache.discard(
+        lambda key: key[0] == old_store.path and key[1] == old_store.backend and key[-1] == old_store.version
+    )
+
+
+register_reload_listener(_on_data_reload)
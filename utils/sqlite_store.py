@@ -0,0 +1,304 @@
+"""
+SQLite 신호 데이터 저장소
+신호 데이터를 로컬 SQLite 파일에 (종목, 날짜) 기본 키로 저장하고, 조회 기간만 인덱스 범위 검색으로 읽는 모듈
+
+테이블:
+    meta     (key, value)                                   # 포맷/데이터 버전
+    symbols  (symbol, rows, first_date, last_date, last_updated) # 종목별 요약 (시작 시 한 번 읽음)
+    signals  (symbol, day, open, ..., fcv)                  # PRIMARY KEY (symbol, day), WITHOUT ROWID
+
+WAL 모드로 열어 가져오기(쓰기) 중에도 앱의 조회가 막히지 않으며, 가져오기는 트랜잭션 하나로
+이전 데이터를 교체하므로 조회는 항상 완성된 데이터만 봅니다.
+프로세스 메모리에는 종목 요약과 조회 결과만 올라오므로 전체 데이터 크기와 무관합니다.
+
+사용법:
+    python -m utils.sqlite_store [signals_data.json] [-o signals_data.sqlite3]
+"""
+import argparse
+import copy
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SQLITE_FORMAT_VERSION = 1
+
+# 날짜는 1970-01-01 기준 일수(INTEGER)로 저장 (datetime64[D]와 같은 값)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS symbols (
+    symbol TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    first_date TEXT,
+    last_date TEXT,
+    last_updated TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS signals (
+    symbol TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    {columns},
+    PRIMARY KEY (symbol, day)
+) WITHOUT ROWID;
+"""
+
+
+def _column_dtypes() -> Dict[str, Any]:
+    """저장 열 -> NumPy 자료형 (json_client.COLUMN_DTYPES와 같은 순서)"""
+    from utils.json_client import COLUMN_DTYPES
+    return COLUMN_DTYPES
+
+
+def default_sqlite_path(json_file_path: str) -> str:
+    """JSON 경로에 대응하는 SQLite 파일 경로"""
+    return os.path.splitext(json_file_path)[0] + ".sqlite3"
+
+
+def _connect_readonly(db_path: str) -> sqlite3.Connection:
+    """읽기 전용 연결 (파일이 없으면 sqlite3.OperationalError)"""
+    conn = sqlite3.connect(f"file:{quote(os.path.abspath(db_path))}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+class SQLiteSignalStore:
+    """
+    SQLite 파일에서 조회 기간만 읽는 공유 저장소
+
+    SignalStore와 같은 인터페이스(get_range, get_block, symbols, version 등)를 제공합니다.
+    종목 요약은 symbols 테이블에서 한 번 읽고, 행 데이터는 조회할 때마다
+    (symbol, day) 기본 키 범위 검색으로 필요한 구간만 읽습니다 (블록을 메모리에 보관하지 않음).
+    업데이트 로그(NDJSON) 레코드는 종목별 작은 블록으로 메모리에 두었다가 조회 결과와 합칩니다.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(
+        self,
+        path: str,
+        signature: Tuple[Optional[float], ...],
+        records: Optional[List[Dict]] = None,
+        log_offset: int = 0,
+        db_path: Optional[str] = None
+    ):
+        from utils.json_client import _build_blocks
+
+        self.path = path
+        self.signature = signature
+        self.db_path = db_path or default_sqlite_path(path)
+        self.source_path = self.db_path
+
+        # 연결은 스레드마다 따로 열어 재사용 (WAL 모드에서 읽기끼리 서로 막지 않음)
+        self._local = threading.local()
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.base_version = 'empty'
+        try:
+            conn = self._connection()
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if meta.get('format_version') != str(SQLITE_FORMAT_VERSION):
+                raise ValueError(f"지원하지 않는 SQLite 포맷 버전: {meta.get('format_version')}")
+            self.base_version = meta.get('data_version') or 'unknown'
+            self._entries = {
+                row[0]: {'rows': row[1], 'start': row[2], 'end': row[3], 'last_updated': row[4]}
+                for row in conn.execute("SELECT symbol, rows, first_date, last_date, last_updated FROM symbols")
+            }
+        except Exception as e:
+            logger.error(f"SQLite 데이터베이스를 열 수 없습니다: {self.db_path} ({e}, python -m utils.sqlite_store로 생성)")
+
+        self._deltas = _build_blocks(records or [])
+        self.log_offset = log_offset
+        self._refresh_metadata()
+
+        logger.info(
+            f"SQLite 저장소 연결 완료: {self.db_path} ({len(self.symbols)}개 종목, "
+            f"로그 {len(records or [])}건, 버전 {self.version})"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 전용 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = _connect_readonly(self.db_path)
+        return conn
+
+    def _refresh_metadata(self) -> None:
+        """종목 요약과 로그 추가 행으로 메타데이터 계산 (행 데이터는 읽지 않음)"""
+        self.version = f"{self.base_version}-{self.log_offset}" if self.log_offset else self.base_version
+        self.symbols: Tuple[str, ...] = tuple(sorted(set(self._entries) | set(self._deltas)))
+        self.total_records = sum(self.describe_symbol(symbol)['rows'] for symbol in self.symbols)
+
+        updated = [entry.get('last_updated') or '' for entry in self._entries.values()]
+        updated += [delta.last_updated or '' for delta in self._deltas.values()]
+        self.last_updated = max(updated, default=None)
+
+    def describe_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 요약 (행 수, 기간, 갱신 시각) - 행 데이터를 읽지 않고 계산"""
+        entry = self._entries.get(symbol)
+        delta = self._deltas.get(symbol)
+        if delta is None or not len(delta):
+            if entry is None or not entry['rows']:
+                return None
+            return dict(entry)
+
+        delta_start, delta_end = str(delta.dates[0]), str(delta.dates[-1])
+        if entry is None or not entry['rows']:
+            return {'rows': len(delta), 'start': delta_start, 'end': delta_end, 'last_updated': delta.last_updated}
+        new_rows = int(np.count_nonzero(delta.dates > np.datetime64(entry['end'], 'D')))
+        return {
+            'rows': entry['rows'] + new_rows,
+            'start': min(entry['start'], delta_start),
+            'end': max(entry['end'], delta_end),
+            'last_updated': delta.last_updated or entry.get('last_updated'),
+        }
+
+    def _query_block(self, symbol: str, first_day: Optional[date], last_day: Optional[date]):
+        """[first_day, last_day] 구간의 행을 기본 키 범위 검색으로 읽어 블록 생성"""
+        from utils.json_client import SymbolBlock
+
+        dtypes = _column_dtypes()
+        low = -(1 << 62) if first_day is None else int(np.datetime64(first_day, 'D').astype(np.int64))
+        high = 1 << 62 if last_day is None else int(np.datetime64(last_day, 'D').astype(np.int64))
+        rows = self._connection().execute(
+            f"SELECT day, {', '.join(dtypes)} FROM signals WHERE symbol = ? AND day BETWEEN ? AND ? ORDER BY day",
+            (symbol, low, high)
+        )
+        table = np.fromiter(rows, dtype=[('day', np.int64)] + [(name, dtype) for name, dtype in dtypes.items()])
+        columns = {name: np.ascontiguousarray(table[name]) for name in dtypes}
+        return SymbolBlock(symbol, table['day'].astype('datetime64[D]'), columns, self._entries[symbol].get('last_updated'))
+
+    def get_range(
+        self,
+        symbol: str,
+        period: Optional[str] = "max",
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None
+    ):
+        """
+        조회 기간의 블록 (resolve_date_range와 같은 규칙, 필요한 행만 읽음)
+
+        기간의 시작일은 종목 요약의 마지막 날짜로 계산하므로 범위 검색 한 번으로 끝납니다.
+        """
+        from utils.json_client import PERIOD_MONTHS, _merge_block, _months_before, resolve_date_range
+
+        summary = self.describe_symbol(symbol)
+        if summary is None:
+            return None
+
+        if start_date is None and end_date is None and period and period != 'max':
+            if period not in PERIOD_MONTHS:
+                raise ValueError(f"지원하지 않는 조회 기간입니다: {period}")
+            start_date = _months_before(date.fromisoformat(summary['end']), PERIOD_MONTHS[period])
+        first_day = None if start_date is None else np.datetime64(start_date, 'D').astype(date)
+        last_day = None if end_date is None else np.datetime64(end_date, 'D').astype(date)
+
+        delta = self._deltas.get(symbol)
+        if symbol not in self._entries:
+            block = delta
+        else:
+            block = self._query_block(symbol, first_day, last_day)
+            if delta is not None:
+                block = _merge_block(block, delta)
+        start, stop = resolve_date_range(block.dates, 'max', first_day, last_day)
+        return block.slice(start, stop)
+
+    def get_block(self, symbol: str):
+        """특정 종목의 전체 기간 블록 (전체 행을 읽으므로 가능하면 get_range 사용)"""
+        return self.get_range(symbol)
+
+    def with_log_records(self, records: List[Dict], log_offset: int) -> "SQLiteSignalStore":
+        """업데이트 로그 레코드를 반영한 새 저장소 (종목 요약과 연결은 공유)"""
+        from utils.json_client import _merge_records
+
+        store = copy.copy(self)
+        store._deltas = _merge_records(self._deltas, records)
+        store.log_offset = log_offset
+        store._refresh_metadata()
+        return store
+
+    @property
+    def nbytes(self) -> int:
+        """메모리에 올라온 로그 추가 행의 바이트 수 (행 데이터는 파일에 있음)"""
+        return sum(delta.nbytes for delta in self._deltas.values())
+
+
+def build_sqlite(json_file_path: str = "signals_data.json", db_path: Optional[str] = None) -> str:
+    """
+    JSON 신호 데이터를 SQLite 파일로 가져오기
+
+    트랜잭션 하나에서 기존 행을 지우고 새로 넣으므로, WAL 모드에서 조회 중인 프로세스는
+    커밋 전까지 이전 데이터를, 커밋 후에는 새 데이터를 봅니다.
+
+    Returns:
+        SQLite 파일 경로
+    """
+    from utils.json_client import DATA_VERSION_LENGTH, _read_json_blocks
+
+    db_path = db_path or default_sqlite_path(json_file_path)
+    blocks, digest = _read_json_blocks(json_file_path)
+    if digest is None:
+        raise FileNotFoundError(json_file_path)
+    data_version = digest[:DATA_VERSION_LENGTH]
+    dtypes = _column_dtypes()
+
+    column_defs = ',\n    '.join(
+        f"{name} {'REAL' if np.dtype(dtype).kind == 'f' else 'INTEGER'} NOT NULL" for name, dtype in dtypes.items()
+    )
+    insert = f"INSERT INTO signals (symbol, day, {', '.join(dtypes)}) VALUES (?, ?{', ?' * len(dtypes)})"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA.format(columns=column_defs))
+        with conn:
+            conn.execute("DELETE FROM signals")
+            conn.execute("DELETE FROM symbols")
+            for symbol in sorted(blocks):
+                block = blocks[symbol]
+                days = block.dates.astype(np.int64).tolist()
+                values = [block.columns[name].tolist() for name in dtypes]
+                conn.executemany(insert, zip([symbol] * len(block), days, *values))
+                conn.execute(
+                    "INSERT INTO symbols (symbol, rows, first_date, last_date, last_updated) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        symbol,
+                        len(block),
+                        str(block.dates[0]) if len(block) else None,
+                        str(block.dates[-1]) if len(block) else None,
+                        block.last_updated,
+                    )
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [('format_version', str(SQLITE_FORMAT_VERSION)), ('data_version', data_version)]
+            )
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    finally:
+        conn.close()
+
+    total = sum(len(block) for block in blocks.values())
+    logger.info(f"SQLite 가져오기 완료: {db_path} ({len(blocks)}개 종목, {total}건, 버전 {data_version})")
+    return db_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="signals_data.json을 SQLite 파일로 가져오기")
+    parser.add_argument('json_file', nargs='?', default="signals_data.json", help="원본 JSON 파일")
+    parser.add_argument('-o', '--output', default=None, help="SQLite 파일 (기본: JSON 이름 + .sqlite3)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    build_sqlite(args.json_file, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+종목 카탈로그
+선택 화면에 표시할 종목 목록(표시 이름, 자산군)과 데이터 보유 현황(행 수, 기간)을 한 곳에서 관리
+
+카탈로그 파일(signals_data_catalog.json)은 데이터 갱신 시 함께 생성하며,
+앱은 프로세스당 한 번만 읽어 종목별 조회를 사전 한 번으로 처리합니다.
+파일이 없거나 현재 데이터 버전과 다르면 공유 저장소의 메타데이터로 다시 계산합니다.
+
+사용법:
+    python -m utils.symbol_catalog [signals_data.json] [-o signals_data_catalog.json]
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FORMAT_VERSION = 1
+
+# 선택 화면 종목 목록 (표시 순서대로: 심볼, 표시 이름, 자산군)
+SYMBOL_DEFINITIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("^KS11", "코스피 (KOSPI)", "지수"),
+    ("^IXIC", "나스닥 (NASDAQ)", "지수"),
+    ("^GSPC", "S&P 500", "지수"),
+    ("^DJI", "다우존스", "지수"),
+    ("^VIX", "VIX (변동성 지수)", "지수"),
+    ("AAPL", "애플 (Apple)", "주식"),
+    ("MSFT", "마이크로소프트 (Microsoft)", "주식"),
+    ("GOOGL", "구글 (Google)", "주식"),
+    ("AMZN", "아마존 (Amazon)", "주식"),
+    ("TSLA", "테슬라 (Tesla)", "주식"),
+    ("NVDA", "엔비디아 (NVIDIA)", "주식"),
+    ("META", "메타 (Meta)", "주식"),
+    ("NFLX", "넷플릭스 (Netflix)", "주식"),
+    ("AMD", "AMD", "주식"),
+    ("INTC", "인텔 (Intel)", "주식"),
+    ("CRM", "세일즈포스 (Salesforce)", "주식"),
+    ("ADBE", "어도비 (Adobe)", "주식"),
+    ("PYPL", "페이팔 (PayPal)", "주식"),
+    ("UBER", "우버 (Uber)", "주식"),
+    ("SPOT", "스포티파이 (Spotify)", "주식"),
+    ("TLT", "TLT (미국 20년 국채)", "채권"),
+    ("IEF", "IEF (미국 7-10년 국채)", "채권"),
+    ("GLD", "GLD (금 ETF)", "원자재"),
+    ("SLV", "SLV (은 ETF)", "원자재"),
+    ("VTI", "VTI (미국 전체 주식 시장)", "ETF"),
+    ("QQQ", "QQQ (나스닥 100)", "ETF"),
+    ("SPY", "SPY (S&P 500)", "ETF"),
+    ("DIA", "DIA (다우존스)", "ETF"),
+    ("IWM", "IWM (러셀 2000)", "ETF"),
+    ("EFA", "EFA (선진국 주식)", "ETF"),
+    ("EEM", "EEM (신흥국 주식)", "ETF"),
+    ("VEA", "VEA (선진국 주식)", "ETF"),
+    ("VWO", "VWO (신흥국 주식)", "ETF"),
+    ("BND", "BND (미국 채권)", "채권"),
+    ("AGG", "AGG (미국 채권)", "채권"),
+    ("LQD", "LQD (회사채)", "채권"),
+    ("HYG", "HYG (고수익 채권)", "채권"),
+    ("EMB", "EMB (신흥국 채권)", "채권"),
+    ("TIP", "TIP (인플레이션 보호 채권)", "채권"),
+    ("SHY", "SHY (단기 채권)", "채권"),
+    ("USDKRW=X", "USD/KRW 환율", "환율"),
+    ("EURUSD=X", "EUR/USD 환율", "환율"),
+    ("GBPUSD=X", "GBP/USD 환율", "환율"),
+    ("USDJPY=X", "USD/JPY 환율", "환율"),
+    ("AUDUSD=X", "AUD/USD 환율", "환율"),
+    ("USDCAD=X", "USD/CAD 환율", "환율"),
+    ("USDCHF=X", "USD/CHF 환율", "환율"),
+    ("NZDUSD=X", "NZD/USD 환율", "환율"),
+)
+
+# 목록에 없는 종목의 자산군
+DEFAULT_ASSET_CLASS = "기타"
+
+
+def default_catalog_path(json_file_path: str) -> str:
+    """JSON 경로에 대응하는 카탈로그 파일 경로"""
+    return os.path.splitext(json_file_path)[0] + "_catalog.json"
+
+
+class SymbolCatalog:
+    """
+    종목 카탈로그 (읽기 전용)
+
+    entries는 표시 순서대로 정렬된 항목 목록이며, 각 항목은
+    symbol, display_name, asset_class, rows, start, end, available 키를 가집니다.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], data_version: Optional[str] = None):
+        self.entries = entries
+        self.data_version = data_version
+        self._by_symbol = {entry['symbol']: entry for entry in entries}
+
+        self.symbols: Tuple[str, ...] = tuple(entry['symbol'] for entry in entries)
+        self.available_symbols: Tuple[str, ...] = tuple(entry['symbol'] for entry in entries if entry['available'])
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 항목 조회"""
+        return self._by_symbol.get(symbol)
+
+    def display_name(self, symbol: str) -> str:
+        """종목 표시 이름 (카탈로그에 없으면 심볼 그대로)"""
+        entry = self._by_symbol.get(symbol)
+        return entry['display_name'] if entry else symbol
+
+    def is_available(self, symbol: str) -> bool:
+        """데이터 보유 여부"""
+        entry = self._by_symbol.get(symbol)
+        return bool(entry and entry['available'])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """파일 저장용 사전"""
+        return {
+            'format_version': CATALOG_FORMAT_VERSION,
+            'data_version': self.data_version,
+            'symbols': self.entries,
+        }
+
+
+def build_catalog(store) -> SymbolCatalog:
+    """
+    공유 저장소의 메타데이터로 카탈로그 생성
+
+    store.describe_symbol만 사용하므로 종목별 샤드 저장소에서도 데이터를 읽지 않습니다.
+    데이터는 있지만 목록에 없는 종목은 심볼을 표시 이름으로 하여 뒤에 추가합니다.
+    """
+    definitions = list(SYMBOL_DEFINITIONS)
+    known = {symbol for symbol, _, _ in definitions}
+    definitions += [(symbol, symbol, DEFAULT_ASSET_CLASS) for symbol in store.symbols if symbol not in known]
+
+    entries = []
+    for symbol, display_name, asset_class in definitions:
+        summary = store.describe_symbol(symbol) or {}
+        entries.append({
+            'symbol': symbol,
+            'display_name': display_name,
+            'asset_class': asset_class,
+            'rows': summary.get('rows', 0),
+            'start': summary.get('start'),
+            'end': summary.get('end'),
+            'available': bool(summary.get('rows')),
+        })
+    return SymbolCatalog(entries, store.version)
+
+
+def _read_catalog_file(catalog_path: str) -> Optional[SymbolCatalog]:
+    """카탈로그 파일 읽기 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(catalog_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"종목 카탈로그 로드 실패: {e}")
+        return None
+
+    if data.get('format_version') != CATALOG_FORMAT_VERSION:
+        logger.warning(f"지원하지 않는 카탈로그 포맷 버전: {data.get('format_version')}")
+        return None
+    return SymbolCatalog(data.get('symbols', []), data.get('data_version'))
+
+
+_catalog_lock = threading.Lock()
+_catalog_cache: Dict[str, SymbolCatalog] = {}
+
+
+def load_symbol_catalog(json_file_path: str = "signals_data.json") -> SymbolCatalog:
+    """
+    현재 데이터 버전의 종목 카탈로그 조회 (데이터 버전당 한 번만 읽음)
+
+    카탈로그 파일의 데이터 버전이 현재 저장소와 다르면 (예: 업데이트 로그 반영 후)
+    저장소 메타데이터로 다시 계산합니다.
+    """
+    from utils.json_client import InvestSmartJSONClient
+
+    store = InvestSmartJSONClient(json_file_path).store
+    path = os.path.abspath(json_file_path)
+
+    catalog = _catalog_cache.get(path)
+    if catalog is not None and catalog.data_version == store.version:
+        return catalog
+
+    with _catalog_lock:
+        catalog = _catalog_cache.get(path)
+        if catalog is None or catalog.data_version != store.version:
+            catalog = _read_catalog_file(default_catalog_path(json_file_path))
+            if catalog is None or catalog.data_version != store.version:
+                catalog = build_catalog(store)
+            _catalog_cache[path] = catalog
+        return catalog
+
+
+def write_catalog(json_file_path: str = "signals_data.json", catalog_path: Optional[str] = None) -> str:
+    """카탈로그 파일 생성 (데이터 갱신 시 실행)"""
+    from utils.json_client import InvestSmartJSONClient
+
+    catalog_path = catalog_path or default_catalog_path(json_file_path)
+    catalog = build_catalog(InvestSmartJSONClient(json_file_path).store)
+
+    tmp_path = catalog_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog.to_dict(), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, catalog_path)
+
+    logger.info(
+        f"종목 카탈로그 생성 완료: {catalog_path} "
+        f"({len(catalog.entries)}개 종목 중 {len(catalog.available_symbols)}개 데이터 보유)"
+    )
+    return catalog_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="종목 카탈로그(표시 이름, 데이터 보유 현황) 생성")
+    parser.add_argument('json_file', nargs='?', default="signals_data.json", help="신호 데이터 JSON 파일")
+    parser.add_argument('-o', '--output', default=None, help="출력 파일 (기본: JSON 이름 + _catalog.json)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    write_catalog(args.json_file, args.output)
+
+
+if __name__ == "__main__":
+    main()